@@ -0,0 +1,169 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.handlers.asgi import ASGIHandler, ASGIRequest
+from django.db import close_old_connections
+from django.urls import reverse
+from one_day_intern import settings
+from one_day_intern.exceptions import RestrictedAccessException
+from users.services import utils as user_utils
+from .services.assessment_event_attempt import get_subscribed_assessment_event
+from .services.release_broker import ReleaseBroker, release_broker
+import asyncio
+import io
+import json
+
+
+class ThreadedStreamingASGIHandler(ASGIHandler):
+    """
+    Django 4.1 iterates streaming responses on the event loop. File downloads read every
+    chunk from the storage backend with blocking calls, so the chunks are read in a worker
+    thread to keep the event loop free for the other connections.
+    """
+    async def send_response(self, response, send):
+        if not response.streaming:
+            await super().send_response(response, send)
+            return
+
+        await send({
+            'type': 'http.response.start',
+            'status': response.status_code,
+            'headers': self.get_response_headers(response)
+        })
+
+        parts = iter(response)
+        read_next_part = sync_to_async(next, thread_sensitive=False)
+        part = await read_next_part(parts, None)
+        while part is not None:
+            for chunk, _ in self.chunk_bytes(part):
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            part = await read_next_part(parts, None)
+
+        await send({'type': 'http.response.body'})
+        await sync_to_async(response.close, thread_sensitive=True)()
+
+    @staticmethod
+    def get_response_headers(response):
+        response_headers = []
+        for header, value in response.items():
+            if isinstance(header, str):
+                header = header.encode('ascii')
+            if isinstance(value, str):
+                value = value.encode('latin1')
+            response_headers.append((bytes(header), bytes(value)))
+        for cookie in response.cookies.values():
+            response_headers.append((b'Set-Cookie', cookie.output(header='').encode('ascii').strip()))
+        return response_headers
+
+
+class AssessmentFlowStreamApplication:
+    """
+    Serves assessment flow subscriptions as asynchronous event streams so that an idle
+    subscriber does not hold a worker thread. Every other request is passed to the wrapped
+    Django application.
+    """
+    def __init__(self, django_application, broker: ReleaseBroker = release_broker):
+        self.django_application = django_application
+        self.broker = broker
+        self.subscription_path = reverse('event-subscription')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and scope['path'] == self.subscription_path and scope['method'] == 'GET':
+            await self.serve_subscribe_to_assessment_flow(scope, receive, send)
+        else:
+            await self.django_application(scope, receive, send)
+
+    async def serve_subscribe_to_assessment_flow(self, scope, receive, send):
+        request = ASGIRequest(scope, io.BytesIO())
+        try:
+            event, releases = await sync_to_async(self.prepare_subscription_of_request)(request)
+            if releases is None and not self.broker.has_channel(event.event_id):
+                # The last subscriber of the event left while the request was being prepared
+                releases = await sync_to_async(self.load_releases_of_event)(event)
+        except RestrictedAccessException as exception:
+            await self.send_message_response(send, status=403, message=str(exception))
+            return
+        except ObjectDoesNotExist as exception:
+            await self.send_message_response(send, status=400, message=str(exception))
+            return
+        except Exception as exception:
+            await self.send_message_response(send, status=500, message=str(exception))
+            return
+
+        event_id = event.event_id
+        if releases is not None:
+            self.broker.open_channel(event_id, releases)
+
+        subscription = self.broker.subscribe(event_id, last_event_id=request.headers.get('Last-Event-ID'))
+        try:
+            await send({
+                'type': 'http.response.start',
+                'status': 200,
+                'headers': self.get_event_stream_headers()
+            })
+            await self.send_subscription_messages(subscription, receive, send)
+        finally:
+            self.broker.unsubscribe(subscription)
+
+    def prepare_subscription_of_request(self, request):
+        """
+        The release schedule of an event is only loaded when no assessee
+        of the event is subscribed to this process yet. The channel may still close
+        before the subscription is made, so the caller checks it again on the event loop.
+        """
+        close_old_connections()
+        try:
+            user = user_utils.get_user_from_request(request)
+            event = get_subscribed_assessment_event(request.GET, user=user)
+            releases = None if self.broker.has_channel(event.event_id) else event.get_tool_releases()
+            return event, releases
+        finally:
+            close_old_connections()
+
+    @staticmethod
+    def load_releases_of_event(event):
+        close_old_connections()
+        try:
+            return event.get_tool_releases()
+        finally:
+            close_old_connections()
+
+    @staticmethod
+    def get_event_stream_headers():
+        headers = [
+            (b'content-type', b'text/event-stream'),
+            (b'cache-control', b'no-cache'),
+        ]
+        if settings.CORS_ALLOW_ALL_ORIGINS:
+            headers.append((b'access-control-allow-origin', b'*'))
+        return headers
+
+    @staticmethod
+    async def wait_for_disconnect(receive):
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+
+    async def send_subscription_messages(self, subscription, receive, send):
+        disconnected = asyncio.ensure_future(self.wait_for_disconnect(receive))
+        try:
+            while True:
+                next_message = asyncio.ensure_future(subscription.next_message())
+                await asyncio.wait({next_message, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+
+                if disconnected.done():
+                    next_message.cancel()
+                    return
+
+                await send({'type': 'http.response.body', 'body': next_message.result(), 'more_body': True})
+        finally:
+            disconnected.cancel()
+
+    @staticmethod
+    async def send_message_response(send, status, message):
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/json')]
+        })
+        await send({'type': 'http.response.body', 'body': json.dumps({'message': message}).encode('utf-8')})
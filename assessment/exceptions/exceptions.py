@@ -32,3 +32,11 @@ class QuestionDoesNotExist(ObjectDoesNotExist):
 
 class QuestionAttemptDoesNotExist(ObjectDoesNotExist):
     pass
+
+
+class FileDoesNotExist(ObjectDoesNotExist):
+    pass
+
+
+class RangeNotSatisfiable(Exception):
+    pass
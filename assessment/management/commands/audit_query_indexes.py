@@ -0,0 +1,87 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from users.models import OdiUser, Company, Assessor, Assessee, CompanyOneTimeLinkCode
+from ...models import (
+    AssessmentEvent,
+    AssessmentEventParticipation,
+    TestFlow,
+    TestFlowTool,
+    ToolAttempt,
+    QuestionAttempt,
+    VideoConferenceRoom
+)
+import re
+import uuid
+
+SEQUENTIAL_SCAN_PATTERN = re.compile(r'Seq Scan on (\w+)|\bSCAN (?:TABLE )?(\w+)')
+SQLITE_INTERNAL_SCANS = {'CONSTANT'}
+
+
+def get_query_patterns() -> list:
+    """
+    Returns the lookups done by the service layer as (description, queryset) pairs.
+    The filter values are placeholders, only the query plans are inspected.
+    """
+    return [
+        ('user by email', OdiUser.objects.filter(email='audit@onedayintern.asia')),
+        ('company by email', Company.objects.filter(email='audit@onedayintern.asia')),
+        ('assessor by email', Assessor.objects.filter(email='audit@onedayintern.asia')),
+        ('assessee by email', Assessee.objects.filter(email='audit@onedayintern.asia')),
+        ('company by company id', Company.objects.filter(company_id=uuid.uuid4())),
+        ('one time link code by code', CompanyOneTimeLinkCode.objects.filter(code=uuid.uuid4())),
+        ('assessment event by event id', AssessmentEvent.objects.filter(event_id=uuid.uuid4())),
+        ('usable test flow by test flow id', TestFlow.objects.filter(test_flow_id=uuid.uuid4(), is_usable=True)),
+        ('tools of test flow', TestFlowTool.objects.filter(test_flow_id=0)),
+        (
+            'participation of assessee in event',
+            AssessmentEventParticipation.objects.filter(assessment_event_id=0, assessee_id=0)
+        ),
+        (
+            'tool attempt of test flow attempt by tool',
+            ToolAttempt.objects.non_polymorphic().filter(
+                test_flow_attempt_id=uuid.uuid4(),
+                assessment_tool_attempted_id=uuid.uuid4()
+            )
+        ),
+        ('question attempts of quiz attempt', QuestionAttempt.objects.filter(interactive_quiz_attempt_id=uuid.uuid4())),
+        ('video conference room by room id', VideoConferenceRoom.objects.filter(room_id='audit-room')),
+    ]
+
+
+def get_sequentially_scanned_tables(query_plan: str) -> list:
+    scanned_tables = []
+    for postgres_table, sqlite_table in SEQUENTIAL_SCAN_PATTERN.findall(query_plan):
+        table = postgres_table or sqlite_table
+        if table not in SQLITE_INTERNAL_SCANS:
+            scanned_tables.append(table)
+    return scanned_tables
+
+
+def explain_query_pattern(queryset) -> str:
+    """
+    PostgreSQL prefers sequential scans on small tables even when an index exists,
+    so they are disabled while explaining to reveal the lookups that have no usable index.
+    """
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        return queryset.explain()
+
+
+class Command(BaseCommand):
+    help = 'Explains the query patterns of the service layer and fails if any of them scans a table sequentially'
+
+    def handle(self, *args, **options):
+        failing_patterns = []
+
+        for description, queryset in get_query_patterns():
+            scanned_tables = get_sequentially_scanned_tables(explain_query_pattern(queryset))
+            if scanned_tables:
+                failing_patterns.append(f'{description} ({", ".join(scanned_tables)})')
+                self.stdout.write(f'SEQUENTIAL SCAN {description}: {", ".join(scanned_tables)}')
+            else:
+                self.stdout.write(f'OK {description}')
+
+        if failing_patterns:
+            raise CommandError(f'Query patterns scanning tables sequentially: {"; ".join(failing_patterns)}')
@@ -0,0 +1,76 @@
+from django.core.management.base import BaseCommand, CommandError
+from one_day_intern.exceptions import InvalidRequestException, RestrictedAccessException
+from users.models import Assessor
+from ...services import assessment, utils
+import csv
+import json
+import os
+
+ANSWER_OPTIONS_SEPARATOR = '|'
+
+
+def get_question_from_csv_row(row: dict) -> dict:
+    question = {
+        'prompt': row.get('prompt'),
+        'points': int(row.get('points') or 0),
+        'question_type': row.get('question_type'),
+    }
+
+    if question['question_type'] == 'multiple_choice':
+        answer_options = [option.strip() for option in (row.get('answer_options') or '').split(ANSWER_OPTIONS_SEPARATOR)]
+        question['answer_options'] = [
+            {'content': option, 'correct': option == (row.get('correct_answer') or '').strip()}
+            for option in answer_options if option
+        ]
+    else:
+        question['answer_key'] = row.get('answer_key') or None
+
+    return question
+
+
+def read_interactive_quiz_file(file_path) -> dict:
+    """
+    A JSON file holds the same payload as the create interactive quiz endpoint.
+    A CSV file holds one question per row with the columns question_type, prompt, points, answer_key,
+    answer_options (separated by |) and correct_answer.
+    """
+    with open(file_path, newline='', encoding='utf-8') as quiz_file:
+        if os.path.splitext(file_path)[1].lower() == '.csv':
+            questions = [get_question_from_csv_row(row) for row in csv.DictReader(quiz_file)]
+            return {'questions': questions, 'total_points': utils.get_interactive_quiz_total_points(questions)}
+        return json.load(quiz_file)
+
+
+class Command(BaseCommand):
+    help = 'Imports an interactive quiz and its questions from a JSON or CSV file in a single transaction'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file_path')
+        parser.add_argument('--assessor-email', required=True)
+        parser.add_argument('--name')
+        parser.add_argument('--description')
+        parser.add_argument('--duration-in-minutes', type=int)
+
+    def handle(self, *args, **options):
+        try:
+            request_data = read_interactive_quiz_file(options['file_path'])
+        except (OSError, ValueError) as exception:
+            raise CommandError(f'Interactive quiz file cannot be read: {exception}')
+
+        for field in ['name', 'description', 'duration_in_minutes']:
+            if options[field] is not None:
+                request_data[field] = options[field]
+
+        assessor = Assessor.objects.filter(email=options['assessor_email']).first()
+        if assessor is None:
+            raise CommandError(f'Assessor with email {options["assessor_email"]} not found')
+
+        try:
+            interactive_quiz = assessment.create_interactive_quiz(request_data, assessor)
+        except (InvalidRequestException, RestrictedAccessException) as exception:
+            raise CommandError(str(exception))
+
+        self.stdout.write(
+            f'Imported interactive quiz {interactive_quiz.assessment_id} '
+            f'with {len(request_data["questions"])} questions'
+        )
@@ -0,0 +1,72 @@
+import datetime
+from django.conf import settings
+from django.db import migrations, models
+
+
+def get_test_flow_tool_end_time_offset(apps, test_flow_tool):
+    Assignment = apps.get_model('assessment', 'Assignment')
+    InteractiveQuiz = apps.get_model('assessment', 'InteractiveQuiz')
+    start_time = test_flow_tool.start_working_time
+
+    for tool_model in (Assignment, InteractiveQuiz):
+        tool = tool_model.objects.filter(pk=test_flow_tool.assessment_tool_id).first()
+        if tool:
+            start_offset = datetime.timedelta(
+                hours=start_time.hour, minutes=start_time.minute, seconds=start_time.second
+            )
+            return start_offset + datetime.timedelta(minutes=tool.duration_in_minutes)
+
+    start_offset = datetime.timedelta(hours=start_time.hour, minutes=start_time.minute)
+    return start_offset + datetime.timedelta(minutes=settings.QUIZ_BASE_DURATION)
+
+
+def compute_stored_end_times(apps, schema_editor):
+    TestFlow = apps.get_model('assessment', 'TestFlow')
+    TestFlowTool = apps.get_model('assessment', 'TestFlowTool')
+    AssessmentEvent = apps.get_model('assessment', 'AssessmentEvent')
+    extra_minutes_before_end = 10
+
+    for test_flow in TestFlow.objects.all():
+        test_flow_tools = TestFlowTool.objects.filter(test_flow=test_flow)
+        test_flow.last_end_time_offset = max(
+            [get_test_flow_tool_end_time_offset(apps, test_flow_tool) for test_flow_tool in test_flow_tools],
+            default=datetime.timedelta()
+        )
+        test_flow.save(update_fields=['last_end_time_offset'])
+
+    for assessment_event in AssessmentEvent.objects.select_related('test_flow_used'):
+        event_date = assessment_event.start_date_time.date()
+        event_day_start = datetime.datetime(
+            event_date.year, event_date.month, event_date.day, 0, 0, tzinfo=datetime.timezone.utc
+        )
+        assessment_event.end_date_time = \
+            event_day_start \
+            + assessment_event.test_flow_used.last_end_time_offset \
+            + datetime.timedelta(minutes=extra_minutes_before_end)
+        assessment_event.save(update_fields=['end_date_time'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testflow',
+            name='last_end_time_offset',
+            field=models.DurationField(default=datetime.timedelta),
+        ),
+        migrations.AddField(
+            model_name='assessmentevent',
+            name='end_date_time',
+            field=models.DateTimeField(db_index=True, null=True),
+        ),
+        migrations.RunPython(compute_stored_end_times, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='assessmentevent',
+            name='end_date_time',
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations, models
+
+
+def compute_points_aggregates(apps, schema_editor):
+    InteractiveQuizAttempt = apps.get_model('assessment', 'InteractiveQuizAttempt')
+    MultipleChoiceAnswerOptionAttempt = apps.get_model('assessment', 'MultipleChoiceAnswerOptionAttempt')
+    TextQuestionAttempt = apps.get_model('assessment', 'TextQuestionAttempt')
+
+    auto_points = MultipleChoiceAnswerOptionAttempt.objects.filter(is_answered=True, is_correct=True) \
+        .order_by().values('interactive_quiz_attempt_id').annotate(points=models.Sum('question__points'))
+    manual_points = TextQuestionAttempt.objects.filter(is_answered=True) \
+        .order_by().values('interactive_quiz_attempt_id').annotate(points=models.Sum('awarded_points'))
+
+    for row in auto_points:
+        InteractiveQuizAttempt.objects.filter(pk=row['interactive_quiz_attempt_id']).update(auto_points=row['points'])
+
+    for row in manual_points:
+        InteractiveQuizAttempt.objects.filter(pk=row['interactive_quiz_attempt_id']).update(manual_points=row['points'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0002_assessmentevent_end_date_time_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interactivequizattempt',
+            name='auto_points',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='interactivequizattempt',
+            name='manual_points',
+            field=models.FloatField(default=0),
+        ),
+        migrations.RunPython(compute_points_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.1.1 on 2026-10-17 00:11
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0003_interactivequizattempt_points_aggregates'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='assessmentevent',
+            name='event_id',
+            field=models.UUIDField(auto_created=True, default=uuid.uuid4, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='testflow',
+            name='test_flow_id',
+            field=models.UUIDField(auto_created=True, default=uuid.uuid4, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='videoconferenceroom',
+            name='room_id',
+            field=models.TextField(db_index=True, default=None, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='toolattempt',
+            index=models.Index(fields=['test_flow_attempt', 'assessment_tool_attempted'], name='assessment__test_fl_b41984_idx'),
+        ),
+    ]
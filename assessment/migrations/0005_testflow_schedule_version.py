@@ -0,0 +1,18 @@
+# Generated by Django 4.1.1 on 2026-10-17 02:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0004_hot_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testflow',
+            name='schedule_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
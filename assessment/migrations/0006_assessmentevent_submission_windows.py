@@ -0,0 +1,62 @@
+import datetime
+from django.conf import settings
+from django.db import migrations, models
+
+
+def get_submission_window(tool_model_name, duration_in_minutes, test_flow_tool, event_date):
+    if tool_model_name == 'responsetest':
+        return None
+
+    release_date_time = datetime.datetime.combine(
+        event_date, test_flow_tool.release_time, tzinfo=datetime.timezone.utc
+    )
+    start_time = test_flow_tool.start_working_time
+    tool_deadline = datetime.datetime(
+        event_date.year, event_date.month, event_date.day,
+        start_time.hour, start_time.minute, start_time.second,
+        tzinfo=datetime.timezone.utc
+    ) + datetime.timedelta(minutes=duration_in_minutes, seconds=settings.SUBMISSION_BUFFER_TIME_IN_SECONDS)
+    event_day_end = datetime.datetime.combine(
+        event_date + datetime.timedelta(days=1), datetime.time(), tzinfo=datetime.timezone.utc
+    ) - datetime.timedelta(microseconds=1)
+    return [release_date_time.timestamp(), min(tool_deadline, event_day_end).timestamp()]
+
+
+def compute_submission_windows(apps, schema_editor):
+    AssessmentEvent = apps.get_model('assessment', 'AssessmentEvent')
+    TestFlowTool = apps.get_model('assessment', 'TestFlowTool')
+    durations_in_minutes = {}
+    for tool_model_name in ('assignment', 'interactivequiz'):
+        tool_model = apps.get_model('assessment', tool_model_name)
+        for assessment_id, duration_in_minutes in tool_model.objects.values_list('pk', 'duration_in_minutes'):
+            durations_in_minutes[assessment_id] = (tool_model_name, duration_in_minutes)
+    for assessment_id in apps.get_model('assessment', 'ResponseTest').objects.values_list('pk', flat=True):
+        durations_in_minutes[assessment_id] = ('responsetest', None)
+
+    for assessment_event in AssessmentEvent.objects.all():
+        event_date = assessment_event.start_date_time.date()
+        submission_windows = {}
+        for test_flow_tool in TestFlowTool.objects.filter(test_flow_id=assessment_event.test_flow_used_id):
+            if test_flow_tool.assessment_tool_id in durations_in_minutes:
+                tool_model_name, duration_in_minutes = durations_in_minutes[test_flow_tool.assessment_tool_id]
+                submission_windows[str(test_flow_tool.assessment_tool_id)] = get_submission_window(
+                    tool_model_name, duration_in_minutes, test_flow_tool, event_date
+                )
+        assessment_event.submission_windows = submission_windows
+        assessment_event.save(update_fields=['submission_windows'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0005_testflow_schedule_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assessmentevent',
+            name='submission_windows',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.RunPython(compute_submission_windows, migrations.RunPython.noop),
+    ]
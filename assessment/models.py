@@ -1,10 +1,12 @@
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.functions import Greatest
 from one_day_intern import settings
 from rest_framework import serializers
 from polymorphic.models import PolymorphicModel
 from typing import List, Optional
 from users.models import Assessor, AssessorSerializer, Assessee
 from .services.TaskGenerator import TaskGenerator
+from .services import release_schedule
 from .exceptions.exceptions import AssessmentToolDoesNotExist
 import datetime
 import pytz
@@ -15,6 +17,25 @@ USERS_ASSESSOR = 'users.Assessor'
 USERS_COMPANY = 'users.Company'
 OWNING_COMPANY_COMPANY_ID = 'owning_company.company_id'
 OWNING_COMPANY_COMPANY_NAME = 'owning_company.company_name'
+RELEASED_TOOL_CATEGORIES = {
+    'assignment': 'assignments',
+    'interactivequiz': 'interactive_quizzes',
+    'responsetest': 'response_tests'
+}
+
+
+def bulk_insert_subtype_rows(subtype_model, subtype_objects):
+    """
+    QuerySet.bulk_create raises ValueError for multi-table inherited models, because the parent
+    and child rows live in separate tables and it only inserts into one of them. Once the parent
+    rows have been bulk created, the subtype rows are inserted here through _insert, the same
+    manager method Model.save uses to insert the child table row of a single object.
+    _insert is private Django API, so InteractiveQuizTest pins both behaviours across upgrades.
+    """
+    fields = subtype_model._meta.local_concrete_fields
+    batch_size = max(connection.ops.bulk_batch_size(fields, subtype_objects), 1)
+    for batch_start in range(0, len(subtype_objects), batch_size):
+        subtype_model._base_manager._insert(subtype_objects[batch_start:batch_start + batch_size], fields=fields)
 
 
 class AssessmentTool(PolymorphicModel):
@@ -239,81 +260,112 @@ class InteractiveQuizSerializer(serializers.ModelSerializer):
 
 
 class TestFlow(models.Model):
-    test_flow_id = models.UUIDField(default=uuid.uuid4, auto_created=True)
+    test_flow_id = models.UUIDField(default=uuid.uuid4, auto_created=True, unique=True)
     name = models.CharField(max_length=50)
     owning_company = models.ForeignKey(USERS_COMPANY, on_delete=models.CASCADE)
     tools = models.ManyToManyField(AssessmentTool, through='TestFlowTool')
     is_usable = models.BooleanField(default=False)
+    last_end_time_offset = models.DurationField(default=datetime.timedelta)
+    schedule_version = models.PositiveIntegerField(default=0)
 
+    @transaction.atomic
     def add_tool(self, assessment_tool, release_time, start_working_time):
-        self.is_usable = True
+        """
+        The schedule version and the last end time offset are updated in the database, so tools added
+        concurrently to the same test flow each get their own schedule version.
+        """
         TestFlowTool.objects.create(
             assessment_tool=assessment_tool,
             test_flow=self,
             release_time=release_time,
             start_working_time=start_working_time
         )
-        self.save()
+        tool_end_time_offset = TestFlowTool.get_end_time_offset(assessment_tool, start_working_time)
+        TestFlow.objects.filter(pk=self.pk).update(
+            is_usable=True,
+            schedule_version=models.F('schedule_version') + 1,
+            last_end_time_offset=Greatest(
+                'last_end_time_offset', models.Value(tool_end_time_offset, output_field=models.DurationField())
+            )
+        )
+        self.refresh_from_db(fields=['is_usable', 'schedule_version', 'last_end_time_offset'])
+        self.update_assessment_events_end_date_time()
+
+    def update_assessment_events_end_date_time(self):
+        assessment_events = list(self.assessmentevent_set.all())
+        for assessment_event in assessment_events:
+            assessment_event.test_flow_used = self
+            assessment_event.end_date_time = assessment_event.compute_event_end_date_time()
+            assessment_event.submission_windows = assessment_event.compute_submission_windows()
+
+        AssessmentEvent.objects.bulk_update(assessment_events, ['end_date_time', 'submission_windows'])
 
     def get_is_usable(self):
         return self.is_usable
 
     def get_tools_data(self) -> List[dict]:
-        test_flow_tools = TestFlowTool.objects.filter(test_flow=self)
-        return [test_flow_tool.get_release_time_and_assessment_data() for test_flow_tool in test_flow_tools]
+        return self.get_release_schedule().get_tools_data()
 
     def get_test_flow_last_end_time_when_executed_on_event(self, event_date):
         """
-        This method computes the last deadline time of all tools that are part of the test flow.
-        For assignments and Interactive Quiz, end time is computed by start time + duration,
-        For response test, end time is computed by start time + 30 minutes
+        This method computes the last deadline time of all tools that are part of the test flow
+        from the offset of the last deadline, which is kept up to date by add_tool.
         """
-        test_flow_tools = TestFlowTool.objects.filter(test_flow=self)
-        last_end_datetime = datetime.datetime(event_date.year, event_date.month, event_date.day, 0, 0, tzinfo=pytz.utc)
-
-        for test_flow_tool in test_flow_tools:
-            tool = test_flow_tool.assessment_tool
-            tool_start_time = test_flow_tool.start_working_time
-
-            if isinstance(tool, (Assignment, InteractiveQuiz)):
-                tool_end_datetime = tool.get_end_working_time_if_executed_on_event_date(tool_start_time, event_date)
-            else:
-                tool_start_datetime = datetime.datetime(
-                    event_date.year,
-                    event_date.month,
-                    event_date.day,
-                    tool_start_time.hour,
-                    tool_start_time.minute,
-                    tzinfo=pytz.utc
-                )
-                tool_end_datetime = tool_start_datetime + datetime.timedelta(minutes=settings.QUIZ_BASE_DURATION)
-
-            if tool_end_datetime > last_end_datetime:
-                last_end_datetime = tool_end_datetime
-
-        return last_end_datetime
+        event_day_start = datetime.datetime(event_date.year, event_date.month, event_date.day, 0, 0, tzinfo=pytz.utc)
+        return event_day_start + self.last_end_time_offset
 
     def get_test_flow_tool_of_assessment_tool(self, assessment_tool):
         test_flow_tool = TestFlowTool.objects.filter(test_flow=self).get(assessment_tool=assessment_tool)
         return test_flow_tool
 
     def check_if_is_submittable(self, assessment_tool: AssessmentTool, event_date):
-        test_flow_tool: TestFlowTool = self.get_test_flow_tool_of_assessment_tool(assessment_tool)
-
-        if isinstance(assessment_tool, (Assignment, InteractiveQuiz)):
-            current_time = datetime.datetime.now(tz=pytz.utc)
-            tool_end_time = assessment_tool.get_end_working_time_if_executed_on_event_date(
-                test_flow_tool.start_working_time, event_date
-            )
-            tool_deadline = tool_end_time + datetime.timedelta(seconds=settings.SUBMISSION_BUFFER_TIME_IN_SECONDS)
-            return current_time <= tool_deadline and test_flow_tool.release_time_has_passed_on_event_day(event_date)
-
-        elif isinstance(assessment_tool, ResponseTest):
-            return True
+        return self.get_release_schedule().check_if_is_submittable(assessment_tool.assessment_id, event_date)
 
     def get_tools(self):
         return self.testflowtool_set.all()
 
+    def get_tools_with_assessment_tools(self):
+        """
+        Prefetches the polymorphic assessment tool of every test flow tool together with its owning company,
+        so the query count depends on the number of tool types instead of the number of tools.
+        """
+        return self.get_tools().prefetch_related(
+            models.Prefetch('assessment_tool', queryset=AssessmentTool.objects.select_related('owning_company'))
+        )
+
+    def get_tools_with_concrete_assessment_tools(self) -> List['TestFlowTool']:
+        """
+        Loads the test flow tools together with their assessment tools as instances of the concrete tool types
+        in a single query.
+        """
+        tool_related_names = [tool_type._meta.model_name for tool_type in ASSESSMENT_TOOL_TYPES]
+        test_flow_tools = list(self.get_tools().select_related(
+            *[f'assessment_tool__{related_name}' for related_name in tool_related_names]
+        ))
+
+        # django-polymorphic replaces the accessors of the subclasses with queries, so the selected
+        # concrete tools are read from the cache of the parent link instead
+        tool_relations = [AssessmentTool._meta.get_field(related_name) for related_name in tool_related_names]
+        for test_flow_tool in test_flow_tools:
+            base_assessment_tool = test_flow_tool.assessment_tool
+            test_flow_tool.assessment_tool = next((
+                tool_relation.get_cached_value(base_assessment_tool) for tool_relation in tool_relations
+                if tool_relation.get_cached_value(base_assessment_tool, default=None) is not None
+            ), base_assessment_tool)
+
+        return test_flow_tools
+
+    def compile_release_schedule(self) -> release_schedule.TestFlowReleaseSchedule:
+        return release_schedule.TestFlowReleaseSchedule([
+            release_schedule.ScheduledTool.from_test_flow_tool(test_flow_tool)
+            for test_flow_tool in self.get_tools_with_concrete_assessment_tools()
+        ])
+
+    def get_release_schedule(self) -> release_schedule.TestFlowReleaseSchedule:
+        return release_schedule.get_release_schedule(
+            self.test_flow_id, self.schedule_version, self.compile_release_schedule
+        )
+
 
 class TestFlowTool(models.Model):
     assessment_tool = models.ForeignKey('assessment.AssessmentTool', on_delete=models.CASCADE)
@@ -332,7 +384,22 @@ class TestFlowTool(models.Model):
         }
 
     def release_time_has_passed_on_event_day(self, event_day: datetime.date):
-        return datetime.datetime.now().date() == event_day and self.release_time <= datetime.datetime.now().time()
+        current_date_time = datetime.datetime.now()
+        return current_date_time.date() == event_day and self.release_time <= current_date_time.time()
+
+    @staticmethod
+    def get_end_time_offset(tool, start_time: datetime.time) -> datetime.timedelta:
+        """
+        Offset of the tool deadline from the start of the event day.
+        For assignments and Interactive Quiz, end time is computed by start time + duration,
+        For response test, end time is computed by start time + 30 minutes
+        """
+        if isinstance(tool, (Assignment, InteractiveQuiz)):
+            start_offset = datetime.timedelta(hours=start_time.hour, minutes=start_time.minute, seconds=start_time.second)
+            return start_offset + datetime.timedelta(minutes=tool.duration_in_minutes)
+        else:
+            start_offset = datetime.timedelta(hours=start_time.hour, minutes=start_time.minute)
+            return start_offset + datetime.timedelta(minutes=settings.QUIZ_BASE_DURATION)
 
     def get_released_tool_data(self, execution_date: datetime.date = None) -> dict:
         """
@@ -350,20 +417,7 @@ class TestFlowTool(models.Model):
             'end_working_time': '2022-15:00:00' (release-time + duration)
         }
         """
-        released_data = self.assessment_tool.get_tool_data()
-        released_data['id'] = str(self.assessment_tool.assessment_id)
-
-        if isinstance(self.assessment_tool, Assignment) or isinstance(self.assessment_tool, InteractiveQuiz):
-            released_data['released_time'] = self.get_iso_release_time_on_event_date(execution_date)
-            released_data['end_working_time'] = self.assessment_tool.get_end_working_time_if_executed_on_event_date(
-                start_time=self.release_time,
-                event_date=execution_date
-            ).isoformat()
-
-        if isinstance(self.assessment_tool, ResponseTest):
-            released_data['released_time'] = self.get_iso_release_time_on_event_date(execution_date)
-
-        return released_data
+        return release_schedule.ScheduledTool.from_test_flow_tool(self).get_released_tool_data(execution_date)
 
     def get_iso_release_time_on_event_date(self, execution_date):
         release_time = datetime.datetime(
@@ -405,11 +459,18 @@ class TestFlowSerializer(serializers.ModelSerializer):
 
 
 class AssessmentEvent(models.Model):
-    event_id = models.UUIDField(default=uuid.uuid4, auto_created=True)
+    event_id = models.UUIDField(default=uuid.uuid4, auto_created=True, unique=True)
     name = models.CharField(max_length=50)
     start_date_time = models.DateTimeField()
+    end_date_time = models.DateTimeField(db_index=True)
     owning_company = models.ForeignKey(USERS_COMPANY, on_delete=models.CASCADE)
     test_flow_used = models.ForeignKey('assessment.TestFlow', on_delete=models.RESTRICT)
+    submission_windows = models.JSONField(default=dict)
+
+    def save(self, *args, **kwargs):
+        self.end_date_time = self.compute_event_end_date_time()
+        self.submission_windows = self.compute_submission_windows()
+        super().save(*args, **kwargs)
 
     def check_company_ownership(self, company):
         return self.owning_company.company_id == company.company_id
@@ -436,6 +497,42 @@ class AssessmentEvent(models.Model):
 
             return assessment_event_participation
 
+    def bulk_add_participants(self, list_of_participants) -> List['AssessmentEventParticipation']:
+        """
+        Enrolls a list of (assessee, assessor) pairs with a constant number of queries.
+        Assessees that are already part of the event are expected to be filtered out by the caller.
+        """
+        with transaction.atomic():
+            assessment_event_participations = AssessmentEventParticipation.objects.bulk_create([
+                AssessmentEventParticipation(assessment_event=self, assessee=assessee, assessor=assessor)
+                for assessee, assessor in list_of_participants
+            ])
+
+            test_flow_attempts = TestFlowAttempt.objects.bulk_create([
+                TestFlowAttempt(
+                    event_participation=assessment_event_participation,
+                    test_flow_attempted_id=self.test_flow_used_id
+                )
+                for assessment_event_participation in assessment_event_participations
+            ])
+
+            VideoConferenceRoom.objects.bulk_create([
+                VideoConferenceRoom(part_of=assessment_event_participation)
+                for assessment_event_participation in assessment_event_participations
+            ])
+
+            for participation, test_flow_attempt in zip(assessment_event_participations, test_flow_attempts):
+                participation.attempt = test_flow_attempt
+            AssessmentEventParticipation.objects.bulk_update(assessment_event_participations, ['attempt'])
+
+        return assessment_event_participations
+
+    def get_registered_assessee_ids(self, assessees) -> set:
+        return set(
+            AssessmentEventParticipation.objects.filter(assessment_event=self, assessee__in=assessees)
+            .values_list('assessee_id', flat=True)
+        )
+
     def check_assessee_participation(self, assessee):
         found_assessees = AssessmentEventParticipation.objects.filter(
             assessment_event=self,
@@ -470,20 +567,36 @@ class AssessmentEvent(models.Model):
 
         return task_generator
 
+    def get_tool_releases(self) -> List[tuple]:
+        return self.test_flow_used.get_release_schedule().get_tool_releases(self.start_date_time.date())
+
     def is_active(self) -> bool:
-        return self.start_date_time <= datetime.datetime.now(datetime.timezone.utc) <= self.get_event_end_date_time()
+        return self.start_date_time <= datetime.datetime.now(datetime.timezone.utc) <= self.end_date_time
+
+    def get_released_scheduled_tools(self, tool_types) -> List[release_schedule.ScheduledTool]:
+        event_date = self.start_date_time.date()
+        if datetime.datetime.now().date() != event_date:
+            return []
+        return self.test_flow_used.get_release_schedule().get_released_tools(tool_types, event_date)
 
     def get_released_tools(self, tool_type):
-        test_flow_tools = self.test_flow_used.testflowtool_set.all()
-        released_tools_data = []
         event_date = self.start_date_time.date()
+        return [
+            scheduled_tool.get_released_tool_data(execution_date=event_date)
+            for scheduled_tool in self.get_released_scheduled_tools([tool_type._meta.model_name])
+        ]
 
-        for test_flow_tool in test_flow_tools:
-            tool_used = test_flow_tool.assessment_tool
-            if isinstance(tool_used, tool_type) and test_flow_tool.release_time_has_passed_on_event_day(event_date):
-                released_tools_data.append(
-                    test_flow_tool.get_released_tool_data(execution_date=self.start_date_time.date())
-                )
+    def get_all_released_tools(self) -> dict:
+        """
+        Returns the released assignments, interactive quizzes and response tests of the event
+        from the release schedule of its test flow
+        """
+        event_date = self.start_date_time.date()
+        released_tools_data = {category: [] for category in RELEASED_TOOL_CATEGORIES.values()}
+
+        for scheduled_tool in self.get_released_scheduled_tools(list(RELEASED_TOOL_CATEGORIES.keys())):
+            category = RELEASED_TOOL_CATEGORIES[scheduled_tool.tool_type]
+            released_tools_data[category].append(scheduled_tool.get_released_tool_data(execution_date=event_date))
 
         return released_tools_data
 
@@ -515,14 +628,33 @@ class AssessmentEvent(models.Model):
                 f'Tool with id {assessment_id} associated with event with id {self.event_id} is not found'
             )
 
-    def get_event_end_date_time(self):
+    def compute_event_end_date_time(self):
         extra_minutes_before_end = 10
         last_end_time = \
             self.test_flow_used.get_test_flow_last_end_time_when_executed_on_event(self.start_date_time.date())
         return last_end_time + datetime.timedelta(minutes=extra_minutes_before_end)
 
+    def get_event_end_date_time(self):
+        return self.end_date_time
+
+    def compute_submission_windows(self) -> dict:
+        return self.test_flow_used.get_release_schedule().get_submission_windows(self.start_date_time.date())
+
     def check_if_tool_is_submittable(self, assessment_tool):
-        return self.test_flow_used.check_if_is_submittable(assessment_tool, event_date=self.start_date_time.date())
+        """
+        Looks the tool up in the submission windows stored with the event, so no query is needed
+        """
+        return release_schedule.submission_window_is_open(
+            self.submission_windows, assessment_tool.assessment_id, datetime.datetime.now(tz=pytz.utc)
+        )
+
+    def get_tool_submission_deadline(self, assessment_tool) -> Optional[datetime.datetime]:
+        submission_window = self.submission_windows.get(str(assessment_tool.assessment_id))
+        if submission_window is None:
+            return None
+
+        _, deadline_timestamp = submission_window
+        return datetime.datetime.fromtimestamp(deadline_timestamp, tz=pytz.utc)
 
     def get_test_flow(self):
         return self.test_flow_used
@@ -630,6 +762,9 @@ class VideoConferenceNotification(AssessmentTool):
         return tool_base_data
 
 
+ASSESSMENT_TOOL_TYPES = [Assignment, InteractiveQuiz, ResponseTest, VideoConferenceNotification]
+
+
 class VideoConferenceNotificationSerializer(serializers.ModelSerializer):
     owning_company_name = serializers.ReadOnlyField(source=OWNING_COMPANY_COMPANY_NAME)
     class Meta:
@@ -660,7 +795,7 @@ class PolymorphicAssessmentToolSerializer:
 
 class VideoConferenceRoom(models.Model):
     part_of = models.ForeignKey('assessment.AssessmentEventParticipation', on_delete=models.CASCADE)
-    room_id = models.TextField(null=True, default=None)
+    room_id = models.TextField(null=True, default=None, db_index=True)
     conference_participants = models.ManyToManyField(USERS_ASSESSOR)
     room_opened = models.BooleanField(default=False)
 
@@ -695,6 +830,9 @@ class ToolAttempt(PolymorphicModel):
     test_flow_attempt = models.ForeignKey('assessment.TestFlowAttempt', on_delete=models.CASCADE)
     assessment_tool_attempted = models.ForeignKey('assessment.AssessmentTool', on_delete=models.CASCADE, default=None)
 
+    class Meta(PolymorphicModel.Meta):
+        indexes = [models.Index(fields=['test_flow_attempt', 'assessment_tool_attempted'])]
+
     def get_user_of_attempt(self):
         return self.test_flow_attempt.event_participation.assessee
 
@@ -706,11 +844,11 @@ class ToolAttempt(PolymorphicModel):
 
     def set_grade(self, grade):
         self.grade = grade
-        self.save()
+        self.save(update_fields=['grade'])
 
     def set_note(self, note):
         self.note = note
-        self.save()
+        self.save(update_fields=['note'])
 
 
 class ToolAttemptSerializer(serializers.ModelSerializer):
@@ -727,14 +865,14 @@ class AssignmentAttempt(ToolAttempt):
     def update_attempt_cloud_directory(self, file_upload_directory):
         self.submitted_time = datetime.datetime.now(tz=pytz.utc)
         self.file_upload_directory = file_upload_directory
-        self.save()
+        self.save(update_fields=['submitted_time', 'file_upload_directory'])
 
     def get_attempt_cloud_directory(self):
         return self.file_upload_directory
 
     def update_file_name(self, filename):
         self.filename = filename
-        self.save()
+        self.save(update_fields=['filename'])
 
     def get_file_name(self):
         return self.filename
@@ -745,6 +883,8 @@ class AssignmentAttempt(ToolAttempt):
 
 class InteractiveQuizAttempt(ToolAttempt):
     submitted_time = models.DateTimeField(default=None, null=True)
+    auto_points = models.FloatField(default=0)
+    manual_points = models.FloatField(default=0)
 
     def get_all_question_attempts(self):
         return self.questionattempt_set.all()
@@ -756,65 +896,145 @@ class InteractiveQuizAttempt(ToolAttempt):
         else:
             return None
 
+    def get_question_attempts_with_answer_options(self):
+        """
+        Loads the question attempts together with their concrete attempt type, their question
+        and the answer options of the multiple choice questions in two queries.
+        Returns the question attempts and the answer options keyed by question id.
+        """
+        question_attempts = list(self.questionattempt_set.select_related(
+            'question__textquestion',
+            'multiplechoiceansweroptionattempt',
+            'textquestionattempt'
+        ))
+        answer_options = MultipleChoiceAnswerOption.objects.filter(
+            question__in=[question_attempt.question_id for question_attempt in question_attempts]
+        )
+        answer_options_of_questions = dict()
+        for answer_option in answer_options:
+            answer_options_of_questions.setdefault(answer_option.question_id, []).append(answer_option)
+        return question_attempts, answer_options_of_questions
+
     def set_submitted_time(self):
         self.submitted_time = datetime.datetime.now(tz=pytz.utc)
-        self.save()
+        self.save(update_fields=['submitted_time'])
 
     def get_submitted_time(self):
         return self.submitted_time
 
-    def accumulate_points(self, points):
-        self.grade += points
-        self.save()
+    def get_question_attempts_from_ids(self, question_attempt_ids):
+        return self.questionattempt_set.filter(question_attempt_id__in=question_attempt_ids).select_related(
+            'question',
+            'multiplechoiceansweroptionattempt',
+            'textquestionattempt'
+        )
 
-    def update_points(self, old, new):
-        self.grade -= old
-        self.save()
-        self.accumulate_points(new)
+    @transaction.atomic
+    def bulk_save_answers(self, selected_answer_options, text_answers):
+        """
+        Saves the selected answer options and text answers of many questions with one batched update per table,
+        and applies the change of their points to the running aggregates in the same transaction.
+        The question attempts are locked and reloaded first, so the previous points are read from the committed rows.
+        """
+        MultipleChoiceAnswerOptionAttempt.refresh_many_for_update(
+            [mcq_attempt for mcq_attempt, _ in selected_answer_options], ['is_answered', 'is_correct']
+        )
+        TextQuestionAttempt.refresh_many_for_update(
+            [text_question_attempt for text_question_attempt, _ in text_answers], ['is_answered', 'awarded_points']
+        )
+        points_differences = {'auto_points': 0, 'manual_points': 0}
+
+        for mcq_attempt, answer_option in selected_answer_options:
+            previous_contributed_points = mcq_attempt.get_contributed_points()
+            mcq_attempt.selected_option = answer_option
+            mcq_attempt.is_correct = answer_option.is_correct()
+            mcq_attempt.is_answered = True
+            points_differences['auto_points'] += mcq_attempt.get_contributed_points() - previous_contributed_points
+
+        for text_question_attempt, answer in text_answers:
+            previous_contributed_points = text_question_attempt.get_contributed_points()
+            text_question_attempt.answer = answer
+            text_question_attempt.is_answered = bool(answer)
+            points_differences['manual_points'] += \
+                text_question_attempt.get_contributed_points() - previous_contributed_points
+
+        MultipleChoiceAnswerOptionAttempt.objects.bulk_update(
+            [mcq_attempt for mcq_attempt, _ in selected_answer_options],
+            ['selected_option', 'is_correct', 'is_answered']
+        )
+        TextQuestionAttempt.objects.bulk_update(
+            [text_question_attempt for text_question_attempt, _ in text_answers],
+            ['answer', 'is_answered']
+        )
+
+        if any(points_differences.values()):
+            InteractiveQuizAttempt.objects.filter(tool_attempt_id=self.tool_attempt_id).update(**{
+                points_field: models.F(points_field) + points_difference
+                for points_field, points_difference in points_differences.items()
+            })
 
+    @staticmethod
+    def get_points_of_attempts(tool_attempt_ids) -> dict:
+        """
+        Reads the points of each quiz attempt from the running aggregates kept up to date by its question attempts
+        """
+        points_of_attempts = InteractiveQuizAttempt.objects.filter(tool_attempt_id__in=tool_attempt_ids).annotate(
+            points=models.F('auto_points') + models.F('manual_points')
+        ).values_list('tool_attempt_id', 'points')
+        return dict(points_of_attempts)
+
+    @staticmethod
+    def get_percentage_grade(points, total_quiz_points):
+        if not total_quiz_points:
+            return 0
+        return (points / total_quiz_points) * 100
+
+    @transaction.atomic
     def calculate_total_points(self):
-        points = 0
-        for question_attempt in self.questionattempt_set.all():
-            question_type = question_attempt.get_question().get_question_type()
-            if question_attempt.is_answered:
-                if question_type == 'multiple_choice':
-                    mcq_attempt = MultipleChoiceAnswerOptionAttempt.objects.get(
-                        question_attempt_id=question_attempt.question_attempt_id
-                    )
-                    if mcq_attempt.get_is_correct():
-                        points += question_attempt.get_question().get_points()
-                elif question_type == "text":
-                    text_attempt = TextQuestionAttempt.objects.get(
-                        question_attempt_id=question_attempt.question_attempt_id
-                    )
-                    points += text_attempt.awarded_points
-        original_quiz: InteractiveQuiz = InteractiveQuiz.objects.get(assessment_id=self.assessment_tool_attempted.assessment_id)
-        total_quiz_points = original_quiz.total_points
-        percentage_grade = (points / total_quiz_points) * 100
+        """
+        Locks the quiz attempt while the grade is derived from its aggregates, so a concurrent grader
+        cannot commit a change of the aggregates between the read and the write of the grade.
+        """
+        score = InteractiveQuizAttempt.objects.select_for_update(of=('self',)).filter(
+            tool_attempt_id=self.tool_attempt_id
+        ).values(
+            'auto_points',
+            'manual_points',
+            'assessment_tool_attempted__interactivequiz__total_points'
+        ).get()
+        self.auto_points = score['auto_points']
+        self.manual_points = score['manual_points']
+        percentage_grade = self.get_percentage_grade(
+            self.auto_points + self.manual_points,
+            score['assessment_tool_attempted__interactivequiz__total_points']
+        )
         self.grade = percentage_grade
-        self.save()
+        ToolAttempt.objects.filter(tool_attempt_id=self.tool_attempt_id).update(grade=percentage_grade)
         return percentage_grade
 
     def create_question_attempts(self, interactive_quiz: InteractiveQuiz):
-        questions = interactive_quiz.get_questions()
-
-        for question in questions:
-            question_type = question.question_type
+        """
+        Materialises the attempts of every question of the quiz with one batched insert per table
+        instead of two inserts per question.
+        """
+        questions = list(interactive_quiz.get_questions())
+        question_attempts = [
+            QuestionAttempt(question=question, interactive_quiz_attempt=self, is_answered=False)
+            for question in questions
+        ]
 
-            if question_type == "multiple_choice":
-                MultipleChoiceAnswerOptionAttempt.objects.create(
-                    question=question,
-                    interactive_quiz_attempt=self,
-                    is_answered=False,
-                    selected_option=None
-                )
-            else:
-                TextQuestionAttempt.objects.create(
-                    question=question,
-                    interactive_quiz_attempt=self,
-                    is_answered=False,
-                    answer=None
-                )
+        with transaction.atomic():
+            QuestionAttempt.objects.bulk_create(question_attempts)
+            bulk_insert_subtype_rows(MultipleChoiceAnswerOptionAttempt, [
+                MultipleChoiceAnswerOptionAttempt(questionattempt_ptr=question_attempt, selected_option=None)
+                for question_attempt in question_attempts
+                if question_attempt.question.question_type == 'multiple_choice'
+            ])
+            bulk_insert_subtype_rows(TextQuestionAttempt, [
+                TextQuestionAttempt(questionattempt_ptr=question_attempt, answer=None)
+                for question_attempt in question_attempts
+                if question_attempt.question.question_type != 'multiple_choice'
+            ])
 
 
 class QuestionAttempt(models.Model):
@@ -833,14 +1053,14 @@ class QuestionAttempt(models.Model):
             raise InvalidRequestException('Cannot give points outside of constraint')
 
         self.point = point
-        self.save()
+        self.save(update_fields=['point'])
 
     def get_point(self):
         return self.point
 
     def set_note(self, note):
         self.question_note = note
-        self.save()
+        self.save(update_fields=['question_note'])
 
     def get_note(self):
         return self.question_note
@@ -857,23 +1077,81 @@ class QuestionAttempt(models.Model):
     def get_id(self):
         return self.question_attempt_id
 
+    def get_contributed_points(self):
+        return 0
+
+    def refresh_for_update(self, field_names):
+        """
+        Locks the row of this question attempt and reloads the given fields from it,
+        so the points it contributed are computed from the committed state instead of a stale instance.
+        """
+        type(self).refresh_many_for_update([self], field_names)
+
+    @classmethod
+    def refresh_many_for_update(cls, question_attempts, field_names):
+        """
+        Locks the rows of the question attempts with one query and reloads the given fields from them.
+        The rows are locked in primary key order, so concurrent batches cannot deadlock each other.
+        """
+        if not question_attempts:
+            return
+
+        attnames = [cls._meta.get_field(field_name).attname for field_name in field_names]
+        locked_rows = cls._base_manager.select_for_update().filter(
+            pk__in=[question_attempt.pk for question_attempt in question_attempts]
+        ).order_by('pk').values('pk', *attnames)
+        locked_values = {locked_row.pop('pk'): locked_row for locked_row in locked_rows}
+
+        for question_attempt in question_attempts:
+            for attname, value in locked_values[question_attempt.pk].items():
+                setattr(question_attempt, attname, value)
+
+    def update_quiz_attempt_points(self, previous_contributed_points, points_field):
+        """
+        Applies the change of the points this question contributes to the running aggregate of its quiz attempt.
+        The aggregate is updated in the database through an F expression, so concurrent updates are not lost.
+        """
+        points_difference = self.get_contributed_points() - previous_contributed_points
+        if points_difference:
+            InteractiveQuizAttempt.objects.filter(tool_attempt_id=self.interactive_quiz_attempt_id).update(
+                **{points_field: models.F(points_field) + points_difference}
+            )
+
 
 class TextQuestionAttempt(QuestionAttempt):
     answer = models.TextField(null=True)
     is_graded = models.BooleanField(default=False)
     awarded_points = models.FloatField(default=0)
 
+    def get_contributed_points(self):
+        if self.is_answered:
+            return self.awarded_points
+        return 0
+
+    @transaction.atomic
     def set_answer(self, answer):
+        self.refresh_for_update(['is_answered', 'awarded_points'])
+        previous_contributed_points = self.get_contributed_points()
         self.answer = answer
         if answer:
             self.is_answered = True
         else:
             self.is_answered = False
-        self.save()
+        self.save(update_fields=['answer', 'is_answered'])
+        self.update_quiz_attempt_points(previous_contributed_points, 'manual_points')
 
     def set_is_graded(self):
         self.is_graded = True
-        self.save()
+        self.save(update_fields=['is_graded'])
+
+    @transaction.atomic
+    def set_awarded_points(self, awarded_points):
+        self.refresh_for_update(['is_answered', 'awarded_points'])
+        previous_contributed_points = self.get_contributed_points()
+        self.awarded_points = awarded_points
+        self.is_graded = True
+        self.save(update_fields=['awarded_points', 'is_graded'])
+        self.update_quiz_attempt_points(previous_contributed_points, 'manual_points')
 
     def get_is_graded(self):
         return self.is_graded
@@ -893,20 +1171,33 @@ class MultipleChoiceAnswerOptionAttempt(QuestionAttempt):
                                         null=True)
     is_correct = models.BooleanField(default=False)
 
+    def get_contributed_points(self):
+        if self.is_answered and self.is_correct:
+            return self.question.get_points()
+        return 0
+
+    @transaction.atomic
     def set_selected_option(self, answer_option_id):
+        self.refresh_for_update(['is_answered', 'is_correct'])
+        previous_contributed_points = self.get_contributed_points()
         matching_answer_option = MultipleChoiceAnswerOption.objects.filter(answer_option_id=answer_option_id)
         answer_option = matching_answer_option[0]
         self.selected_option = answer_option
         self.is_correct = answer_option.is_correct()
         self.is_answered = True
-        self.save()
+        self.save(update_fields=['selected_option', 'is_correct', 'is_answered'])
+        self.update_quiz_attempt_points(previous_contributed_points, 'auto_points')
 
     def get_selected_option_content(self):
         return self.selected_option.get_content()
 
+    @transaction.atomic
     def set_is_correct(self, value):
+        self.refresh_for_update(['is_answered', 'is_correct'])
+        previous_contributed_points = self.get_contributed_points()
         self.is_correct = value
-        self.save()
+        self.save(update_fields=['is_correct'])
+        self.update_quiz_attempt_points(previous_contributed_points, 'auto_points')
 
     def get_is_correct(self):
         return self.is_correct
@@ -931,12 +1222,12 @@ class ResponseTestAttempt(ToolAttempt):
 
     def set_subject(self, subject):
         self.subject = subject
-        self.save()
+        self.save(update_fields=['subject'])
 
     def set_response(self, response):
         self.submitted_time = datetime.datetime.now(tz=pytz.utc)
         self.response = response
-        self.save()
+        self.save(update_fields=['submitted_time', 'response'])
 
 
 class GradedResponseTestAttemptSerializer(serializers.ModelSerializer):
@@ -984,12 +1275,23 @@ class AssessmentEventParticipation(models.Model):
     attempt = models.OneToOneField('assessment.TestFlowAttempt', on_delete=models.CASCADE, null=True)
 
     def generate_assessee_report(self):
+        """
+        Builds the report from the tools, attempts and quiz points loaded in a fixed number of queries,
+        regardless of the number of tools in the test flow or questions in the quizzes.
+        """
         event_test_flow = self.assessment_event.get_test_flow()
-        event_tools: List[TestFlowTool] = event_test_flow.get_tools()
+        event_tools: List[TestFlowTool] = list(event_test_flow.get_tools_with_assessment_tools())
+        tool_attempts = self.get_base_tool_attempts_by_assessment_tool()
+        quiz_attempt_ids = [
+            tool_attempts[event_tool.assessment_tool_id].tool_attempt_id for event_tool in event_tools
+            if isinstance(event_tool.assessment_tool, InteractiveQuiz) and event_tool.assessment_tool_id in tool_attempts
+        ]
+        quiz_points = InteractiveQuizAttempt.get_points_of_attempts(quiz_attempt_ids)
+
         grade_and_note_data = []
         for event_tool in event_tools:
             assessment_tool = event_tool.assessment_tool
-            attempt = self.get_assessment_tool_attempt(assessment_tool)
+            attempt = tool_attempts.get(assessment_tool.assessment_id)
             data = {
                 'tool_name': assessment_tool.name,
                 'tool_description': assessment_tool.description,
@@ -997,9 +1299,10 @@ class AssessmentEventParticipation(models.Model):
             }
             if attempt:
                 data['is_attempted'] = True
-                if assessment_tool.get_type() == "interactivequiz":
-                    iq_attempt: InteractiveQuizAttempt = InteractiveQuizAttempt.objects.get(tool_attempt_id=attempt.tool_attempt_id)
-                    data['grade'] = iq_attempt.calculate_total_points() 
+                if isinstance(assessment_tool, InteractiveQuiz):
+                    data['grade'] = InteractiveQuizAttempt.get_percentage_grade(
+                        quiz_points.get(attempt.tool_attempt_id, 0), assessment_tool.total_points
+                    )
                 else:
                     data['grade'] = attempt.grade
                 data['note'] = attempt.note
@@ -1065,6 +1368,7 @@ class AssessmentEventParticipation(models.Model):
         else:
             return None
 
+    @transaction.atomic
     def create_interactive_quiz_attempt(self, interactive_quiz: InteractiveQuiz) -> InteractiveQuizAttempt:
         interactive_quiz_attempt = InteractiveQuizAttempt.objects.create(
             test_flow_attempt=self.attempt,
@@ -1085,13 +1389,21 @@ class AssessmentEventParticipation(models.Model):
         else:
             return None
 
+    def get_base_tool_attempts_by_assessment_tool(self) -> dict:
+        """
+        Returns the non-polymorphic tool attempts of the participation keyed by the id of the attempted tool
+        """
+        tool_attempts = ToolAttempt.objects.non_polymorphic().filter(test_flow_attempt_id=self.attempt_id)
+        return {tool_attempt.assessment_tool_attempted_id: tool_attempt for tool_attempt in tool_attempts}
+
     def get_event_progress(self):
         event_test_flow = self.assessment_event.get_test_flow()
-        event_tools: List[TestFlowTool] = event_test_flow.get_tools()
+        event_tools: List[TestFlowTool] = event_test_flow.get_tools_with_assessment_tools()
+        tool_attempts = self.get_base_tool_attempts_by_assessment_tool()
         progress_data = []
         for event_tool in event_tools:
             assessment_tool = event_tool.assessment_tool
-            attempt = self.get_assessment_tool_attempt(assessment_tool)
+            attempt = tool_attempts.get(assessment_tool.assessment_id)
 
             if attempt:
                 attempt_id = attempt.tool_attempt_id
@@ -1,4 +1,5 @@
 from django.contrib.auth.models import User
+from django.db import transaction
 from one_day_intern.exceptions import (
     RestrictedAccessException,
     InvalidAssignmentRegistration,
@@ -7,31 +8,41 @@ from one_day_intern.exceptions import (
     InvalidVideoConferenceNotificationException
 )
 from users.models import Assessor, Company
+from users.services import utils as user_utils
 from . import utils
-from ..models import Assignment, MultipleChoiceQuestion, InteractiveQuiz, TextQuestion, ResponseTest, VideoConferenceNotification
+from ..models import (
+    Assignment,
+    Question,
+    MultipleChoiceQuestion,
+    MultipleChoiceAnswerOption,
+    InteractiveQuiz,
+    TextQuestion,
+    ResponseTest,
+    VideoConferenceNotification,
+    bulk_insert_subtype_rows
+)
 
 
 def get_assessor_or_raise_exception(user: User):
     user_email = user.email
-    found_assessors = Assessor.objects.filter(email=user_email)
-    if len(found_assessors) > 0:
-        return found_assessors[0]
+    concrete_user = user_utils.get_concrete_user(user)
+    if isinstance(concrete_user, Assessor):
+        return concrete_user
     else:
         raise RestrictedAccessException(f'User {user_email} is not an assessor')
 
 
 def get_assessor_or_company_or_raise_exception(user: User):
     user_email = user.email
-    found_company = Company.objects.filter(email=user_email)
-    found_assessors = Assessor.objects.filter(email=user_email)
-    if len(found_assessors) > 0:
+    concrete_user = user_utils.get_concrete_user(user)
+    if isinstance(concrete_user, Assessor):
         return {
-            "user": found_assessors[0],
+            "user": concrete_user,
             "type": "assessor"
         }
-    if len(found_company) > 0:
+    if isinstance(concrete_user, Company):
         return {
-            "user": found_company[0],
+            "user": concrete_user,
             "type": "company"
         }
     return RestrictedAccessException(f"User {user_email} is not a valid company or assessor")
@@ -156,34 +167,46 @@ def validate_interactive_quiz(request_data):
     if not isinstance(request_data.get('duration_in_minutes'), int):
         raise InvalidInteractiveQuizRegistration('Interactive Quiz duration must only be of type numeric')
 
+    if not isinstance(request_data.get('questions'), list):
+        raise InvalidInteractiveQuizRegistration('Interactive Quiz questions must be a list')
 
-def save_question_to_database(question_data: dict, interactive_quiz: InteractiveQuiz):
-    prompt = question_data.get('prompt')
-    points = question_data.get('points')
-    question_type = question_data.get('question_type')
-
-    if question_type == 'multiple_choice':
-        question = MultipleChoiceQuestion.objects.create(
-            interactive_quiz=interactive_quiz,
-            prompt=prompt,
-            points=points,
-            question_type=question_type
-        )
-
-        answers = question_data.get('answer_options')
-        for answer in answers:
-            question.save_answer_option_to_database(answer)
-    else:
-        answer_key = question_data.get('answer_key')
 
-        question = TextQuestion.objects.create(
+def bulk_save_questions_to_database(questions_data: list, interactive_quiz: InteractiveQuiz):
+    """
+    Saves every question of the quiz and their answer options with one batched insert per table
+    """
+    questions = [
+        Question(
             interactive_quiz=interactive_quiz,
-            prompt=prompt,
-            points=points,
-            question_type=question_type,
-            answer_key=answer_key
+            prompt=question_data.get('prompt'),
+            points=question_data.get('points'),
+            question_type=question_data.get('question_type')
         )
-    return question
+        for question_data in questions_data
+    ]
+    Question.objects.bulk_create(questions)
+
+    multiple_choice_questions = []
+    text_questions = []
+    answer_options = []
+    for question, question_data in zip(questions, questions_data):
+        if question.question_type == 'multiple_choice':
+            multiple_choice_questions.append(MultipleChoiceQuestion(question_ptr=question))
+            answer_options += [
+                MultipleChoiceAnswerOption(
+                    question_id=question.question_id,
+                    content=answer.get('content'),
+                    correct=answer.get('correct')
+                )
+                for answer in question_data.get('answer_options')
+            ]
+        else:
+            text_questions.append(TextQuestion(question_ptr=question, answer_key=question_data.get('answer_key')))
+
+    bulk_insert_subtype_rows(MultipleChoiceQuestion, multiple_choice_questions)
+    bulk_insert_subtype_rows(TextQuestion, text_questions)
+    MultipleChoiceAnswerOption.objects.bulk_create(answer_options)
+    return questions
 
 
 def save_interactive_quiz_to_database(request_data: dict, assessor: Assessor):
@@ -227,7 +250,7 @@ def validate_question(question):
         raise InvalidInteractiveQuizRegistration('Question points must only be of type numeric')
 
     if question.get('question_type') == 'multiple_choice':
-        if len(question.get('answer_options')) <= 0:
+        if not question.get('answer_options'):
             raise InvalidInteractiveQuizRegistration('Multiple Choice Questions should have answer options')
 
         true_option_counter = 0
@@ -251,10 +274,8 @@ def create_interactive_quiz(request_data, user):
     for q in questions:
         validate_question(q)
 
-    interactive_quiz = save_interactive_quiz_to_database(request_data, assessor)
-
-    for q in questions:
-        save_question_to_database(q, interactive_quiz)
+    with transaction.atomic():
+        interactive_quiz = save_interactive_quiz_to_database(request_data, assessor)
+        bulk_save_questions_to_database(questions, interactive_quiz)
 
     return interactive_quiz
-
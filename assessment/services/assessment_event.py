@@ -132,7 +132,7 @@ def email_invitations_to_assessees(event: AssessmentEvent, list_of_participants:
     for assessee, _ in list_of_participants:
         message = generate_invitation_to_assessee(event, assessee)
         messages_to_sent.append(message)
-    company_utils.send_mass_html_mail(messages_to_sent)
+    company_utils.queue_mass_html_mail(messages_to_sent)
 
 
 def add_assessment_event_participation(request_data, user):
@@ -146,6 +146,74 @@ def add_assessment_event_participation(request_data, user):
     email_invitations_to_assessees(event, converted_list_of_participants)
 
 
+def get_participant_row_error(participant_data, message) -> dict:
+    return {
+        'assessee_email': participant_data.get('assessee_email'),
+        'assessor_email': participant_data.get('assessor_email'),
+        'message': message
+    }
+
+
+def bulk_convert_list_of_participants_emails_to_user_objects(event: AssessmentEvent, list_of_participants,
+                                                             creating_company: Company):
+    """
+    Resolves every assessee and assessor of the list with one query each.
+    Returns the (assessee, assessor) pairs that can be enrolled and the errors of the rows that cannot.
+    """
+    list_of_participants = [
+        participant_data if isinstance(participant_data, dict) else {} for participant_data in list_of_participants
+    ]
+    assessee_emails = {str(participant_data.get('assessee_email')).lower() for participant_data in list_of_participants}
+    assessor_emails = {str(participant_data.get('assessor_email')).lower() for participant_data in list_of_participants}
+    found_assessees = {assessee.email: assessee for assessee in Assessee.objects.filter(email__in=assessee_emails)}
+    found_assessors = {
+        assessor.email: assessor for assessor in creating_company.assessor_set.filter(email__in=assessor_emails)
+    }
+    enrolled_assessee_ids = event.get_registered_assessee_ids(found_assessees.values())
+
+    converted_list_of_participants = []
+    errors = []
+    for participant_data in list_of_participants:
+        assessee_email = participant_data.get('assessee_email')
+        assessor_email = participant_data.get('assessor_email')
+        assessee = found_assessees.get(str(assessee_email).lower())
+        assessor = found_assessors.get(str(assessor_email).lower())
+
+        if not assessee:
+            errors.append(get_participant_row_error(participant_data, f'Assessee with email {assessee_email} not found'))
+        elif not assessor:
+            errors.append(get_participant_row_error(
+                participant_data,
+                f'Assessor with email {assessor_email} associated with {creating_company.company_name} is not found'
+            ))
+        elif assessee.pk in enrolled_assessee_ids:
+            errors.append(get_participant_row_error(
+                participant_data,
+                f'Assessee with email {assessee_email} is already part of assessment with id {event.event_id}'
+            ))
+        else:
+            enrolled_assessee_ids.add(assessee.pk)
+            converted_list_of_participants.append((assessee, assessor))
+
+    return converted_list_of_participants, errors
+
+
+def bulk_add_assessment_event_participation(request_data, user):
+    validate_add_assessment_participant(request_data)
+    company = utils.get_company_or_assessor_associated_company_from_user(user)
+    event = utils.get_assessment_event_from_id(request_data.get('assessment_event_id'))
+    validate_assessment_event_ownership(event, company)
+    converted_list_of_participants, errors = bulk_convert_list_of_participants_emails_to_user_objects(
+        event, request_data.get('list_of_participants'), company
+    )
+    event.bulk_add_participants(converted_list_of_participants)
+    email_invitations_to_assessees(event, converted_list_of_participants)
+    return {
+        'added_participants': [assessee.email for assessee, _ in converted_list_of_participants],
+        'errors': errors
+    }
+
+
 def validate_update_assessment_event(request_data, event: AssessmentEvent, creating_company):
     if request_data.get('start_date'):
         try:
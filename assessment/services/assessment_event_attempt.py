@@ -2,14 +2,19 @@ from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
 from one_day_intern.decorators import catch_exception_and_convert_to_invalid_request_decorator
 from one_day_intern.exceptions import RestrictedAccessException, InvalidRequestException
-from one_day_intern.settings import GOOGLE_BUCKET_BASE_DIRECTORY, GOOGLE_STORAGE_BUCKET_NAME
+from one_day_intern.settings import (
+    GOOGLE_BUCKET_BASE_DIRECTORY,
+    GOOGLE_STORAGE_BUCKET_NAME,
+    SIGNED_URL_EXPIRATION_IN_SECONDS
+)
 from users.models import Assessee, Assessor
 from .participation_validators import validate_user_participation
 from ..exceptions.exceptions import (
     EventDoesNotExist,
     AssessmentToolDoesNotExist,
     QuestionAttemptDoesNotExist,
-    QuestionDoesNotExist
+    QuestionDoesNotExist,
+    FileDoesNotExist
 )
 from ..models import (
     AssessmentEvent,
@@ -31,16 +36,24 @@ from ..models import (
 )
 from .TaskGenerator import TaskGenerator
 from . import utils, google_storage
+import datetime
 import mimetypes
+import pytz
+import uuid
 
 ASSOCIATED_TOOL_NOT_FOUND = 'Assessment tool associated with event does not exist'
 ASSESEE_NOT_PART_OF_EVENT = 'Assessee with email {} is not part of assessment with id {}'
 
 
-def subscribe_to_assessment_flow(request_data, user) -> TaskGenerator:
+def get_subscribed_assessment_event(request_data, user) -> AssessmentEvent:
     event = utils.get_active_assessment_event_from_id(request_data.get('assessment-event-id'))
     assessee = utils.get_assessee_from_user(user)
     validate_user_participation(event, assessee)
+    return event
+
+
+def subscribe_to_assessment_flow(request_data, user) -> TaskGenerator:
+    event = get_subscribed_assessment_event(request_data, user)
     return event.get_task_generator()
 
 
@@ -79,6 +92,14 @@ def get_all_active_interactive_quiz(request_data: dict, user: User):
     return event.get_released_interactive_quizzes()
 
 
+@catch_exception_and_convert_to_invalid_request_decorator(exception_types=EventDoesNotExist)
+def get_all_released_tools(request_data: dict, user: User):
+    event = utils.get_active_assessment_event_from_id(request_data.get('assessment-event-id'))
+    assessee = utils.get_assessee_from_user(user)
+    validate_user_participation(event, assessee)
+    return event.get_all_released_tools()
+
+
 def validate_is_interactive_quiz(assessment_tool):
     if assessment_tool is None:
         raise InvalidRequestException(ASSOCIATED_TOOL_NOT_FOUND)
@@ -97,7 +118,10 @@ def get_interactive_quiz_attempt(event: AssessmentEvent, quiz: InteractiveQuiz,
 
 def get_answer_options_data_submission(question):
     mc_question = MultipleChoiceQuestion.objects.get(question_id=question.question_id)
-    answer_options = mc_question.get_answer_options()
+    return serialize_answer_options_submission(mc_question.get_answer_options())
+
+
+def serialize_answer_options_submission(answer_options):
     data = []
 
     for ao in answer_options:
@@ -115,13 +139,13 @@ def combine_tool_attempt_data(tool_attempt, assessment_event_id):
     combined_data['assessment-tool-id'] = tool_attempt_data.get('assessment_tool_attempted')
     combined_data['answer-attempts'] = list()
 
-    question_attempts = tool_attempt.get_all_question_attempts()
+    question_attempts, answer_options_of_questions = tool_attempt.get_question_attempts_with_answer_options()
     for qa in question_attempts:
         question = qa.get_question()
 
         question_type = question.get_question_type()
         if question_type == 'multiple_choice':
-            mc_answer_option = MultipleChoiceAnswerOptionAttempt.objects.get(question_attempt_id=qa.question_attempt_id)
+            mc_answer_option = qa.multiplechoiceansweroptionattempt
             mc_answer_option_data = MultipleChoiceAnswerOptionAttemptSerializer(mc_answer_option).data
             mcq_dict = dict()
 
@@ -129,13 +153,15 @@ def combine_tool_attempt_data(tool_attempt, assessment_event_id):
             mcq_dict['is-answered'] = mc_answer_option_data.get('is_answered')
             mcq_dict['prompt'] = question.get_prompt()
             mcq_dict['question-type'] = question_type
-            mcq_dict['answer-options'] = get_answer_options_data_submission(question)
+            mcq_dict['answer-options'] = serialize_answer_options_submission(
+                answer_options_of_questions.get(question.question_id, [])
+            )
             mcq_dict['selected-answer-option-id'] = str(mc_answer_option_data.get('selected_option'))
 
             combined_data['answer-attempts'].append(mcq_dict)
 
         else:
-            text_question_attempt = TextQuestionAttempt.objects.get(question_attempt_id=qa.question_attempt_id)
+            text_question_attempt = qa.textquestionattempt
             tq_dict = dict()
 
             text_question_attempt_data = TextQuestionAttemptSerializer(text_question_attempt).data
@@ -315,11 +341,24 @@ def validate_submission(assessment_tool, file_name):
         raise InvalidRequestException(str(exception))
 
 
+def get_assignment_attempt_cloud_storage_file_name(event: AssessmentEvent, assignment: Assignment,
+                                                   assignment_attempt: AssignmentAttempt):
+    return f'{GOOGLE_BUCKET_BASE_DIRECTORY}/' \
+           f'{event.event_id}/' \
+           f'{assignment_attempt.tool_attempt_id}.{assignment.expected_file_format}'
+
+
+def get_assignment_upload_staging_file_name(event: AssessmentEvent, assignment: Assignment,
+                                            assignment_attempt: AssignmentAttempt, upload_id):
+    return f'{GOOGLE_BUCKET_BASE_DIRECTORY}/uploads/' \
+           f'{event.event_id}/' \
+           f'{assignment_attempt.tool_attempt_id}/' \
+           f'{upload_id}.{assignment.expected_file_format}'
+
+
 def save_assignment_attempt(event: AssessmentEvent, assignment: Assignment, assessee: Assessee, file_to_be_uploaded):
     assignment_attempt: AssignmentAttempt = get_or_create_assignment_attempt(event, assignment, assessee)
-    cloud_storage_file_name = f'{GOOGLE_BUCKET_BASE_DIRECTORY}/' \
-                              f'{event.event_id}/' \
-                              f'{assignment_attempt.tool_attempt_id}.{assignment.expected_file_format}'
+    cloud_storage_file_name = get_assignment_attempt_cloud_storage_file_name(event, assignment, assignment_attempt)
     google_storage.upload_file_to_google_bucket(
         cloud_storage_file_name,
         GOOGLE_STORAGE_BUCKET_NAME,
@@ -342,6 +381,91 @@ def submit_assignment(request_data, file, user):
     save_assignment_attempt(event, assessment_tool, assessee, file)
 
 
+def validate_direct_assignment_upload_request(request_data, user):
+    event = utils.get_active_assessment_event_from_id(request_data.get('assessment-event-id'))
+    assessee = utils.get_assessee_from_user(user)
+    validate_user_participation(event, assessee)
+    assessment_tool = \
+        event.get_assessment_tool_from_assessment_id(assessment_id=request_data.get('assessment-tool-id'))
+    validate_submission(assessment_tool, request_data.get('filename'))
+    validate_attempt_is_submittable(assessment_tool, event)
+    return event, assessee, assessment_tool
+
+
+def get_upload_content_type(file_name):
+    content_type = mimetypes.guess_type(file_name)[0]
+    if content_type is None:
+        raise InvalidRequestException(f'Content type of file {file_name} is not recognized')
+    return content_type
+
+
+def get_upload_url_expiration_in_seconds(event: AssessmentEvent, assignment: Assignment):
+    """
+    The upload URL is never valid past the submission deadline of the assignment
+    """
+    expiration_in_seconds = SIGNED_URL_EXPIRATION_IN_SECONDS
+    submission_deadline = event.get_tool_submission_deadline(assignment)
+    if submission_deadline is not None:
+        seconds_until_deadline = int((submission_deadline - datetime.datetime.now(tz=pytz.utc)).total_seconds())
+        expiration_in_seconds = min(expiration_in_seconds, max(seconds_until_deadline, 1))
+    return expiration_in_seconds
+
+
+def get_upload_id_from_request(request_data):
+    try:
+        return uuid.UUID(str(request_data.get('upload-id'))).hex
+    except ValueError:
+        raise InvalidRequestException('Upload id is invalid')
+
+
+@catch_exception_and_convert_to_invalid_request_decorator(
+    exception_types=(AssessmentToolDoesNotExist, EventDoesNotExist, ValidationError))
+def generate_assignment_upload_url(request_data, user):
+    """
+    Issues a short-lived signed URL that the assessee uses to upload the assignment file
+    directly to the storage bucket. The file is uploaded to a staging object of its own,
+    which finalize_assignment_upload moves into place after validating the submission again.
+    """
+    event, assessee, assessment_tool = validate_direct_assignment_upload_request(request_data, user)
+    content_type = get_upload_content_type(request_data.get('filename'))
+    assignment_attempt = get_or_create_assignment_attempt(event, assessment_tool, assessee)
+    upload_id = uuid.uuid4().hex
+    staging_file_name = get_assignment_upload_staging_file_name(
+        event, assessment_tool, assignment_attempt, upload_id
+    )
+    upload_url = google_storage.generate_upload_url_for_google_bucket(
+        staging_file_name,
+        GOOGLE_STORAGE_BUCKET_NAME,
+        content_type,
+        expiration_in_seconds=get_upload_url_expiration_in_seconds(event, assessment_tool)
+    )
+    return {
+        'upload_url': upload_url,
+        'upload_id': upload_id,
+        'method': 'PUT',
+        'content_type': content_type
+    }
+
+
+@catch_exception_and_convert_to_invalid_request_decorator(
+    exception_types=(AssessmentToolDoesNotExist, EventDoesNotExist, ValidationError))
+def finalize_assignment_upload(request_data, user):
+    event, assessee, assessment_tool = validate_direct_assignment_upload_request(request_data, user)
+    upload_id = get_upload_id_from_request(request_data)
+    assignment_attempt = get_or_create_assignment_attempt(event, assessment_tool, assessee)
+    staging_file_name = get_assignment_upload_staging_file_name(
+        event, assessment_tool, assignment_attempt, upload_id
+    )
+    cloud_storage_file_name = get_assignment_attempt_cloud_storage_file_name(event, assessment_tool, assignment_attempt)
+
+    if not google_storage.file_exists_in_google_bucket(staging_file_name, GOOGLE_STORAGE_BUCKET_NAME):
+        raise InvalidRequestException('Assignment file has not been uploaded')
+
+    google_storage.move_file_in_google_bucket(staging_file_name, cloud_storage_file_name, GOOGLE_STORAGE_BUCKET_NAME)
+    assignment_attempt.update_attempt_cloud_directory(cloud_storage_file_name)
+    assignment_attempt.update_file_name(request_data.get('filename'))
+
+
 def validate_tool_is_assignment(assessment_tool):
     if not isinstance(assessment_tool, Assignment):
         raise InvalidRequestException(f'Assessment tool with id {assessment_tool.assessment_id} is not an assignment')
@@ -356,7 +480,7 @@ def download_assignment_attempt(event: AssessmentEvent, assignment: Assignment,
                                   f'{event.event_id}/' \
                                   f'{assignment_attempt.tool_attempt_id}.{assignment.expected_file_format}'
         expected_content_type = mimetypes.guess_type(assignment_attempt.filename)[0]
-        downloaded_file = google_storage.download_file_from_google_bucket(
+        downloaded_file = google_storage.stream_file_from_google_bucket(
             cloud_storage_file_name,
             GOOGLE_STORAGE_BUCKET_NAME,
             assignment_attempt.filename,
@@ -368,7 +492,7 @@ def download_assignment_attempt(event: AssessmentEvent, assignment: Assignment,
 
 
 @catch_exception_and_convert_to_invalid_request_decorator(
-    exception_types=(EventDoesNotExist, AssessmentToolDoesNotExist))
+    exception_types=(EventDoesNotExist, AssessmentToolDoesNotExist, FileDoesNotExist))
 def get_submitted_assignment(request_data, user):
     event = utils.get_active_assessment_event_from_id(request_data.get('assessment-event-id'))
     assessee = utils.get_assessee_from_user(user)
@@ -380,27 +504,57 @@ def get_submitted_assignment(request_data, user):
     return downloaded_file
 
 
-def update_question_attempt(question_attempt, answer):
-    question_type = question_attempt.get_question_type()
-    if question_type == "multiple_choice":
-        answer_option_attempt = MultipleChoiceAnswerOptionAttempt.objects.get(
-            question_attempt_id=question_attempt.question_attempt_id
-        )
-        answer_option_attempt.set_selected_option(answer['answer-option-id'])
-    else:
-        text_question_attempt = TextQuestionAttempt.objects.get(
-            question_attempt_id=question_attempt.question_attempt_id
+def get_answer_option_of_question(answer_options, question_attempt, answer_option_id):
+    answer_option = answer_options.get(str(answer_option_id))
+    if answer_option is None or answer_option.question_id != question_attempt.question_id:
+        raise InvalidRequestException(
+            f'Answer option with id {answer_option_id} is not an option of question attempt '
+            f'{question_attempt.question_attempt_id}'
         )
-        text_question_attempt.set_answer(answer['text-answer'])
+    return answer_option
 
 
 @catch_exception_and_convert_to_invalid_request_decorator(
     exception_types=QuestionAttemptDoesNotExist)
 def save_answer_attempts(interactive_quiz_attempt, attempt):
-    answer_attempts = attempt['answers']
-    for answer in answer_attempts:
-        question_attempt = interactive_quiz_attempt.get_question_attempt(answer['question-attempt-id'])
-        update_question_attempt(question_attempt, answer)
+    """
+    Resolves the question attempts and the selected answer options of every answer with one query each,
+    then saves all answers in a single transaction.
+    """
+    answers = {str(answer.get('question-attempt-id')): answer for answer in attempt['answers']}
+    question_attempts = {
+        str(question_attempt.question_attempt_id): question_attempt
+        for question_attempt in interactive_quiz_attempt.get_question_attempts_from_ids(answers.keys())
+    }
+    for question_attempt_id in answers:
+        if question_attempt_id not in question_attempts:
+            raise QuestionAttemptDoesNotExist(f'Question attempt with id {question_attempt_id} does not exist')
+
+    answer_option_ids = [
+        answer.get('answer-option-id') for answer in answers.values() if answer.get('answer-option-id') is not None
+    ]
+    answer_options = {
+        str(answer_option_id): answer_option
+        for answer_option_id, answer_option in MultipleChoiceAnswerOption.objects.in_bulk(answer_option_ids).items()
+    }
+
+    selected_answer_options = []
+    text_answers = []
+    for question_attempt_id, answer in answers.items():
+        question_attempt = question_attempts[question_attempt_id]
+        if question_attempt.get_question_type() == 'multiple_choice':
+            mcq_attempt = question_attempt.multiplechoiceansweroptionattempt
+            mcq_attempt.question = question_attempt.question
+            answer_option = get_answer_option_of_question(
+                answer_options, question_attempt, answer.get('answer-option-id')
+            )
+            selected_answer_options.append((mcq_attempt, answer_option))
+        else:
+            text_question_attempt = question_attempt.textquestionattempt
+            text_question_attempt.question = question_attempt.question
+            text_answers.append((text_question_attempt, answer.get('text-answer')))
+
+    interactive_quiz_attempt.bulk_save_answers(selected_answer_options, text_answers)
 
 
 def save_interactive_quiz_attempt(event: AssessmentEvent, interactive_quiz: InteractiveQuiz, assessee: Assessee,
@@ -0,0 +1,108 @@
+import asyncio
+import datetime
+import heapq
+import itertools
+import time
+
+BEGIN_TASK_MESSAGE = b'data: BEGIN TASK\n\n'
+
+
+def format_event_stream_message(data: str, message_id: str = None) -> bytes:
+    if message_id is None:
+        return f'data: {data}\n\n'.encode('utf-8')
+    return f'id: {message_id}\ndata: {data}\n\n'.encode('utf-8')
+
+
+def get_release_message_id(assessment_id, release_date_time: datetime.datetime) -> str:
+    return f'{assessment_id}:{release_date_time.isoformat()}'
+
+
+class ScheduledRelease:
+    def __init__(self, deadline: float, callback, args: tuple):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def fire(self):
+        self.callback(*self.args)
+
+
+class ReleaseTimerWheel:
+    """
+    A single per-process timer that fires scheduled releases on the running event loop.
+    Only the earliest pending deadline is ever armed, so an idle wheel does not wake up at all.
+    """
+    def __init__(self):
+        self._timers = []
+        self._sequence = itertools.count()
+        self._armed_handle = None
+        self._armed_deadline = None
+        self._loop = None
+
+    def schedule(self, fire_at: datetime.datetime, callback, *args) -> ScheduledRelease:
+        scheduled_release = ScheduledRelease(fire_at.timestamp(), callback, args)
+        heapq.heappush(self._timers, (scheduled_release.deadline, next(self._sequence), scheduled_release))
+        self._arm()
+        return scheduled_release
+
+    def pending_count(self) -> int:
+        return sum(1 for _, _, scheduled_release in self._timers if not scheduled_release.cancelled)
+
+    def _discard_cancelled_timers(self):
+        while self._timers and self._timers[0][2].cancelled:
+            heapq.heappop(self._timers)
+
+    def _disarm(self):
+        if self._armed_handle:
+            self._armed_handle.cancel()
+        self._armed_handle = None
+        self._armed_deadline = None
+
+    def _arm(self):
+        self._discard_cancelled_timers()
+        loop = asyncio.get_running_loop()
+
+        if loop is not self._loop:
+            self._disarm()
+            self._loop = loop
+
+        if not self._timers:
+            self._disarm()
+            return
+
+        next_deadline = self._timers[0][0]
+        if self._armed_handle and self._armed_deadline == next_deadline:
+            return
+
+        self._disarm()
+        delay = max(next_deadline - time.time(), 0)
+        self._armed_handle = loop.call_later(delay, self._fire_due_timers)
+        self._armed_deadline = next_deadline
+
+    def _fire_due_timers(self):
+        self._armed_handle = None
+        self._armed_deadline = None
+        current_time = time.time()
+
+        while self._timers and self._timers[0][0] <= current_time:
+            _, _, scheduled_release = heapq.heappop(self._timers)
+            if not scheduled_release.cancelled:
+                scheduled_release.fire()
+
+        self._arm()
+
+
+class AssessmentFlowSubscription:
+    def __init__(self, event_id):
+        self.event_id = event_id
+        self._messages = asyncio.Queue()
+
+    def deliver(self, message: bytes):
+        self._messages.put_nowait(message)
+
+    async def next_message(self) -> bytes:
+        return await self._messages.get()
@@ -1,6 +1,45 @@
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.conf import settings
+from django.urls import reverse
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.http import urlencode
+from django.utils.module_loading import import_string
 from google.cloud import storage
+from ..exceptions.exceptions import FileDoesNotExist
+import datetime
 import os
+import shutil
+import threading
+import time
+
+
+FILE_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+FILE_DOES_NOT_EXIST = 'File {} does not exist'
+
+
+class StreamedFile:
+    """
+    A stored file that is read in fixed-size chunks instead of being loaded into memory.
+    open_file must return a seekable binary file object.
+    """
+    def __init__(self, name, content_type, size, open_file, chunk_size=FILE_DOWNLOAD_CHUNK_SIZE):
+        self.name = name
+        self.content_type = content_type
+        self.size = size
+        self.open_file = open_file
+        self.chunk_size = chunk_size
+
+    def iter_chunks(self, start=0, end=None):
+        end = self.size - 1 if end is None else end
+        remaining_bytes = end - start + 1
+
+        with self.open_file() as file:
+            file.seek(start)
+            while remaining_bytes > 0:
+                chunk = file.read(min(self.chunk_size, remaining_bytes))
+                if not chunk:
+                    break
+                remaining_bytes -= len(chunk)
+                yield chunk
 
 
 def setup_google_storage_credentials():
@@ -14,17 +53,196 @@ def setup_google_storage_credentials():
         os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = 'storage-credentials.json'
 
 
+class GoogleCloudStorageBackend:
+    """
+    Keeps one storage client and one bucket handle per bucket for the whole process.
+    Bucket handles are created without fetching the bucket metadata.
+    """
+    def __init__(self):
+        self.client = None
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def get_client(self):
+        if self.client is None:
+            with self.lock:
+                if self.client is None:
+                    self.client = storage.Client()
+        return self.client
+
+    def get_bucket(self, bucket_name):
+        bucket = self.buckets.get(bucket_name)
+        if bucket is None:
+            bucket = self.get_client().bucket(bucket_name)
+            self.buckets[bucket_name] = bucket
+        return bucket
+
+    def upload_file(self, destination_file_name, bucket_name, file):
+        blob = self.get_bucket(bucket_name).blob(destination_file_name)
+        blob.upload_from_file(file_obj=file, rewind=True)
+
+    def stream_file(self, file_cloud_directory, bucket_name, target_file_name, content_type) -> StreamedFile:
+        blob = self.get_bucket(bucket_name).get_blob(file_cloud_directory)
+        if blob is None:
+            raise FileDoesNotExist(FILE_DOES_NOT_EXIST.format(target_file_name))
+
+        return StreamedFile(
+            target_file_name,
+            content_type,
+            blob.size,
+            open_file=lambda: blob.open('rb', chunk_size=FILE_DOWNLOAD_CHUNK_SIZE)
+        )
+
+    def file_exists(self, file_cloud_directory, bucket_name) -> bool:
+        return self.get_bucket(bucket_name).blob(file_cloud_directory).exists()
+
+    def move_file(self, source_file_name, destination_file_name, bucket_name):
+        bucket = self.get_bucket(bucket_name)
+        bucket.rename_blob(bucket.blob(source_file_name), destination_file_name)
+
+    def generate_upload_url(self, destination_file_name, bucket_name, content_type, expiration_in_seconds=None):
+        blob = self.get_bucket(bucket_name).blob(destination_file_name)
+        return blob.generate_signed_url(
+            version='v4',
+            expiration=datetime.timedelta(seconds=expiration_in_seconds or settings.SIGNED_URL_EXPIRATION_IN_SECONDS),
+            method='PUT',
+            content_type=content_type
+        )
+
+    def generate_download_url(self, file_cloud_directory, bucket_name, target_file_name, content_type):
+        blob = self.get_bucket(bucket_name).blob(file_cloud_directory)
+        return blob.generate_signed_url(
+            version='v4',
+            expiration=datetime.timedelta(seconds=settings.SIGNED_URL_EXPIRATION_IN_SECONDS),
+            method='GET',
+            response_disposition=f'attachment; filename="{target_file_name}"',
+            response_type=content_type
+        )
+
+
+class LocalFileSystemStorageBackend:
+    """
+    Stores the files of every bucket under settings.LOCAL_FILE_STORAGE_ROOT.
+    Used for development, tests and offline benchmarks of the upload and download paths.
+    """
+    def __init__(self, root_directory=None):
+        self.root_directory = root_directory or settings.LOCAL_FILE_STORAGE_ROOT
+
+    def get_file_path(self, file_cloud_directory, bucket_name):
+        return os.path.join(self.root_directory, bucket_name or '', file_cloud_directory.lstrip('/'))
+
+    def upload_file(self, destination_file_name, bucket_name, file):
+        file_path = self.get_file_path(destination_file_name, bucket_name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        file.seek(0)
+        with open(file_path, mode='wb') as stored_file:
+            shutil.copyfileobj(file, stored_file, FILE_DOWNLOAD_CHUNK_SIZE)
+
+    def stream_file(self, file_cloud_directory, bucket_name, target_file_name, content_type) -> StreamedFile:
+        file_path = self.get_file_path(file_cloud_directory, bucket_name)
+        if not os.path.isfile(file_path):
+            raise FileDoesNotExist(FILE_DOES_NOT_EXIST.format(target_file_name))
+
+        return StreamedFile(
+            target_file_name,
+            content_type,
+            os.path.getsize(file_path),
+            open_file=lambda: open(file_path, mode='rb')
+        )
+
+    def file_exists(self, file_cloud_directory, bucket_name) -> bool:
+        return os.path.isfile(self.get_file_path(file_cloud_directory, bucket_name))
+
+    def move_file(self, source_file_name, destination_file_name, bucket_name):
+        destination_file_path = self.get_file_path(destination_file_name, bucket_name)
+        os.makedirs(os.path.dirname(destination_file_path), exist_ok=True)
+        os.replace(self.get_file_path(source_file_name, bucket_name), destination_file_path)
+
+    def generate_signed_url(self, method, file_cloud_directory, bucket_name, expiration_in_seconds=None,
+                            **extra_parameters):
+        expires = int(time.time()) + (expiration_in_seconds or settings.SIGNED_URL_EXPIRATION_IN_SECONDS)
+        url_parameters = dict(
+            extra_parameters, method=method, bucket=bucket_name or '', path=file_cloud_directory, expires=expires
+        )
+        url_parameters['signature'] = get_local_url_signature(url_parameters)
+        return f'{reverse("local-storage-file")}?{urlencode(url_parameters)}'
+
+    def generate_upload_url(self, destination_file_name, bucket_name, content_type, expiration_in_seconds=None):
+        return self.generate_signed_url(
+            'PUT', destination_file_name, bucket_name, expiration_in_seconds, content_type=content_type or ''
+        )
+
+    def generate_download_url(self, file_cloud_directory, bucket_name, target_file_name, content_type):
+        return self.generate_signed_url(
+            'GET', file_cloud_directory, bucket_name, filename=target_file_name, content_type=content_type or ''
+        )
+
+
+def get_local_url_signature(url_parameters: dict) -> str:
+    signed_value = '\n'.join(
+        f'{key}={url_parameters[key]}' for key in sorted(url_parameters) if key != 'signature'
+    )
+    return salted_hmac('assessment.local-storage', signed_value, algorithm='sha256').hexdigest()
+
+
+def verify_local_url_signature(url_parameters: dict, method) -> bool:
+    """
+    A local storage URL is valid when its signature matches its parameters,
+    it is used with the method it was signed for and it has not expired.
+    """
+    signature = url_parameters.get('signature', '')
+    try:
+        expires = int(url_parameters.get('expires', ''))
+    except ValueError:
+        return False
+
+    return constant_time_compare(signature, get_local_url_signature(url_parameters)) \
+        and url_parameters.get('method') == method \
+        and expires >= time.time()
+
+
+storage_backend = None
+storage_backend_lock = threading.Lock()
+
+
+def get_storage_backend():
+    global storage_backend
+    if storage_backend is None:
+        with storage_backend_lock:
+            if storage_backend is None:
+                storage_backend = import_string(settings.FILE_STORAGE_BACKEND)()
+    return storage_backend
+
+
+def reset_storage_backend():
+    global storage_backend
+    storage_backend = None
+
+
 def upload_file_to_google_bucket(destination_file_name, bucket_name, file):
-    storage_client = storage.Client()
-    bucket = storage_client.get_bucket(bucket_name)
-    blob = bucket.blob(destination_file_name)
-    blob.upload_from_file(file_obj=file, rewind=True)
-
-
-def download_file_from_google_bucket(file_cloud_directory, bucket_name, target_file_name, content_type):
-    storage_client = storage.Client()
-    bucket = storage_client.get_bucket(bucket_name)
-    blob = bucket.get_blob(file_cloud_directory)
-    file_bytes = blob.download_as_bytes()
-    file_to_store_download = SimpleUploadedFile(target_file_name, file_bytes, content_type=content_type)
-    return file_to_store_download
+    get_storage_backend().upload_file(destination_file_name, bucket_name, file)
+
+
+def stream_file_from_google_bucket(file_cloud_directory, bucket_name, target_file_name, content_type) -> StreamedFile:
+    return get_storage_backend().stream_file(file_cloud_directory, bucket_name, target_file_name, content_type)
+
+
+def file_exists_in_google_bucket(file_cloud_directory, bucket_name) -> bool:
+    return get_storage_backend().file_exists(file_cloud_directory, bucket_name)
+
+
+def move_file_in_google_bucket(source_file_name, destination_file_name, bucket_name):
+    get_storage_backend().move_file(source_file_name, destination_file_name, bucket_name)
+
+
+def generate_upload_url_for_google_bucket(destination_file_name, bucket_name, content_type,
+                                          expiration_in_seconds=None):
+    return get_storage_backend().generate_upload_url(
+        destination_file_name, bucket_name, content_type, expiration_in_seconds
+    )
+
+
+def generate_download_url_for_google_bucket(file_cloud_directory, bucket_name, target_file_name, content_type):
+    return get_storage_backend().generate_download_url(
+        file_cloud_directory, bucket_name, target_file_name, content_type
+    )
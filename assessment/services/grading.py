@@ -1,7 +1,8 @@
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import models, transaction
 from one_day_intern.decorators import catch_exception_and_convert_to_invalid_request_decorator
 from one_day_intern.exceptions import InvalidRequestException, RestrictedAccessException
-from one_day_intern.settings import GOOGLE_STORAGE_BUCKET_NAME
+from one_day_intern.settings import GOOGLE_STORAGE_BUCKET_NAME, BULK_GRADING_MAX_ENTRIES
 from users.services import utils as user_utils
 from ..models import (
     AssignmentAttempt,
@@ -15,11 +16,13 @@ from ..models import (
     MultipleChoiceAnswerOptionSerializer,
     MultipleChoiceQuestion,
     ResponseTestAttempt,
-    Question
+    Question,
+    ToolAttempt
 )
 from .participation_validators import validate_assessor_participation
 from . import utils, google_storage
 import mimetypes
+import uuid
 
 
 def validate_grade_assessment_tool_request(request_data):
@@ -85,7 +88,7 @@ def download_assignment_attempt(assignment_attempt: AssignmentAttempt):
     if assignment_attempt.get_attempt_cloud_directory() is not None:
         cloud_storage_file_name = assignment_attempt.get_attempt_cloud_directory()
         expected_content_type = mimetypes.guess_type(assignment_attempt.get_file_name())[0]
-        download_file = google_storage.download_file_from_google_bucket(
+        download_file = google_storage.stream_file_from_google_bucket(
             cloud_storage_file_name,
             GOOGLE_STORAGE_BUCKET_NAME,
             assignment_attempt.get_file_name(),
@@ -107,6 +110,26 @@ def get_assignment_attempt_file(request_data, user):
     return downloaded_file
 
 
+@catch_exception_and_convert_to_invalid_request_decorator(exception_types=ObjectDoesNotExist)
+def get_assignment_attempt_file_url(request_data, user):
+    tool_attempt = utils.get_tool_attempt_from_id(request_data.get('tool-attempt-id'))
+    validate_tool_attempt_is_for_assignment(tool_attempt)
+    assessor = get_assessor_or_raise_exception(user)
+    event = tool_attempt.get_event_of_attempt()
+    assessee = tool_attempt.get_user_of_attempt()
+    validate_assessor_responsibility(event, assessor, assessee)
+
+    if tool_attempt.get_attempt_cloud_directory() is None:
+        return None
+
+    return google_storage.generate_download_url_for_google_bucket(
+        tool_attempt.get_attempt_cloud_directory(),
+        GOOGLE_STORAGE_BUCKET_NAME,
+        tool_attempt.get_file_name(),
+        mimetypes.guess_type(tool_attempt.get_file_name())[0]
+    )
+
+
 def validate_tool_attempt_is_for_interactive_quiz(tool_attempt):
     if not isinstance(tool_attempt, InteractiveQuizAttempt):
         raise InvalidRequestException(f'Attempt with id {tool_attempt.tool_attempt_id} is not an interactive quiz')
@@ -120,23 +143,16 @@ def set_multiple_choice_question_attempt_grade(mcq_attempt: MultipleChoiceAnswer
         mcq_attempt.set_note(request_data.get('note'))
 
 
-def set_text_question_attempt_grade(tool_attempt, question_attempt: TextQuestionAttempt, request_data):
+def set_text_question_attempt_grade(question_attempt: TextQuestionAttempt, request_data):
     if request_data.get('grade'):
-        previous_points = question_attempt.get_point()
         question_attempt.set_point(request_data.get('grade'))
-        if question_attempt.get_is_graded():
-            tool_attempt.update_points(previous_points, request_data.get('grade'))
-        else:
-            tool_attempt.accumulate_points(request_data.get('grade'))
-            question_attempt.set_is_graded()
-        question_attempt.awarded_points = request_data.get('grade')
-        question_attempt.save()
+        question_attempt.set_awarded_points(request_data.get('grade'))
 
     if request_data.get('note'):
         question_attempt.set_note(request_data.get('note'))
 
 
-def set_question_attempt_grade(tool_attempt, request_data):
+def set_question_attempt_grade(request_data):
     qtype = QuestionAttempt.objects.get(question_attempt_id=request_data.get('question-attempt-id')).get_question_type()
 
     if qtype == 'multiple_choice':
@@ -147,7 +163,7 @@ def set_question_attempt_grade(tool_attempt, request_data):
 
     else:
         question_attempt = TextQuestionAttempt.objects.get(question_attempt_id=request_data.get('question-attempt-id'))
-        set_text_question_attempt_grade(tool_attempt, question_attempt, request_data)
+        set_text_question_attempt_grade(question_attempt, request_data)
 
 
 @catch_exception_and_convert_to_invalid_request_decorator(exception_types=ObjectDoesNotExist)
@@ -160,7 +176,7 @@ def grade_interactive_quiz_individual_question(request_data, user):
     validate_assessor_participation(event, assessor)
     assessee = tool_attempt.get_user_of_attempt()
     validate_assessor_responsibility(event, assessor, assessee)
-    set_question_attempt_grade(tool_attempt, request_data)
+    set_question_attempt_grade(request_data)
     iq_attempt: InteractiveQuizAttempt = InteractiveQuizAttempt.objects.get(tool_attempt_id=tool_attempt.tool_attempt_id)
     iq_attempt.calculate_total_points()
     return request_data.get('grade'), request_data.get('note')
@@ -189,7 +205,10 @@ def grade_interactive_quiz(request_data, user):
 
 def get_answer_options_data_grading(question):
     mc_question = MultipleChoiceQuestion.objects.get(question_id=question.question_id)
-    answer_options = mc_question.get_answer_options()
+    return serialize_answer_options_grading(mc_question.get_answer_options())
+
+
+def serialize_answer_options_grading(answer_options):
     data = []
 
     for ao in answer_options:
@@ -210,13 +229,13 @@ def combine_tool_grading_data(tool_attempt):
     combined_data['note'] = tool_attempt_data.get('note')
     combined_data['answer-attempts'] = list()
 
-    question_attempts = tool_attempt.get_all_question_attempts()
+    question_attempts, answer_options_of_questions = tool_attempt.get_question_attempts_with_answer_options()
     for qa in question_attempts:
         question = qa.get_question()
 
         question_type = question.get_question_type()
         if question_type == 'multiple_choice':
-            mc_answer_option = MultipleChoiceAnswerOptionAttempt.objects.get(question_attempt_id=qa.question_attempt_id)
+            mc_answer_option = qa.multiplechoiceansweroptionattempt
             mc_answer_option_data = MultipleChoiceAnswerOptionAttemptSerializer(mc_answer_option).data
             mcq_dict = dict()
 
@@ -227,14 +246,16 @@ def combine_tool_grading_data(tool_attempt):
             mcq_dict['grade'] = str(mc_answer_option_data.get('point'))
             mcq_dict['question-points'] = str(question.get_points())
             mcq_dict['question-type'] = question_type
-            mcq_dict['answer-options'] = get_answer_options_data_grading(question)
+            mcq_dict['answer-options'] = serialize_answer_options_grading(
+                answer_options_of_questions.get(question.question_id, [])
+            )
             mcq_dict['selected-answer-option-id'] = str(mc_answer_option_data.get('selected_option'))
             mcq_dict['is-correct'] = mc_answer_option_data.get('is_correct')
 
             combined_data['answer-attempts'].append(mcq_dict)
 
         else:
-            text_question_attempt = TextQuestionAttempt.objects.get(question_attempt_id=qa.question_attempt_id)
+            text_question_attempt = qa.textquestionattempt
             tq_dict = dict()
 
             text_question_attempt_data = TextQuestionAttemptSerializer(text_question_attempt).data
@@ -246,7 +267,7 @@ def combine_tool_grading_data(tool_attempt):
             tq_dict['note'] = qa.get_note()
             tq_dict['question-type'] = question_type
             tq_dict['answer'] = text_question_attempt_data.get('answer')
-            tq_dict['answer-key'] = text_question_attempt.get_answer_key()
+            tq_dict['answer-key'] = question.textquestion.answer_key
             tq_dict['is-graded'] = text_question_attempt_data.get('is_graded')
             tq_dict['awarded-points'] = text_question_attempt_data.get('awarded_points')
 
@@ -335,3 +356,194 @@ def get_response_test_attempt_data(request_data, user):
     assessee = tool_attempt.get_user_of_attempt()
     validate_assessor_responsibility(event, assessor, assessee)
     return tool_attempt
+
+
+def get_bulk_grade_entry_attempt_id(grade_entry, id_field):
+    try:
+        return str(uuid.UUID(str(grade_entry.get(id_field))))
+    except ValueError:
+        raise InvalidRequestException(f'{grade_entry.get(id_field)} is not a valid {id_field}')
+
+
+def validate_bulk_grade_entry(grade_entry):
+    if not isinstance(grade_entry, dict):
+        raise InvalidRequestException('Each grade entry must be an object')
+    if (grade_entry.get('tool-attempt-id') is None) == (grade_entry.get('question-attempt-id') is None):
+        raise InvalidRequestException('Each grade entry must have either a tool attempt id or a question attempt id')
+    if grade_entry.get('grade') is not None and not isinstance(grade_entry.get('grade'), (float, int)):
+        raise InvalidRequestException('Grade must be an integer or a floating point number')
+    if grade_entry.get('note') is not None and not isinstance(grade_entry.get('note'), str):
+        raise InvalidRequestException('Note must be a string')
+    if grade_entry.get('is_correct') is not None and not isinstance(grade_entry.get('is_correct'), bool):
+        raise InvalidRequestException('Is correct must be a boolean')
+
+
+def validate_bulk_grade_request(request_data):
+    grade_entries = request_data.get('grades')
+    if not isinstance(grade_entries, list) or not grade_entries:
+        raise InvalidRequestException('Grades must be a non-empty list')
+    if len(grade_entries) > BULK_GRADING_MAX_ENTRIES:
+        raise InvalidRequestException(f'At most {BULK_GRADING_MAX_ENTRIES} grades can be saved at once')
+
+    graded_attempt_ids = set()
+    for grade_entry in grade_entries:
+        validate_bulk_grade_entry(grade_entry)
+        id_field = 'tool-attempt-id' if grade_entry.get('tool-attempt-id') is not None else 'question-attempt-id'
+        attempt_id = get_bulk_grade_entry_attempt_id(grade_entry, id_field)
+        if attempt_id in graded_attempt_ids:
+            raise InvalidRequestException(f'Attempt with id {attempt_id} is graded more than once')
+        graded_attempt_ids.add(attempt_id)
+
+
+def split_bulk_grade_entries(grade_entries) -> (dict, dict):
+    tool_attempt_grades = dict()
+    question_attempt_grades = dict()
+    for grade_entry in grade_entries:
+        if grade_entry.get('tool-attempt-id') is not None:
+            tool_attempt_grades[get_bulk_grade_entry_attempt_id(grade_entry, 'tool-attempt-id')] = grade_entry
+        else:
+            question_attempt_grades[get_bulk_grade_entry_attempt_id(grade_entry, 'question-attempt-id')] = grade_entry
+    return tool_attempt_grades, question_attempt_grades
+
+
+def validate_attempts_are_graded_by_assessor(requested_attempt_ids, found_attempts: dict, assessor):
+    missing_attempt_ids = [attempt_id for attempt_id in requested_attempt_ids if attempt_id not in found_attempts]
+    if missing_attempt_ids:
+        raise RestrictedAccessException(
+            f'Attempts with ids {", ".join(missing_attempt_ids)} do not exist or are not graded by {assessor}'
+        )
+
+
+def get_tool_attempts_graded_by_assessor(tool_attempt_ids, assessor) -> dict:
+    """
+    Authorises every tool attempt with one query, by only selecting the attempts of the assessees
+    the assessor is responsible for. The rows are locked until the grades are saved.
+    """
+    if not tool_attempt_ids:
+        return dict()
+
+    tool_attempts = ToolAttempt.objects.non_polymorphic().select_for_update(of=('self',)).filter(
+        tool_attempt_id__in=tool_attempt_ids,
+        test_flow_attempt__event_participation__assessor=assessor
+    )
+    found_tool_attempts = {str(tool_attempt.tool_attempt_id): tool_attempt for tool_attempt in tool_attempts}
+    validate_attempts_are_graded_by_assessor(tool_attempt_ids, found_tool_attempts, assessor)
+    return found_tool_attempts
+
+
+def get_question_attempts_graded_by_assessor(question_attempt_ids, assessor) -> dict:
+    """
+    Authorises every question attempt with one query, which also loads their question and concrete attempt type.
+    The concrete attempts read their question through the loaded parent, so grading them adds no query per attempt.
+    The rows are locked until the grades and the points of their quiz attempts are saved.
+    """
+    if not question_attempt_ids:
+        return dict()
+
+    question_attempts = QuestionAttempt.objects.select_for_update(of=('self',)).select_related(
+        'question',
+        'textquestionattempt',
+        'multiplechoiceansweroptionattempt'
+    ).filter(
+        question_attempt_id__in=question_attempt_ids,
+        interactive_quiz_attempt__test_flow_attempt__event_participation__assessor=assessor
+    )
+    found_question_attempts = {
+        str(question_attempt.question_attempt_id): question_attempt for question_attempt in question_attempts
+    }
+    validate_attempts_are_graded_by_assessor(question_attempt_ids, found_question_attempts, assessor)
+    return found_question_attempts
+
+
+def set_bulk_tool_attempt_grades(tool_attempts: dict, tool_attempt_grades: dict):
+    for tool_attempt_id, grade_entry in tool_attempt_grades.items():
+        tool_attempt = tool_attempts[tool_attempt_id]
+        if grade_entry.get('grade') is not None:
+            tool_attempt.grade = grade_entry.get('grade')
+        if grade_entry.get('note') is not None:
+            tool_attempt.note = grade_entry.get('note')
+
+    ToolAttempt.objects.bulk_update(tool_attempts.values(), ['grade', 'note'])
+
+
+def set_bulk_question_attempt_grades(question_attempts: dict, question_attempt_grades: dict) -> dict:
+    """
+    Saves the grades of the question attempts with one batched update per table.
+    Returns the change of the auto and manual points of every affected quiz attempt.
+    """
+    text_question_attempts = []
+    mcq_attempts = []
+    points_differences = dict()
+
+    for question_attempt_id, grade_entry in question_attempt_grades.items():
+        question_attempt = question_attempts[question_attempt_id]
+        quiz_points_differences = points_differences.setdefault(
+            question_attempt.interactive_quiz_attempt_id, {'auto_points': 0, 'manual_points': 0}
+        )
+        if grade_entry.get('note') is not None:
+            question_attempt.question_note = grade_entry.get('note')
+
+        if question_attempt.question.get_question_type() == 'multiple_choice':
+            mcq_attempt = question_attempt.multiplechoiceansweroptionattempt
+            if grade_entry.get('is_correct') is not None:
+                previous_contributed_points = mcq_attempt.get_contributed_points()
+                mcq_attempt.is_correct = grade_entry.get('is_correct')
+                quiz_points_differences['auto_points'] += \
+                    mcq_attempt.get_contributed_points() - previous_contributed_points
+                mcq_attempts.append(mcq_attempt)
+
+        else:
+            text_question_attempt = question_attempt.textquestionattempt
+            grade = grade_entry.get('grade')
+            if grade is not None:
+                if grade > question_attempt.question.get_points() or grade < 0:
+                    raise InvalidRequestException('Cannot give points outside of constraint')
+                previous_contributed_points = text_question_attempt.get_contributed_points()
+                question_attempt.point = grade
+                text_question_attempt.awarded_points = grade
+                text_question_attempt.is_graded = True
+                quiz_points_differences['manual_points'] += \
+                    text_question_attempt.get_contributed_points() - previous_contributed_points
+                text_question_attempts.append(text_question_attempt)
+
+    QuestionAttempt.objects.bulk_update(question_attempts.values(), ['point', 'question_note'])
+    TextQuestionAttempt.objects.bulk_update(text_question_attempts, ['awarded_points', 'is_graded'])
+    MultipleChoiceAnswerOptionAttempt.objects.bulk_update(mcq_attempts, ['is_correct'])
+    return points_differences
+
+
+def recalculate_interactive_quiz_attempt_grades(points_differences: dict) -> dict:
+    for quiz_attempt_id, quiz_points_differences in points_differences.items():
+        if any(quiz_points_differences.values()):
+            InteractiveQuizAttempt.objects.filter(tool_attempt_id=quiz_attempt_id).update(**{
+                points_field: models.F(points_field) + points_difference
+                for points_field, points_difference in quiz_points_differences.items()
+            })
+
+    quiz_attempts = InteractiveQuizAttempt.objects.filter(tool_attempt_id__in=points_differences.keys())
+    return {str(quiz_attempt.tool_attempt_id): quiz_attempt.calculate_total_points() for quiz_attempt in quiz_attempts}
+
+
+@catch_exception_and_convert_to_invalid_request_decorator(exception_types=ObjectDoesNotExist)
+def bulk_grade_attempts(request_data, user):
+    """
+    Saves the grades and notes of many tool attempts and interactive quiz question attempts in one transaction.
+    Every attempt must belong to an assessee the assessor is responsible for, otherwise nothing is saved.
+    The grade of every affected interactive quiz attempt is recalculated once from its points.
+    """
+    validate_bulk_grade_request(request_data)
+    assessor = get_assessor_or_raise_exception(user)
+    tool_attempt_grades, question_attempt_grades = split_bulk_grade_entries(request_data.get('grades'))
+
+    with transaction.atomic():
+        tool_attempts = get_tool_attempts_graded_by_assessor(list(tool_attempt_grades.keys()), assessor)
+        question_attempts = get_question_attempts_graded_by_assessor(list(question_attempt_grades.keys()), assessor)
+        set_bulk_tool_attempt_grades(tool_attempts, tool_attempt_grades)
+        points_differences = set_bulk_question_attempt_grades(question_attempts, question_attempt_grades)
+        interactive_quiz_grades = recalculate_interactive_quiz_attempt_grades(points_differences)
+
+    return {
+        'graded_tool_attempts': list(tool_attempt_grades.keys()),
+        'graded_question_attempts': list(question_attempt_grades.keys()),
+        'interactive_quiz_grades': interactive_quiz_grades
+    }
@@ -0,0 +1,140 @@
+from django.utils.module_loading import import_string
+from one_day_intern import settings
+from .assessment_flow_subscription import (
+    AssessmentFlowSubscription,
+    ReleaseTimerWheel,
+    BEGIN_TASK_MESSAGE,
+    format_event_stream_message,
+    get_release_message_id
+)
+import datetime
+import json
+import pytz
+
+
+class LocalReleaseBrokerBackend:
+    """
+    Delivers published releases to the subscribers connected to the current process.
+    """
+    def __init__(self):
+        self.subscribers = {}
+
+    def add_subscriber(self, event_id, subscription: AssessmentFlowSubscription):
+        self.subscribers.setdefault(event_id, set()).add(subscription)
+
+    def remove_subscriber(self, event_id, subscription: AssessmentFlowSubscription):
+        event_subscribers = self.subscribers.get(event_id, set())
+        event_subscribers.discard(subscription)
+        if not event_subscribers:
+            self.subscribers.pop(event_id, None)
+
+    def get_subscriber_count(self, event_id) -> int:
+        return len(self.subscribers.get(event_id, set()))
+
+    def publish(self, event_id, message: bytes):
+        for subscription in self.subscribers.get(event_id, set()):
+            subscription.deliver(message)
+
+
+class ChannelRelease:
+    def __init__(self, release_date_time: datetime.datetime, assessment_id, assessment_data: dict):
+        self.release_date_time = release_date_time
+        self.message_id = get_release_message_id(assessment_id, release_date_time)
+        message_data = dict(assessment_data, id=self.message_id)
+        self.message = format_event_stream_message(json.dumps(message_data), message_id=self.message_id)
+        self.is_released = False
+
+
+class EventReleaseChannel:
+    def __init__(self, event_id, releases: list):
+        self.event_id = event_id
+        self.releases = sorted(releases, key=lambda release: release.release_date_time)
+        self.scheduled_releases = []
+
+    def get_replay_message(self, last_event_id: str = None) -> bytes:
+        """
+        Returns every release that has been published after the release with id
+        last_event_id as a single burst. When last_event_id is not given or is unknown,
+        every release that has been published so far is replayed.
+        """
+        released = [release for release in self.releases if release.is_released]
+        released_message_ids = [release.message_id for release in released]
+
+        if last_event_id in released_message_ids:
+            released = released[released_message_ids.index(last_event_id) + 1:]
+
+        return b''.join(release.message for release in released)
+
+    def close(self):
+        for scheduled_release in self.scheduled_releases:
+            scheduled_release.cancel()
+
+
+class ReleaseBroker:
+    """
+    Keeps one release schedule per assessment event. Each release is serialized once
+    and published through the backend to every assessee subscribed to the event.
+    Releases carry a deterministic id so that a reconnecting subscriber can resume
+    from the last release it has received.
+    """
+    def __init__(self, backend=None, timer_wheel: ReleaseTimerWheel = None):
+        self.backend = backend or LocalReleaseBrokerBackend()
+        self.timer_wheel = timer_wheel or ReleaseTimerWheel()
+        self.channels = {}
+
+    def has_channel(self, event_id) -> bool:
+        return event_id in self.channels
+
+    def open_channel(self, event_id, releases: list):
+        """
+        releases is a list of (release_date_time, assessment_id, assessment_data) tuples.
+        Releases whose time has already passed are only replayed to new subscribers.
+        """
+        if self.has_channel(event_id):
+            return
+
+        channel = EventReleaseChannel(event_id, [ChannelRelease(*release) for release in releases])
+        current_time = datetime.datetime.now(tz=pytz.utc)
+
+        for release in channel.releases:
+            if release.release_date_time > current_time:
+                scheduled_release = self.timer_wheel.schedule(
+                    release.release_date_time, self.publish_release, event_id, release
+                )
+                channel.scheduled_releases.append(scheduled_release)
+            else:
+                release.is_released = True
+
+        self.channels[event_id] = channel
+
+    def subscribe(self, event_id, last_event_id: str = None) -> AssessmentFlowSubscription:
+        subscription = AssessmentFlowSubscription(event_id)
+        replay_message = b''
+        if self.has_channel(event_id):
+            replay_message = self.channels[event_id].get_replay_message(last_event_id)
+
+        subscription.deliver(BEGIN_TASK_MESSAGE + replay_message)
+
+        self.backend.add_subscriber(event_id, subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: AssessmentFlowSubscription):
+        event_id = subscription.event_id
+        self.backend.remove_subscriber(event_id, subscription)
+
+        if self.backend.get_subscriber_count(event_id) == 0 and self.has_channel(event_id):
+            self.channels.pop(event_id).close()
+
+    def get_subscriber_count(self, event_id) -> int:
+        return self.backend.get_subscriber_count(event_id)
+
+    def publish_release(self, event_id, release: ChannelRelease):
+        release.is_released = True
+        self.backend.publish(event_id, release.message)
+
+
+def get_release_broker_backend():
+    return import_string(settings.ASSESSMENT_RELEASE_BROKER_BACKEND)()
+
+
+release_broker = ReleaseBroker(backend=get_release_broker_backend())
@@ -0,0 +1,211 @@
+from django.core.cache import cache
+from one_day_intern import settings
+from typing import Callable, List, NamedTuple, Optional, Tuple
+import copy
+import datetime
+import pytz
+import uuid
+
+TIME_BOUND_TOOL_TYPES = ('assignment', 'interactivequiz')
+RELEASED_DATA_TOOL_TYPES = TIME_BOUND_TOOL_TYPES + ('responsetest',)
+ALWAYS_SUBMITTABLE_TOOL_TYPES = ('responsetest',)
+RELEASE_SCHEDULE_CACHE_KEY = 'test-flow-release-schedule:{test_flow_id}:{schedule_version}'
+
+_compiled_release_schedules = {}
+
+
+class ScheduledTool(NamedTuple):
+    assessment_id: uuid.UUID
+    tool_type: str
+    tool_data: dict
+    release_time: datetime.time
+    start_working_time: datetime.time
+    duration_in_minutes: Optional[int]
+
+    @classmethod
+    def from_test_flow_tool(cls, test_flow_tool) -> 'ScheduledTool':
+        assessment_tool = test_flow_tool.assessment_tool
+        return cls(
+            assessment_id=assessment_tool.assessment_id,
+            tool_type=assessment_tool.get_type(),
+            tool_data=assessment_tool.get_tool_data(),
+            release_time=test_flow_tool.release_time,
+            start_working_time=test_flow_tool.start_working_time,
+            duration_in_minutes=getattr(assessment_tool, 'duration_in_minutes', None)
+        )
+
+    def get_tool_data(self) -> dict:
+        return copy.deepcopy(self.tool_data)
+
+    def get_release_date_time_on_event_date(self, event_date: datetime.date) -> datetime.datetime:
+        return datetime.datetime.combine(event_date, self.release_time, tzinfo=pytz.utc)
+
+    def get_end_working_time_if_executed_on_event_date(self, start_time: datetime.time, event_date):
+        end_working_time = datetime.datetime(
+            event_date.year,
+            event_date.month,
+            event_date.day,
+            start_time.hour,
+            start_time.minute,
+            start_time.second,
+            tzinfo=pytz.utc
+        )
+        return end_working_time + datetime.timedelta(minutes=self.duration_in_minutes)
+
+    def get_iso_release_time_on_event_date(self, execution_date) -> str:
+        release_time = datetime.datetime(
+            year=execution_date.year,
+            month=execution_date.month,
+            day=execution_date.day,
+            hour=self.release_time.hour,
+            minute=self.release_time.minute
+        )
+        return release_time.isoformat()
+
+    def get_released_tool_data(self, execution_date: datetime.date = None) -> dict:
+        released_data = self.get_tool_data()
+        released_data['id'] = str(self.assessment_id)
+
+        if self.tool_type in RELEASED_DATA_TOOL_TYPES:
+            released_data['released_time'] = self.get_iso_release_time_on_event_date(execution_date)
+
+        if self.tool_type in TIME_BOUND_TOOL_TYPES:
+            released_data['end_working_time'] = self.get_end_working_time_if_executed_on_event_date(
+                start_time=self.release_time,
+                event_date=execution_date
+            ).isoformat()
+
+        return released_data
+
+    def release_time_has_passed_on_event_day(self, event_day: datetime.date, current_date_time: datetime.datetime):
+        return current_date_time.date() == event_day and self.release_time <= current_date_time.time()
+
+    def get_submission_window(self, event_date: datetime.date) -> Optional[List[float]]:
+        """
+        Returns the [release, deadline] POSIX timestamps of the tool on the event date,
+        or None when the tool accepts submissions at any time.
+        Submissions are only accepted on the event day itself, so the deadline never passes its end.
+        """
+        if self.tool_type not in TIME_BOUND_TOOL_TYPES:
+            return None
+
+        release_date_time = self.get_release_date_time_on_event_date(event_date)
+        tool_end_time = self.get_end_working_time_if_executed_on_event_date(self.start_working_time, event_date)
+        tool_deadline = tool_end_time + datetime.timedelta(seconds=settings.SUBMISSION_BUFFER_TIME_IN_SECONDS)
+        event_day_end = datetime.datetime.combine(
+            event_date + datetime.timedelta(days=1), datetime.time(), tzinfo=pytz.utc
+        ) - datetime.timedelta(microseconds=1)
+        return [release_date_time.timestamp(), min(tool_deadline, event_day_end).timestamp()]
+
+    def check_if_is_submittable(self, event_date: datetime.date) -> bool:
+        if self.tool_type in TIME_BOUND_TOOL_TYPES:
+            current_time = datetime.datetime.now(tz=pytz.utc)
+            tool_end_time = self.get_end_working_time_if_executed_on_event_date(self.start_working_time, event_date)
+            tool_deadline = tool_end_time + datetime.timedelta(seconds=settings.SUBMISSION_BUFFER_TIME_IN_SECONDS)
+            return current_time <= tool_deadline and self.release_time_has_passed_on_event_day(event_date, current_time)
+
+        return self.tool_type in ALWAYS_SUBMITTABLE_TOOL_TYPES
+
+
+class TestFlowReleaseSchedule:
+    """
+    Immutable snapshot of the tools of a test flow, ordered by release time.
+    The tool data is copied on the way out so callers cannot alter the cached snapshot.
+    """
+    __slots__ = ('_scheduled_tools', '_scheduled_tools_by_id')
+
+    def __init__(self, scheduled_tools: List[ScheduledTool]):
+        self._scheduled_tools = tuple(scheduled_tools)
+        self._scheduled_tools_by_id = {
+            str(scheduled_tool.assessment_id): scheduled_tool for scheduled_tool in scheduled_tools
+        }
+
+    def __reduce__(self):
+        return self.__class__, (list(self._scheduled_tools),)
+
+    def get_scheduled_tools(self) -> Tuple[ScheduledTool, ...]:
+        return self._scheduled_tools
+
+    def get_scheduled_tool(self, assessment_id) -> Optional[ScheduledTool]:
+        return self._scheduled_tools_by_id.get(str(assessment_id))
+
+    def get_tools_data(self) -> List[dict]:
+        return [
+            {'release_time': str(scheduled_tool.release_time), 'assessment_data': scheduled_tool.get_tool_data()}
+            for scheduled_tool in self._scheduled_tools
+        ]
+
+    def get_tool_releases(self, event_date: datetime.date) -> List[tuple]:
+        return [
+            (
+                scheduled_tool.get_release_date_time_on_event_date(event_date),
+                scheduled_tool.assessment_id,
+                scheduled_tool.get_tool_data()
+            )
+            for scheduled_tool in self._scheduled_tools
+        ]
+
+    def get_released_tools(self, tool_types, event_date: datetime.date) -> List[ScheduledTool]:
+        current_date_time = datetime.datetime.now()
+        return [
+            scheduled_tool for scheduled_tool in self._scheduled_tools
+            if scheduled_tool.tool_type in tool_types
+            and scheduled_tool.release_time_has_passed_on_event_day(event_date, current_date_time)
+        ]
+
+    def check_if_is_submittable(self, assessment_id, event_date: datetime.date) -> bool:
+        scheduled_tool = self.get_scheduled_tool(assessment_id)
+        return scheduled_tool is not None and scheduled_tool.check_if_is_submittable(event_date)
+
+    def get_submission_windows(self, event_date: datetime.date) -> dict:
+        """
+        Maps the id of every tool accepting submissions to its submission window on the event date
+        """
+        return {
+            str(scheduled_tool.assessment_id): scheduled_tool.get_submission_window(event_date)
+            for scheduled_tool in self._scheduled_tools
+            if scheduled_tool.tool_type in TIME_BOUND_TOOL_TYPES + ALWAYS_SUBMITTABLE_TOOL_TYPES
+        }
+
+
+def submission_window_is_open(submission_windows: dict, assessment_id, current_date_time: datetime.datetime) -> bool:
+    assessment_id = str(assessment_id)
+    if assessment_id not in submission_windows:
+        return False
+
+    submission_window = submission_windows[assessment_id]
+    if submission_window is None:
+        return True
+
+    release_timestamp, deadline_timestamp = submission_window
+    return release_timestamp <= current_date_time.timestamp() <= deadline_timestamp
+
+
+def get_release_schedule_cache_key(test_flow_id, schedule_version) -> str:
+    return RELEASE_SCHEDULE_CACHE_KEY.format(test_flow_id=test_flow_id, schedule_version=schedule_version)
+
+
+def get_release_schedule(test_flow_id, schedule_version,
+                         compile_release_schedule: Callable[[], TestFlowReleaseSchedule]) -> TestFlowReleaseSchedule:
+    """
+    Looks the schedule up in the process first and in the cache framework second, compiling it only on a miss.
+    The schedule version is part of the key, so adding a tool to the test flow makes the stale entries unreachable.
+    """
+    cache_key = get_release_schedule_cache_key(test_flow_id, schedule_version)
+    release_schedule = _compiled_release_schedules.get(cache_key)
+    if release_schedule is not None:
+        return release_schedule
+
+    release_schedule = cache.get(cache_key)
+    if release_schedule is None:
+        release_schedule = compile_release_schedule()
+        cache.set(cache_key, release_schedule, timeout=settings.RELEASE_SCHEDULE_CACHE_TIMEOUT_IN_SECONDS)
+
+    if len(_compiled_release_schedules) >= settings.RELEASE_SCHEDULE_LOCAL_CACHE_MAX_SIZE:
+        _compiled_release_schedules.clear()
+    _compiled_release_schedules[cache_key] = release_schedule
+    return release_schedule
+
+
+def clear_compiled_release_schedules():
+    _compiled_release_schedules.clear()
@@ -1,14 +1,18 @@
-import mimetypes
-
 from django.core.exceptions import ObjectDoesNotExist
 from django.contrib.auth.models import User
 from datetime import time, datetime
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from users.models import Company, Assessor, Assessee
+from users.services import utils as user_utils
 from one_day_intern.exceptions import RestrictedAccessException
 from ..models import TestFlow, AssessmentEvent, ToolAttempt
-from ..exceptions.exceptions import AssessmentToolDoesNotExist, TestFlowDoesNotExist, EventDoesNotExist
+from ..exceptions.exceptions import (
+    AssessmentToolDoesNotExist,
+    TestFlowDoesNotExist,
+    EventDoesNotExist,
+    RangeNotSatisfiable
+)
 
 
 def sanitize_file_format(file_format: str):
@@ -45,14 +49,12 @@ def get_tool_of_company_from_id(tool_id: str, owning_company: Company):
 
 
 def get_company_or_assessor_associated_company_from_user(user: User) -> Company:
-    found_companies = Company.objects.filter(email=user.email)
-    if found_companies:
-        return found_companies[0]
+    concrete_user = user_utils.get_concrete_user(user)
+    if isinstance(concrete_user, Company):
+        return concrete_user
 
-    found_assessors = Assessor.objects.filter(email=user.email)
-    if found_assessors:
-        assessor = found_assessors[0]
-        return assessor.associated_company
+    if isinstance(concrete_user, Assessor):
+        return concrete_user.associated_company
 
     raise RestrictedAccessException(f'User with email {user.email} is not a company or an assessor')
 
@@ -94,7 +96,7 @@ def get_company_assessor_from_email(email, company: Company):
 
 
 def get_assessment_event_from_id(assessment_event_id) -> AssessmentEvent:
-    found_events = AssessmentEvent.objects.filter(event_id=assessment_event_id)
+    found_events = AssessmentEvent.objects.select_related('test_flow_used').filter(event_id=assessment_event_id)
 
     if found_events:
         return found_events[0]
@@ -103,7 +105,7 @@ def get_assessment_event_from_id(assessment_event_id) -> AssessmentEvent:
 
 
 def get_active_assessment_event_from_id(event_id):
-    found_events = AssessmentEvent.objects.filter(event_id=event_id)
+    found_events = AssessmentEvent.objects.select_related('test_flow_used').filter(event_id=event_id)
 
     if found_events:
         found_event: AssessmentEvent = found_events[0]
@@ -117,10 +119,10 @@ def get_active_assessment_event_from_id(event_id):
 
 
 def get_assessee_from_user(user: User) -> Assessee:
-    found_assessees = Assessee.objects.filter(email=user.email)
+    concrete_user = user_utils.get_concrete_user(user)
 
-    if found_assessees:
-        return found_assessees[0]
+    if isinstance(concrete_user, Assessee):
+        return concrete_user
     else:
         raise RestrictedAccessException(f'User with email {user.email} is not an assessee')
 
@@ -141,10 +143,56 @@ def get_tool_attempt_from_id(tool_attempt_id) -> ToolAttempt:
         raise ObjectDoesNotExist(f'Tool attempt with id {tool_attempt_id} does not exist')
 
 
-def generate_file_response(response_file):
-    content_type = mimetypes.guess_type(response_file.name)[0]
-    response = HttpResponse(response_file, content_type=content_type)
-    response['Content-Length'] = response_file.size
-    response['Content-Disposition'] = f'attachment; filename="{response_file.name}"'
-    response['Access-Control-Expose-Headers'] = 'Content-Disposition'
-    return response
\ No newline at end of file
+def get_requested_byte_range(range_header, file_size):
+    """
+    Parses a single byte range of an HTTP Range header into an inclusive (start, end) pair.
+    Returns None when the whole file should be served.
+    """
+    if not range_header or not range_header.startswith('bytes='):
+        return None
+
+    byte_range = range_header[len('bytes='):].strip()
+    start_text, separator, end_text = byte_range.partition('-')
+    if not separator or ',' in byte_range:
+        return None
+
+    try:
+        if start_text:
+            start = int(start_text)
+            end = min(int(end_text), file_size - 1) if end_text else file_size - 1
+        else:
+            suffix_length = int(end_text)
+            start = max(file_size - suffix_length, 0)
+            end = file_size - 1 if suffix_length else -1
+    except ValueError:
+        return None
+
+    if start < 0 or start > end:
+        raise RangeNotSatisfiable(f'Range {range_header} is not satisfiable for a file of {file_size} bytes')
+
+    return start, end
+
+
+def generate_streaming_file_response(streamed_file, range_header=None):
+    try:
+        requested_byte_range = get_requested_byte_range(range_header, streamed_file.size)
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{streamed_file.size}'
+        return response
+
+    if requested_byte_range:
+        start, end = requested_byte_range
+        response = StreamingHttpResponse(
+            streamed_file.iter_chunks(start, end), status=206, content_type=streamed_file.content_type
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{streamed_file.size}'
+        response['Content-Length'] = end - start + 1
+    else:
+        response = StreamingHttpResponse(streamed_file.iter_chunks(), content_type=streamed_file.content_type)
+        response['Content-Length'] = streamed_file.size
+
+    response['Accept-Ranges'] = 'bytes'
+    response['Content-Disposition'] = f'attachment; filename="{streamed_file.name}"'
+    response['Access-Control-Expose-Headers'] = 'Content-Disposition, Content-Range, Accept-Ranges'
+    return response
@@ -1,7 +1,12 @@
 from company.services import utils as company_utils
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase, Client
+from django.core.management import call_command, CommandError
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test import TestCase, TransactionTestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from freezegun import freeze_time
 from google.cloud import storage
@@ -15,10 +20,16 @@ from one_day_intern.exceptions import (
     InvalidResponseTestRegistration,
     InvalidVideoConferenceNotificationException,
 )
-from one_day_intern.settings import GOOGLE_BUCKET_BASE_DIRECTORY, GOOGLE_STORAGE_BUCKET_NAME
+from one_day_intern.settings import (
+    GOOGLE_BUCKET_BASE_DIRECTORY,
+    GOOGLE_STORAGE_BUCKET_NAME,
+    SUBMISSION_BUFFER_TIME_IN_SECONDS
+)
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
-from unittest.mock import patch, call
+from unittest import skipUnless
+from unittest.mock import patch, call, MagicMock
+from urllib.parse import parse_qsl
 from users.models import (
     Company,
     Assessor,
@@ -31,7 +42,9 @@ from .exceptions.exceptions import (
     InvalidTestFlowRegistration,
     InvalidAssessmentEventRegistration,
     QuestionDoesNotExist,
-    QuestionAttemptDoesNotExist
+    QuestionAttemptDoesNotExist,
+    RangeNotSatisfiable,
+    FileDoesNotExist
 )
 from .models import (
     AssessmentTool,
@@ -48,7 +61,7 @@ from .models import (
     TextQuestion,
     MultipleChoiceQuestion,
     InteractiveQuizSerializer,
-    InteractiveQuiz, MultipleChoiceQuestionSerializer, TextQuestionSerializer,
+    InteractiveQuiz, TextQuestionSerializer,
     VideoConferenceRoom,
     InteractiveQuizAttempt,
     MultipleChoiceAnswerOptionAttempt,
@@ -63,15 +76,28 @@ from .services import (
     test_flow,
     assessment_event,
     assessment_event_attempt,
+    assessment_flow_subscription,
+    release_broker,
+    release_schedule,
     TaskGenerator,
     google_storage,
     participation_validators,
     grading
 )
+from .asgi import AssessmentFlowStreamApplication, ThreadedStreamingASGIHandler
+from .management.commands import audit_query_indexes
+from asgiref.sync import async_to_sync
+import asyncio
+import concurrent.futures
+import csv
+import io
 import datetime
 import json
+import os
 import schedule
 import pytz
+import tempfile
+import threading
 import uuid
 
 ASSESSMENT_EVENT_ID_PARAM_NAME = '?assessment-event-id='
@@ -85,6 +111,7 @@ ACTIVE_TEST_FLOW_NOT_FOUND = 'Active test flow of id {} belonging to {} does not
 INVALID_DATE_FORMAT = '{} is not a valid ISO date string'
 ASSESSMENT_EVENT_OWNERSHIP_INVALID = 'Event with id {} does not belong to company with id {}'
 NOT_PART_OF_EVENT = 'Assessee with email {} is not part of assessment with id {}'
+ALREADY_PART_OF_EVENT = 'Assessee with email {} is already part of assessment with id {}'
 ASSESSOR_NOT_PART_OF_EVENT = 'Assessor with email {} is not part of assessment with id {}'
 EVENT_DOES_NOT_EXIST = 'Assessment Event with ID {} does not exist'
 EVENT_IS_NOT_ACTIVE = 'Assessment Event with ID {} is not active'
@@ -117,6 +144,7 @@ RESPONSE_TEST_HAS_BEEN_ATTEMPTED = 'Response test with id {} has been attempted'
 CREATE_TEST_FLOW_URL = reverse('test-flow-create')
 CREATE_ASSESSMENT_EVENT_URL = reverse('assessment-event-create')
 ADD_PARTICIPANT_URL = reverse('event-add-participation')
+BULK_ADD_PARTICIPANT_URL = reverse('event-bulk-add-participation')
 EVENT_SUBSCRIPTION_URL = reverse('event-subscription')
 SUBMIT_ASSIGNMENT_URL = reverse('submit-assignments')
 SUBMIT_INTERACTIVE_QUIZ_ANSWERS_URL = reverse('submit-interactive-quiz-answers')
@@ -124,6 +152,7 @@ SUBMIT_INTERACTIVE_QUIZ_URL = reverse('submit-interactive-quiz')
 GET_RELEASED_ASSIGNMENTS = reverse('event-active-assignments') + ASSESSMENT_EVENT_ID_PARAM_NAME
 GET_RELEASED_RESPONSE_TESTS = reverse('event-active-response-tests') + ASSESSMENT_EVENT_ID_PARAM_NAME
 GET_RELEASED_INTERACTIVE_QUIZZES = reverse('event-active-interactive-quizzes') + ASSESSMENT_EVENT_ID_PARAM_NAME
+GET_RELEASED_TOOLS = reverse('event-released-tools') + ASSESSMENT_EVENT_ID_PARAM_NAME
 GET_EVENT_DATA = reverse('get-event-data') + ASSESSMENT_EVENT_ID_PARAM_NAME
 GET_AND_DOWNLOAD_ATTEMPT_URL = reverse('get-submitted-assignment')
 CREATE_RESPONSE_TEST_URL = '/assessment/create/response-test/'
@@ -131,11 +160,15 @@ GET_PROGRESS_URL = reverse('get-assessee-progress')
 ASSESSOR_GET_EVENT_DATA_URL = reverse('assessor-get-event-data')
 SUBMIT_GRADE_AND_NOTE_URL = reverse('submit-grade-and-note')
 SUBMIT_INDIVIDUAL_QUESTION_GRADE_AND_NOTE_URL = reverse('grade-individual-question')
+BULK_GRADE_URL = reverse('bulk-grade')
 SUBMIT_INTERACTIVE_QUIZ_GRADE_AND_NOTE_URL = reverse('grade-interactive-quiz')
 GET_QUIZ_ATTEMPT_DATA_URL = reverse('review-interactive-quiz') + TOOL_ATTEMPT_ID_PARAM_NAME
 GET_INDIVIDUAL_QUESTION_ATTEMPT_DATA_URL = reverse('review-individual-question') + TOOL_ATTEMPT_ID_PARAM_NAME
 GET_ASSIGNMENT_ATTEMPT_DATA_URL = reverse('get-assignment-attempt-data') + TOOL_ATTEMPT_ID_PARAM_NAME
 GET_ASSIGNMENT_ATTEMPT_DATA_FILE = reverse('get-assignment-attempt-file') + TOOL_ATTEMPT_ID_PARAM_NAME
+GET_ASSIGNMENT_ATTEMPT_FILE_URL = reverse('get-assignment-attempt-file-url') + TOOL_ATTEMPT_ID_PARAM_NAME
+ASSIGNMENT_UPLOAD_URL = reverse('assignment-upload-url')
+FINALIZE_ASSIGNMENT_UPLOAD_URL = reverse('finalize-assignment-upload')
 UPDATE_ASSESSMENT_EVENT_URL = reverse('assessment-event-update')
 DELETE_ASSESSMENT_EVENT_URL = reverse('assessment-event-delete')
 CREATE_VIDEO_CONFERENCE_NOTIFICATION_URL = reverse('create-video-conference-notification')
@@ -487,40 +520,25 @@ class InteractiveQuizTest(TestCase):
         mocked_create.assert_called_once()
         self.assertDictEqual(returned_interactive_quiz_data, self.expected_interactive_quiz_data)
 
-    @patch.object(MultipleChoiceAnswerOption.objects, 'create')
-    @patch.object(MultipleChoiceAnswerOption.objects, 'create')
-    @patch.object(MultipleChoiceQuestion.objects, 'create')
-    def test_save_mc_question_to_database(self, mocked_create_mc_question, mocked_create_incorrect_answer_option,
-                                          mocked_create_correct_answer_option):
-
-        mocked_create_correct_answer_option.return_value = self.expected_correct_answer_option
-        mocked_create_incorrect_answer_option.return_value = self.expected_incorrect_answer_option
-        mocked_create_mc_question.return_value = self.expected_mc_question
-
-        returned_mc_question = assessment.save_question_to_database(self.mc_question_data,
-                                                                    self.expected_interactive_quiz)
-        returned_mc_question_data = MultipleChoiceQuestionSerializer(returned_mc_question).data
-        mocked_create_mc_question.assert_called_once()
-        mocked_create_correct_answer_option.called_once()
-        mocked_create_incorrect_answer_option.called_once()
-
-        keys = ['prompt', 'points', 'question_type']
-        self.expected_mc_question_data = {key: self.mc_question_data[key] for key in keys}
-        self.assertDictEqual(returned_mc_question_data, self.expected_mc_question_data)
-
-    @patch.object(TextQuestion.objects, 'create')
-    def test_save_text_question_to_database(self, mocked_create_text_question):
+    def test_bulk_save_questions_to_database(self):
+        with self.assertNumQueries(4):
+            assessment.bulk_save_questions_to_database(
+                [self.mc_question_data, self.text_question_data], self.expected_interactive_quiz
+            )
 
-        mocked_create_text_question.return_value = self.expected_text_question
+        self.assertEqual(self.expected_interactive_quiz.questions.count(), 2)
+        mc_question = MultipleChoiceQuestion.objects.get(interactive_quiz=self.expected_interactive_quiz)
+        text_question = TextQuestion.objects.get(interactive_quiz=self.expected_interactive_quiz)
+        self.assertEqual(mc_question.prompt, self.mc_question_data.get('prompt'))
+        self.assertEqual(mc_question.multiplechoiceansweroption_set.count(), 2)
+        self.assertDictEqual(TextQuestionSerializer(text_question).data, self.text_question_data)
 
-        returned_question = assessment.save_question_to_database(self.text_question_data,
-                                                                 self.expected_interactive_quiz)
-        returned_question_data = TextQuestionSerializer(returned_question).data
-        mocked_create_text_question.assert_called_once()
-        self.assertDictEqual(returned_question_data, self.text_question_data)
+    def test_bulk_create_does_not_support_multi_table_inherited_questions(self):
+        with self.assertRaisesMessage(ValueError, "Can't bulk create a multi-table inherited model"):
+            MultipleChoiceQuestion.objects.bulk_create([self.expected_mc_question])
 
     @patch.object(utils, 'get_interactive_quiz_total_points')
-    @patch.object(assessment, 'save_question_to_database')
+    @patch.object(assessment, 'bulk_save_questions_to_database')
     @patch.object(assessment, 'save_interactive_quiz_to_database')
     @patch.object(assessment, 'validate_answer_option')
     @patch.object(assessment, 'validate_question')
@@ -547,6 +565,76 @@ class InteractiveQuizTest(TestCase):
         returned_interactive_quiz_data = InteractiveQuizSerializer(returned_interactive_quiz).data
         self.assertDictEqual(returned_interactive_quiz_data, self.expected_interactive_quiz_data)
 
+    def get_interactive_quiz_request_data_with_questions(self, number_of_questions):
+        request_data = self.request_data.copy()
+        request_data['questions'] = self.request_data['questions'] * number_of_questions
+        request_data['total_points'] = 10 * number_of_questions
+        return request_data
+
+    def test_create_interactive_quiz_number_of_queries_does_not_depend_on_number_of_questions(self):
+        with CaptureQueriesContext(connection) as small_quiz_queries:
+            assessment.create_interactive_quiz(self.get_interactive_quiz_request_data_with_questions(1), self.assessor)
+        with CaptureQueriesContext(connection) as large_quiz_queries:
+            interactive_quiz = assessment.create_interactive_quiz(
+                self.get_interactive_quiz_request_data_with_questions(50), self.assessor
+            )
+
+        self.assertEqual(len(large_quiz_queries), len(small_quiz_queries))
+        self.assertEqual(interactive_quiz.total_points, 500)
+        self.assertEqual(MultipleChoiceQuestion.objects.filter(interactive_quiz=interactive_quiz).count(), 50)
+        text_questions = TextQuestion.objects.filter(interactive_quiz=interactive_quiz)
+        self.assertEqual(text_questions.count(), 50)
+        self.assertFalse(text_questions.exclude(answer_key=self.text_question_data.get('answer_key')).exists())
+        answer_options = MultipleChoiceAnswerOption.objects.filter(question__interactive_quiz=interactive_quiz)
+        self.assertEqual(answer_options.count(), 100)
+        self.assertEqual(answer_options.filter(correct=True).count(), 50)
+
+    def test_import_interactive_quiz_command_from_json_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'quiz.json')
+            with open(file_path, 'w') as quiz_file:
+                json.dump(self.request_data, quiz_file)
+            call_command('import_interactive_quiz', file_path, '--assessor-email', self.assessor.email,
+                         stdout=io.StringIO())
+
+        interactive_quiz = InteractiveQuiz.objects.exclude(
+            assessment_id=self.expected_interactive_quiz.assessment_id
+        ).get(name=self.request_data.get('name'))
+        self.assertEqual(interactive_quiz.owning_company, self.company)
+        self.assertEqual(interactive_quiz.get_questions().count(), 2)
+
+    def test_import_interactive_quiz_command_from_csv_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'quiz.csv')
+            with open(file_path, 'w', newline='') as quiz_file:
+                writer = csv.writer(quiz_file)
+                writer.writerow(['question_type', 'prompt', 'points', 'answer_key', 'answer_options', 'correct_answer'])
+                writer.writerow(['multiple_choice', 'What is 1 + 1?', '4', '', '1 | 2 | 3', '2'])
+                writer.writerow(['text', 'Explain data cleaning', '6', 'Removing bad data', '', ''])
+            call_command('import_interactive_quiz', file_path, '--assessor-email', self.assessor.email,
+                         '--name', 'Imported Quiz', '--duration-in-minutes', '30', stdout=io.StringIO())
+
+        interactive_quiz = InteractiveQuiz.objects.get(name='Imported Quiz')
+        self.assertEqual(interactive_quiz.total_points, 10)
+        self.assertEqual(interactive_quiz.duration_in_minutes, 30)
+        mc_question = MultipleChoiceQuestion.objects.get(interactive_quiz=interactive_quiz)
+        self.assertEqual([option.content for option in mc_question.get_answer_options()], ['1', '2', '3'])
+        self.assertEqual(mc_question.get_answer_options().get(correct=True).content, '2')
+        self.assertEqual(TextQuestion.objects.get(interactive_quiz=interactive_quiz).answer_key, 'Removing bad data')
+
+    def test_import_interactive_quiz_command_when_a_question_is_invalid(self):
+        request_data = self.get_interactive_quiz_request_data_with_questions(3)
+        request_data['name'] = 'Invalid Imported Quiz'
+        request_data['questions'] = request_data['questions'] + [{'prompt': 'No type', 'points': 1}]
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'quiz.json')
+            with open(file_path, 'w') as quiz_file:
+                json.dump(request_data, quiz_file)
+            with self.assertRaisesMessage(CommandError, 'Questions should have a type'):
+                call_command('import_interactive_quiz', file_path, '--assessor-email', self.assessor.email)
+
+        self.assertFalse(InteractiveQuiz.objects.filter(name='Invalid Imported Quiz').exists())
+
     def test_create_interactive_quiz_when_complete_status_200(self):
         interactive_quiz_data = json.dumps(self.request_data.copy())
         client = APIClient()
@@ -2220,7 +2308,7 @@ class AssessmentEventParticipationTest(TestCase):
             expected_message=f'User with email {self.assessee.email} is not a company or an assessor'
         )
 
-    @patch.object(company_utils, 'send_mass_html_mail')
+    @patch.object(company_utils, 'queue_mass_html_mail')
     def test_add_assessment_event_participation_when_request_is_valid(self, mocked_send_mass_mail):
         request_data = self.base_request_data.copy()
         response = fetch_and_get_response(
@@ -2241,6 +2329,96 @@ class AssessmentEventParticipationTest(TestCase):
         self.assertEqual(response_content.get('message'), 'Participants are successfully added')
         self.assertTrue(self.assessment_event.check_assessee_participation(self.assessee))
 
+    def test_bulk_add_participants_creates_participation_attempt_and_room(self):
+        assessee_2 = Assessee.objects.create_user(email='bulk_assessee_2@email.com', password='Password123')
+        participations = self.assessment_event.bulk_add_participants(
+            [(self.assessee, self.assessor_1), (assessee_2, self.assessor_1)]
+        )
+
+        self.assertEqual(len(participations), 2)
+        for participation in AssessmentEventParticipation.objects.filter(assessment_event=self.assessment_event):
+            self.assertEqual(participation.attempt.event_participation, participation)
+            self.assertEqual(participation.attempt.test_flow_attempted, self.test_flow_1)
+            self.assertTrue(VideoConferenceRoom.objects.filter(part_of=participation).exists())
+
+    def test_bulk_convert_list_of_participants_reports_row_errors(self):
+        self.assessment_event.add_participant(self.assessee, self.assessor_1)
+        assessee_2 = Assessee.objects.create_user(email='bulk_assessee_2@email.com', password='Password123')
+        list_of_participants = [
+            {'assessee_email': self.assessee.email, 'assessor_email': self.assessor_1.email},
+            {'assessee_email': 'BULK_ASSESSEE_2@email.com', 'assessor_email': self.assessor_1.email},
+            {'assessee_email': assessee_2.email, 'assessor_email': self.assessor_1.email},
+            {'assessee_email': 'unknown@email.com', 'assessor_email': self.assessor_1.email},
+            {'assessee_email': assessee_2.email, 'assessor_email': 'unknown@email.com'},
+        ]
+
+        with self.assertNumQueries(3):
+            converted_list, errors = assessment_event.bulk_convert_list_of_participants_emails_to_user_objects(
+                self.assessment_event, list_of_participants, self.company_1
+            )
+
+        self.assertEqual(converted_list, [(assessee_2, self.assessor_1)])
+        self.assertEqual([error['message'] for error in errors], [
+            ALREADY_PART_OF_EVENT.format(self.assessee.email, self.assessment_event.event_id),
+            ALREADY_PART_OF_EVENT.format(assessee_2.email, self.assessment_event.event_id),
+            ASSESSEE_NOT_FOUND.format('unknown@email.com'),
+            f'Assessor with email unknown@email.com associated with {self.company_1.company_name} is not found',
+        ])
+
+    @patch.object(company_utils, 'queue_mass_html_mail')
+    def test_bulk_add_assessment_event_participation_when_request_is_valid(self, mocked_send_mass_mail):
+        request_data = self.base_request_data.copy()
+        request_data['list_of_participants'] = request_data['list_of_participants'] + [
+            {'assessee_email': 'unknown@email.com', 'assessor_email': self.assessor_1.email}
+        ]
+        response = fetch_and_get_response(
+            path=BULK_ADD_PARTICIPANT_URL,
+            request_data=request_data,
+            authenticated_user=self.company_1
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_content = json.loads(response.content)
+        self.assertEqual(response_content.get('added_participants'), [self.assessee.email])
+        self.assertEqual(response_content.get('errors'), [{
+            'assessee_email': 'unknown@email.com',
+            'assessor_email': self.assessor_1.email,
+            'message': ASSESSEE_NOT_FOUND.format('unknown@email.com')
+        }])
+        self.assertTrue(self.assessment_event.check_assessee_participation(self.assessee))
+        call_arguments = list(mocked_send_mass_mail.call_args)[0][0]
+        self.assertEqual(len(call_arguments), 1)
+
+    @patch.object(company_utils, 'queue_mass_html_mail')
+    def test_bulk_add_assessment_event_participation_when_requested_by_assessor_of_company(self, mocked_send_mass_mail):
+        response = fetch_and_get_response(
+            path=BULK_ADD_PARTICIPANT_URL,
+            request_data=self.base_request_data.copy(),
+            authenticated_user=self.assessor_1
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_content = json.loads(response.content)
+        self.assertEqual(response_content.get('added_participants'), [self.assessee.email])
+        self.assertEqual(response_content.get('errors'), [])
+        self.assertTrue(self.assessment_event.check_assessee_participation(self.assessee))
+
+    def test_bulk_add_assessment_event_participation_when_assessment_event_is_not_owned_by_company(self):
+        request_data = self.base_request_data.copy()
+        response = fetch_and_get_response(
+            path=BULK_ADD_PARTICIPANT_URL,
+            request_data=request_data,
+            authenticated_user=self.company_2
+        )
+        self.add_participant_assert_correctness_when_request_is_invalid(
+            response=response,
+            expected_status_code=HTTPStatus.FORBIDDEN,
+            expected_message=ASSESSMENT_EVENT_OWNERSHIP_INVALID.format(
+                request_data['assessment_event_id'],
+                self.company_2.company_id
+            )
+        )
+
 
 def fetch_and_get_response_subscription(access_token, assessment_event_id):
     client = Client()
@@ -2543,6 +2721,325 @@ class AssesseeSubscribeToAssessmentEvent(TestCase):
         mocked_generate.assert_called_once()
 
 
+def run_asgi_subscription_request(application, access_token, assessment_event_id, last_event_id=None):
+    sent_messages = []
+
+    async def request_subscription():
+        first_body_sent = asyncio.Event()
+
+        async def receive():
+            await first_body_sent.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            sent_messages.append(message)
+            if message['type'] == 'http.response.body':
+                first_body_sent.set()
+
+        headers = [(b'authorization', f'Bearer {access_token}'.encode())]
+        if last_event_id:
+            headers.append((b'last-event-id', last_event_id.encode()))
+
+        scope = {
+            'type': 'http',
+            'method': 'GET',
+            'path': EVENT_SUBSCRIPTION_URL,
+            'query_string': f'assessment-event-id={assessment_event_id}'.encode(),
+            'headers': headers,
+        }
+        await asyncio.wait_for(application(scope, receive, send), timeout=5)
+
+    async_to_sync(request_subscription)()
+    return sent_messages
+
+
+class AssessmentFlowStreamTest(TestCase):
+    def setUp(self) -> None:
+        self.assessee = Assessee.objects.create_user(
+            email='assessee_stream@assessee.com',
+            password='Password123',
+            first_name='Assessee',
+            last_name='Stream',
+            phone_number='+62123141203',
+            authentication_service=AuthenticationService.DEFAULT.value
+        )
+        self.assessee_token = RefreshToken.for_user(self.assessee)
+
+        self.company = Company.objects.create_user(
+            email='company_stream@company.com',
+            password='password',
+            company_name='Company',
+            description='Company Description',
+            address='JL. Company Stream'
+        )
+        self.company_token = RefreshToken.for_user(self.company)
+
+        self.assessor = Assessor.objects.create_user(
+            email='assessor_stream@gmail.com',
+            password='password12A',
+            first_name='Assessor',
+            last_name='Stream',
+            phone_number='+12312312312',
+            associated_company=self.company,
+            authentication_service=AuthenticationService.DEFAULT.value
+        )
+
+        self.assignment = Assignment.objects.create(
+            name='Assignment Name',
+            description='Assignment description',
+            owning_company=self.company,
+            expected_file_format='pdf',
+            duration_in_minutes=120
+        )
+
+        self.test_flow = TestFlow.objects.create(name='Stream Test Flow', owning_company=self.company)
+        self.test_flow.add_tool(
+            assessment_tool=self.assignment,
+            release_time=datetime.time(0, 0),
+            start_working_time=datetime.time(23, 59)
+        )
+
+        today = datetime.datetime.now(tz=pytz.utc).date()
+        self.assessment_event = AssessmentEvent.objects.create(
+            name='Stream Assessment Event',
+            start_date_time=datetime.datetime(today.year, today.month, today.day, tzinfo=pytz.utc),
+            owning_company=self.company,
+            test_flow_used=self.test_flow
+        )
+        self.assessment_event.add_participant(assessee=self.assessee, assessor=self.assessor)
+
+        self.broker = release_broker.ReleaseBroker()
+        self.application = AssessmentFlowStreamApplication(django_application=None, broker=self.broker)
+
+    def test_timer_wheel_fires_releases_in_deadline_order(self):
+        fired = []
+
+        async def schedule_and_wait():
+            timer_wheel = assessment_flow_subscription.ReleaseTimerWheel()
+            current_time = datetime.datetime.now(tz=pytz.utc)
+            timer_wheel.schedule(current_time + datetime.timedelta(milliseconds=60), fired.append, 'second')
+            timer_wheel.schedule(current_time + datetime.timedelta(milliseconds=20), fired.append, 'first')
+            cancelled = timer_wheel.schedule(current_time + datetime.timedelta(milliseconds=40), fired.append, 'x')
+            cancelled.cancel()
+            self.assertEqual(timer_wheel.pending_count(), 2)
+            await asyncio.sleep(0.15)
+            self.assertEqual(timer_wheel.pending_count(), 0)
+
+        async_to_sync(schedule_and_wait)()
+        self.assertEqual(fired, ['first', 'second'])
+
+    def test_broker_publishes_release_once_to_every_subscriber_of_event(self):
+        tool_data = self.assignment.get_tool_data()
+
+        async def subscribe_and_receive():
+            release_time = datetime.datetime.now(tz=pytz.utc) + datetime.timedelta(milliseconds=30)
+            releases = [(release_time, self.assignment.assessment_id, tool_data)]
+            self.broker.open_channel('event', releases)
+            self.broker.open_channel('event', releases)
+            subscriptions = [self.broker.subscribe('event') for _ in range(3)]
+            self.assertEqual(self.broker.get_subscriber_count('event'), 3)
+            self.assertEqual(self.broker.timer_wheel.pending_count(), 1)
+
+            received_messages = []
+            for subscription in subscriptions:
+                begin_message = await subscription.next_message()
+                self.assertEqual(begin_message, assessment_flow_subscription.BEGIN_TASK_MESSAGE)
+                received_messages.append(await asyncio.wait_for(subscription.next_message(), timeout=1))
+                self.broker.unsubscribe(subscription)
+
+            self.assertEqual(self.broker.get_subscriber_count('event'), 0)
+            self.assertFalse(self.broker.has_channel('event'))
+            return release_time, received_messages
+
+        release_time, received_messages = async_to_sync(subscribe_and_receive)()
+        expected_message_id = assessment_flow_subscription.get_release_message_id(
+            self.assignment.assessment_id, release_time
+        )
+        self.assertTrue(all(message is received_messages[0] for message in received_messages))
+        message_id_line, message_data_line = received_messages[0].decode().strip().split('\n')
+        self.assertEqual(message_id_line, f'id: {expected_message_id}')
+        message_data = json.loads(message_data_line[len('data: '):])
+        self.assertEqual(message_data.get('name'), tool_data.get('name'))
+        self.assertEqual(message_data.get('id'), expected_message_id)
+
+    def test_broker_replays_released_tools_to_new_subscriber(self):
+        current_time = datetime.datetime.now(tz=pytz.utc)
+        first_release_time = current_time - datetime.timedelta(minutes=2)
+        second_release_time = current_time - datetime.timedelta(minutes=1)
+        releases = [
+            (second_release_time, 'second-tool', {'name': 'Second'}),
+            (first_release_time, 'first-tool', {'name': 'First'}),
+            (current_time + datetime.timedelta(hours=1), 'future-tool', {'name': 'Future'})
+        ]
+        first_message_id = assessment_flow_subscription.get_release_message_id('first-tool', first_release_time)
+        second_message_id = assessment_flow_subscription.get_release_message_id('second-tool', second_release_time)
+
+        async def subscribe_and_receive(last_event_id):
+            self.broker.open_channel('event', releases)
+            subscription = self.broker.subscribe('event', last_event_id=last_event_id)
+            first_message = await subscription.next_message()
+            self.broker.unsubscribe(subscription)
+            self.assertTrue(first_message.startswith(assessment_flow_subscription.BEGIN_TASK_MESSAGE))
+            return first_message[len(assessment_flow_subscription.BEGIN_TASK_MESSAGE):]
+
+        replay_message = async_to_sync(subscribe_and_receive)(None)
+        self.assertEqual(replay_message.count(b'data: '), 2)
+        self.assertLess(replay_message.index(first_message_id.encode()), replay_message.index(second_message_id.encode()))
+        self.assertNotIn(b'future-tool', replay_message)
+
+        replay_message = async_to_sync(subscribe_and_receive)(first_message_id)
+        self.assertEqual(replay_message.count(b'data: '), 1)
+        self.assertIn(f'id: {second_message_id}'.encode(), replay_message)
+
+        replay_message = async_to_sync(subscribe_and_receive)(second_message_id)
+        self.assertEqual(replay_message, b'')
+
+    def test_broker_closes_channel_when_last_subscriber_leaves(self):
+        async def subscribe_and_unsubscribe():
+            release_time = datetime.datetime.now(tz=pytz.utc) + datetime.timedelta(hours=1)
+            self.broker.open_channel('event', [(release_time, 'tool', {})])
+            first_subscription = self.broker.subscribe('event')
+            second_subscription = self.broker.subscribe('event')
+            self.assertEqual(self.broker.timer_wheel.pending_count(), 1)
+
+            self.broker.unsubscribe(first_subscription)
+            self.assertTrue(self.broker.has_channel('event'))
+            self.assertEqual(self.broker.timer_wheel.pending_count(), 1)
+
+            self.broker.unsubscribe(second_subscription)
+            self.assertFalse(self.broker.has_channel('event'))
+            self.assertEqual(self.broker.timer_wheel.pending_count(), 0)
+
+        async_to_sync(subscribe_and_unsubscribe)()
+
+    @patch.object(release_broker.settings, 'ASSESSMENT_RELEASE_BROKER_BACKEND', 'unittest.mock.MagicMock')
+    def test_release_broker_backend_is_loaded_from_settings(self):
+        backend = release_broker.get_release_broker_backend()
+        self.assertIsInstance(backend, MagicMock)
+
+    def test_broker_publishes_through_configured_backend(self):
+        backend = MagicMock()
+        broker = release_broker.ReleaseBroker(backend=backend)
+        release = release_broker.ChannelRelease(datetime.datetime.now(tz=pytz.utc), 'tool', {'name': 'Assignment'})
+        broker.publish_release('event', release)
+        backend.publish.assert_called_once_with('event', release.message)
+        self.assertTrue(release.is_released)
+
+    def test_get_tool_releases_of_assessment_event(self):
+        tool_releases = self.assessment_event.get_tool_releases()
+        self.assertEqual(len(tool_releases), 1)
+        release_date_time, assessment_id, tool_data = tool_releases[0]
+        self.assertEqual(release_date_time, self.assessment_event.start_date_time)
+        self.assertEqual(assessment_id, self.assignment.assessment_id)
+        self.assertDictEqual(tool_data, self.assignment.get_tool_data())
+
+    def test_stream_subscription_when_request_is_valid(self):
+        release_message_id = assessment_flow_subscription.get_release_message_id(
+            self.assignment.assessment_id, self.assessment_event.start_date_time
+        )
+        sent_messages = run_asgi_subscription_request(
+            self.application, self.assessee_token.access_token, self.assessment_event.event_id
+        )
+        response_start = sent_messages[0]
+        self.assertEqual(response_start.get('status'), HTTPStatus.OK)
+        self.assertIn((b'content-type', b'text/event-stream'), response_start.get('headers'))
+
+        first_body = sent_messages[1].get('body')
+        self.assertTrue(first_body.startswith(assessment_flow_subscription.BEGIN_TASK_MESSAGE))
+        self.assertIn(f'id: {release_message_id}\n'.encode(), first_body)
+        self.assertEqual(self.broker.get_subscriber_count(self.assessment_event.event_id), 0)
+        self.assertFalse(self.broker.has_channel(self.assessment_event.event_id))
+
+    def test_stream_subscription_when_channel_closes_while_request_is_prepared(self):
+        release_message_id = assessment_flow_subscription.get_release_message_id(
+            self.assignment.assessment_id, self.assessment_event.start_date_time
+        )
+        event_id = self.assessment_event.event_id
+        self.broker.open_channel(event_id, self.assessment_event.get_tool_releases())
+        last_subscription = self.broker.subscribe(event_id)
+        prepare_subscription_of_request = self.application.prepare_subscription_of_request
+
+        def prepare_while_last_subscriber_leaves(request):
+            prepared_subscription = prepare_subscription_of_request(request)
+            self.broker.unsubscribe(last_subscription)
+            return prepared_subscription
+
+        with patch.object(
+                self.application, 'prepare_subscription_of_request', side_effect=prepare_while_last_subscriber_leaves
+        ):
+            sent_messages = run_asgi_subscription_request(
+                self.application, self.assessee_token.access_token, event_id
+            )
+
+        self.assertEqual(sent_messages[0].get('status'), HTTPStatus.OK)
+        self.assertIn(f'id: {release_message_id}\n'.encode(), sent_messages[1].get('body'))
+
+    def test_stream_subscription_when_last_event_id_is_the_latest_release(self):
+        release_message_id = assessment_flow_subscription.get_release_message_id(
+            self.assignment.assessment_id, self.assessment_event.start_date_time
+        )
+        sent_messages = run_asgi_subscription_request(
+            self.application, self.assessee_token.access_token, self.assessment_event.event_id,
+            last_event_id=release_message_id
+        )
+        self.assertEqual(sent_messages[0].get('status'), HTTPStatus.OK)
+        self.assertEqual(sent_messages[1].get('body'), assessment_flow_subscription.BEGIN_TASK_MESSAGE)
+
+    def test_stream_subscription_when_user_is_not_an_assessee(self):
+        sent_messages = run_asgi_subscription_request(
+            self.application, self.company_token.access_token, self.assessment_event.event_id
+        )
+        self.assertEqual(sent_messages[0].get('status'), HTTPStatus.FORBIDDEN)
+        response_content = json.loads(sent_messages[1].get('body'))
+        self.assertEqual(response_content.get('message'), USER_IS_NOT_ASSESSEE.format(self.company.email))
+
+    def test_stream_subscription_when_event_does_not_exist(self):
+        invalid_assessment_id = str(uuid.uuid4())
+        sent_messages = run_asgi_subscription_request(
+            self.application, self.assessee_token.access_token, invalid_assessment_id
+        )
+        self.assertEqual(sent_messages[0].get('status'), HTTPStatus.BAD_REQUEST)
+        response_content = json.loads(sent_messages[1].get('body'))
+        self.assertEqual(response_content.get('message'), EVENT_DOES_NOT_EXIST.format(invalid_assessment_id))
+
+    def test_streaming_response_is_read_outside_of_event_loop_thread(self):
+        reading_threads = []
+        sent_messages = []
+
+        def read_file():
+            for chunk in (b'Hello ', b'World'):
+                reading_threads.append(threading.get_ident())
+                yield chunk
+
+        async def send(message):
+            sent_messages.append(message)
+
+        async def send_streaming_response():
+            event_loop_thread = threading.get_ident()
+            response = StreamingHttpResponse(read_file(), content_type=APPLICATION_PDF)
+            await ThreadedStreamingASGIHandler().send_response(response, send)
+            return event_loop_thread
+
+        event_loop_thread = async_to_sync(send_streaming_response)()
+        self.assertEqual(len(reading_threads), 2)
+        self.assertNotIn(event_loop_thread, reading_threads)
+        self.assertEqual(sent_messages[0].get('status'), HTTPStatus.OK)
+        self.assertIn((b'Content-Type', APPLICATION_PDF.encode()), sent_messages[0].get('headers'))
+        self.assertEqual(b''.join(message.get('body', b'') for message in sent_messages[1:]), b'Hello World')
+        self.assertEqual(sent_messages[-1], {'type': 'http.response.body'})
+
+    def test_stream_application_delegates_other_requests_to_django(self):
+        delegated_scopes = []
+
+        async def django_application(scope, receive, send):
+            delegated_scopes.append(scope)
+
+        application = AssessmentFlowStreamApplication(django_application, broker=self.broker)
+        scope = {'type': 'http', 'method': 'GET', 'path': GET_TOOLS_URL}
+        async_to_sync(application)(scope, None, None)
+        self.assertEqual(delegated_scopes, [scope])
+
+
 class AssessmentToolTest(TestCase):
     def setUp(self) -> None:
         self.company = Company.objects.create_user(
@@ -2758,6 +3255,37 @@ class GetEventDataTest(TestCase):
         end_datetime = self.assessment_event.get_event_end_date_time()
         self.assertEqual(end_datetime, self.assessment_event_expected_end_time)
 
+    def test_event_end_date_time_is_stored_on_assessment_event(self):
+        stored_assessment_event = AssessmentEvent.objects.get(event_id=self.assessment_event.event_id)
+        self.assertEqual(stored_assessment_event.end_date_time, self.assessment_event_expected_end_time)
+
+    def test_event_end_date_time_is_updated_when_start_date_is_set(self):
+        self.assessment_event_2.set_start_date(datetime.datetime(2022, 12, 14, hour=8, minute=0, tzinfo=pytz.utc))
+        stored_assessment_event = AssessmentEvent.objects.get(event_id=self.assessment_event_2.event_id)
+        self.assertEqual(
+            stored_assessment_event.end_date_time,
+            datetime.datetime(2022, 12, 14, 13, 40, tzinfo=pytz.utc)
+        )
+
+    def test_event_end_date_time_is_updated_when_test_flow_is_set(self):
+        self.assessment_event_2.set_test_flow(self.test_flow_1)
+        stored_assessment_event = AssessmentEvent.objects.get(event_id=self.assessment_event_2.event_id)
+        self.assertEqual(stored_assessment_event.end_date_time, self.assessment_event_expected_end_time)
+
+    def test_event_end_date_time_is_updated_when_tool_is_added_to_test_flow(self):
+        self.test_flow_2.add_tool(
+            assessment_tool=self.assignment_2,
+            release_time=datetime.time(20, 0),
+            start_working_time=datetime.time(20, 0)
+        )
+        stored_assessment_event = AssessmentEvent.objects.get(event_id=self.assessment_event_2.event_id)
+        self.assertEqual(
+            stored_assessment_event.end_date_time,
+            datetime.datetime(2022, 12, 12, 20, 10, tzinfo=pytz.utc) + datetime.timedelta(
+                minutes=self.assignment_2.duration_in_minutes
+            )
+        )
+
     @freeze_time('2022-12-12 10:00:00')
     def test_serve_verify_assessee_participation_when_user_is_not_an_assessee(self):
         assessment_event_id = str(self.assessment_event.event_id)
@@ -3284,23 +3812,29 @@ class AssignmentSubmissionTest(TestCase):
     @patch.object(storage.Blob, 'upload_from_file')
     @patch.object(storage.Bucket, 'blob')
     @patch.object(storage.Client, 'get_bucket')
-    def test_upload_file_to_google_bucket(self, mocked_get_bucket, mocked_blob, mocked_upload, mocked_client):
+    @patch.object(storage.Client, 'bucket')
+    def test_upload_file_to_google_bucket(self, mocked_bucket, mocked_get_bucket, mocked_blob, mocked_upload,
+                                          mocked_client):
+        google_storage.reset_storage_backend()
+        self.addCleanup(google_storage.reset_storage_backend)
         destination_file_name = '/submissions/tests/test-uploaded_file.pdf'
         bucket_name = 'one-day-intern-bucket'
 
         mocked_client.return_value = None
-        mocked_get_bucket.return_value = storage.Bucket(client=None)
+        mocked_bucket.return_value = storage.Bucket(client=None, name=bucket_name)
         mocked_blob.return_value = storage.Blob(name=destination_file_name, bucket=None)
 
         uploaded_file = SimpleUploadedFile('test-file.pdf', b'<sample-uploaded_file>', content_type=APPLICATION_PDF)
-        google_storage.upload_file_to_google_bucket(
-            destination_file_name=destination_file_name,
-            bucket_name=bucket_name,
-            file=uploaded_file
-        )
+        for _ in range(2):
+            google_storage.upload_file_to_google_bucket(
+                destination_file_name=destination_file_name,
+                bucket_name=bucket_name,
+                file=uploaded_file
+            )
 
         mocked_client.assert_called_once()
-        mocked_get_bucket.assert_called_with(bucket_name)
+        mocked_bucket.assert_called_once_with(bucket_name)
+        mocked_get_bucket.assert_not_called()
         mocked_blob.assert_called_with(destination_file_name)
         mocked_upload.assert_called_with(file_obj=uploaded_file, rewind=True)
 
@@ -3514,34 +4048,270 @@ class AssignmentSubmissionTest(TestCase):
         self.assertEqual(created_attempt.filename, self.file.name)
         self.assertEqual(created_attempt.submitted_time, datetime.datetime.now(tz=pytz.utc))
 
+    @patch.object(storage.Blob, 'open')
     @patch.object(storage.Client, '__init__')
-    @patch.object(storage.Blob, 'download_as_bytes')
     @patch.object(storage.Bucket, 'get_blob')
-    @patch.object(storage.Client, 'get_bucket')
-    def test_download_file_from_google_bucket(self, mocked_get_bucket, mocked_get_blob, mocked_download_as_bytes,
-                                              mocked_client):
+    @patch.object(storage.Client, 'bucket')
+    def test_stream_file_from_google_bucket(self, mocked_bucket, mocked_get_blob, mocked_client, mocked_open):
+        google_storage.reset_storage_backend()
+        self.addCleanup(google_storage.reset_storage_backend)
         cloud_directory = '/submissions/tests/test-file.pdf'
-        target_file_name = 'test-file.pdf'
-        content_type = APPLICATION_PDF
-        bucket_name = 'one-day-intern-bucket'
         mocked_client.return_value = None
-        mocked_get_bucket.return_value = storage.Bucket(client=None)
-        mocked_get_blob.return_value = storage.Blob(name=cloud_directory, bucket=None)
-        mocked_download_as_bytes.return_value = b'Hello World'
+        mocked_bucket.return_value = storage.Bucket(client=None, name='one-day-intern-bucket')
+        blob = storage.Blob(name=cloud_directory, bucket=None)
+        blob._properties['size'] = '11'
+        mocked_get_blob.return_value = blob
+        mocked_open.return_value = io.BytesIO(b'Hello World')
 
-        downloaded_file = google_storage.download_file_from_google_bucket(
-            cloud_directory, bucket_name, target_file_name, content_type
+        streamed_file = google_storage.stream_file_from_google_bucket(
+            cloud_directory, 'one-day-intern-bucket', 'test-file.pdf', APPLICATION_PDF
         )
 
-        mocked_client.assert_called_once()
-        mocked_get_bucket.assert_called_with(bucket_name)
+        mocked_open.assert_not_called()
         mocked_get_blob.assert_called_with(cloud_directory)
-        mocked_download_as_bytes.assert_called_once()
-        self.assertTrue(isinstance(downloaded_file, SimpleUploadedFile))
-        self.assertEqual(downloaded_file.name, target_file_name)
-        self.assertEqual(downloaded_file.content_type, content_type)
+        self.assertEqual(streamed_file.name, 'test-file.pdf')
+        self.assertEqual(streamed_file.size, 11)
+        self.assertEqual(b''.join(streamed_file.iter_chunks(0, 4)), b'Hello')
+        mocked_open.assert_called_once_with('rb', chunk_size=google_storage.FILE_DOWNLOAD_CHUNK_SIZE)
+
+    @patch.object(storage.Client, '__init__')
+    @patch.object(storage.Bucket, 'get_blob')
+    @patch.object(storage.Client, 'bucket')
+    def test_stream_file_from_google_bucket_when_file_does_not_exist(self, mocked_bucket, mocked_get_blob,
+                                                                     mocked_client):
+        google_storage.reset_storage_backend()
+        self.addCleanup(google_storage.reset_storage_backend)
+        mocked_client.return_value = None
+        mocked_bucket.return_value = storage.Bucket(client=None, name='one-day-intern-bucket')
+        mocked_get_blob.return_value = None
+
+        with self.assertRaisesMessage(FileDoesNotExist, google_storage.FILE_DOES_NOT_EXIST.format('test-file.pdf')):
+            google_storage.stream_file_from_google_bucket(
+                '/submissions/tests/test-file.pdf', 'one-day-intern-bucket', 'test-file.pdf', APPLICATION_PDF
+            )
+
+    @patch.object(storage.Client, '__init__')
+    @patch.object(storage.Bucket, 'rename_blob')
+    @patch.object(storage.Client, 'bucket')
+    def test_move_file_in_google_bucket(self, mocked_bucket, mocked_rename_blob, mocked_client):
+        google_storage.reset_storage_backend()
+        self.addCleanup(google_storage.reset_storage_backend)
+        mocked_client.return_value = None
+        mocked_bucket.return_value = storage.Bucket(client=None, name='one-day-intern-bucket')
+
+        google_storage.move_file_in_google_bucket(
+            '/submissions/uploads/staged.pdf', '/submissions/tests/test-file.pdf', 'one-day-intern-bucket'
+        )
+
+        moved_blob, destination_file_name = mocked_rename_blob.call_args.args
+        self.assertEqual(moved_blob.name, '/submissions/uploads/staged.pdf')
+        self.assertEqual(destination_file_name, '/submissions/tests/test-file.pdf')
+
+    def test_stream_file_from_local_file_system_when_file_does_not_exist(self):
+        with tempfile.TemporaryDirectory() as root_directory:
+            storage_backend = google_storage.LocalFileSystemStorageBackend(root_directory)
+            with self.assertRaises(FileDoesNotExist):
+                storage_backend.stream_file(
+                    '/submissions/tests/test-file.pdf', 'one-day-intern-bucket', 'test-file.pdf', APPLICATION_PDF
+                )
+
+    def test_local_file_system_storage_backend(self):
+        with tempfile.TemporaryDirectory() as root_directory:
+            with override_settings(
+                FILE_STORAGE_BACKEND='assessment.services.google_storage.LocalFileSystemStorageBackend',
+                LOCAL_FILE_STORAGE_ROOT=root_directory
+            ):
+                google_storage.reset_storage_backend()
+                self.addCleanup(google_storage.reset_storage_backend)
+                cloud_directory = '/submissions/tests/test-file.pdf'
+                uploaded_file = SimpleUploadedFile('test-file.pdf', b'Hello World', content_type=APPLICATION_PDF)
+
+                google_storage.upload_file_to_google_bucket(cloud_directory, 'one-day-intern-bucket', uploaded_file)
+                streamed_file = google_storage.stream_file_from_google_bucket(
+                    cloud_directory, 'one-day-intern-bucket', 'test-file.pdf', APPLICATION_PDF
+                )
+
+                self.assertTrue(
+                    isinstance(google_storage.get_storage_backend(), google_storage.LocalFileSystemStorageBackend)
+                )
+                stored_file_path = os.path.join(root_directory, 'one-day-intern-bucket', 'submissions/tests/test-file.pdf')
+                self.assertTrue(os.path.exists(stored_file_path))
+                self.assertEqual(streamed_file.size, 11)
+                self.assertEqual(b''.join(streamed_file.iter_chunks(6)), b'World')
+
+    def use_local_storage_backend(self):
+        root_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(root_directory.cleanup)
+        local_storage_settings = override_settings(
+            FILE_STORAGE_BACKEND='assessment.services.google_storage.LocalFileSystemStorageBackend',
+            LOCAL_FILE_STORAGE_ROOT=root_directory.name
+        )
+        local_storage_settings.enable()
+        self.addCleanup(local_storage_settings.disable)
+        google_storage.reset_storage_backend()
+        self.addCleanup(google_storage.reset_storage_backend)
+
+    def get_direct_upload_request_data(self):
+        return {
+            'assessment-event-id': str(self.assessment_event.event_id),
+            'assessment-tool-id': str(self.assignment.assessment_id),
+            'filename': 'report.pdf'
+        }
+
+    @freeze_time("2022-11-25 12:00:00")
+    def test_direct_assignment_upload_and_download_through_signed_urls(self):
+        self.use_local_storage_backend()
+        assessee_client = APIClient()
+        assessee_client.force_authenticate(user=self.assessee)
+        request_data = self.get_direct_upload_request_data()
+
+        response = assessee_client.post(ASSIGNMENT_UPLOAD_URL, data=request_data, format='json')
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_content = json.loads(response.content)
+        self.assertEqual(response_content.get('method'), 'PUT')
+        self.assertEqual(response_content.get('content_type'), APPLICATION_PDF)
+
+        upload_url = response_content.get('upload_url')
+        upload_response = Client().put(upload_url, data=b'file_content_4100', content_type=APPLICATION_PDF)
+        self.assertEqual(upload_response.status_code, HTTPStatus.OK)
+
+        request_data['upload-id'] = response_content.get('upload_id')
+        response = assessee_client.post(FINALIZE_ASSIGNMENT_UPLOAD_URL, data=request_data, format='json')
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        upload_response = Client().put(upload_url, data=b'overwritten_content', content_type=APPLICATION_PDF)
+        self.assertEqual(upload_response.status_code, HTTPStatus.OK)
+        assignment_attempt = self.event_participation.get_assignment_attempt(self.assignment)
+        self.assertEqual(assignment_attempt.get_file_name(), 'report.pdf')
+        self.assertEqual(
+            assignment_attempt.get_attempt_cloud_directory(),
+            f'{GOOGLE_BUCKET_BASE_DIRECTORY}/{self.assessment_event.event_id}/'
+            f'{assignment_attempt.tool_attempt_id}.{self.assignment.expected_file_format}'
+        )
+
+        response = get_fetch_and_get_response(
+            GET_ASSIGNMENT_ATTEMPT_FILE_URL,
+            request_param=str(assignment_attempt.tool_attempt_id),
+            authenticated_user=self.assessor
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        download_url = json.loads(response.content).get('download_url')
+
+        download_response = Client().get(download_url)
+        self.assertEqual(download_response.status_code, HTTPStatus.OK)
+        self.assertEqual(b''.join(download_response.streaming_content), b'file_content_4100')
+        self.assertEqual(download_response.headers.get('Content-Disposition'), 'attachment; filename="report.pdf"')
+
+    @freeze_time("2022-11-25 12:00:00")
+    def test_finalize_assignment_upload_when_file_has_not_been_uploaded(self):
+        self.use_local_storage_backend()
+        client = APIClient()
+        client.force_authenticate(user=self.assessee)
+        request_data = self.get_direct_upload_request_data()
+        request_data['upload-id'] = uuid.uuid4().hex
+
+        response = client.post(FINALIZE_ASSIGNMENT_UPLOAD_URL, data=request_data, format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(json.loads(response.content).get('message'), 'Assignment file has not been uploaded')
+        self.assertIsNone(self.event_participation.get_assignment_attempt(self.assignment).get_file_name())
+
+    @freeze_time("2022-11-25 12:00:00")
+    def test_finalize_assignment_upload_when_upload_id_is_invalid(self):
+        self.use_local_storage_backend()
+        client = APIClient()
+        client.force_authenticate(user=self.assessee)
+        request_data = self.get_direct_upload_request_data()
+        request_data['upload-id'] = '../report'
+
+        response = client.post(FINALIZE_ASSIGNMENT_UPLOAD_URL, data=request_data, format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(json.loads(response.content).get('message'), 'Upload id is invalid')
+
+    def test_finalize_assignment_upload_after_submission_deadline(self):
+        self.use_local_storage_backend()
+        client = APIClient()
+        client.force_authenticate(user=self.assessee)
+        request_data = self.get_direct_upload_request_data()
+
+        with freeze_time("2022-11-25 12:00:00"):
+            response = client.post(ASSIGNMENT_UPLOAD_URL, data=request_data, format='json')
+            response_content = json.loads(response.content)
+            Client().put(response_content.get('upload_url'), data=b'file_content_4200', content_type=APPLICATION_PDF)
+
+        with freeze_time("2022-11-25 14:00:00"):
+            request_data['upload-id'] = response_content.get('upload_id')
+            response = client.post(FINALIZE_ASSIGNMENT_UPLOAD_URL, data=request_data, format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            json.loads(response.content).get('message'), 'Assessment is not accepting submissions at this time'
+        )
+        self.assertIsNone(self.event_participation.get_assignment_attempt(self.assignment).get_file_name())
+
+    @freeze_time("2022-11-25 13:45:00")
+    def test_generate_assignment_upload_url_expires_at_submission_deadline(self):
+        self.use_local_storage_backend()
+        client = APIClient()
+        client.force_authenticate(user=self.assessee)
+
+        response = client.post(ASSIGNMENT_UPLOAD_URL, data=self.get_direct_upload_request_data(), format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        upload_url = json.loads(response.content).get('upload_url')
+        url_parameters = dict(parse_qsl(upload_url.split('?', 1)[1]))
+        submission_deadline = self.assessment_event.get_tool_submission_deadline(self.assignment)
+        self.assertEqual(int(url_parameters.get('expires')), int(submission_deadline.timestamp()))
+        self.assertEqual(
+            submission_deadline,
+            datetime.datetime(2022, 11, 25, 13, 50, tzinfo=pytz.utc)
+            + datetime.timedelta(seconds=SUBMISSION_BUFFER_TIME_IN_SECONDS)
+        )
+
+    @freeze_time("2022-11-25 12:00:00")
+    def test_generate_assignment_upload_url_when_content_type_is_not_recognized(self):
+        self.assignment.expected_file_format = 'odiq'
+        self.assignment.save()
+        client = APIClient()
+        client.force_authenticate(user=self.assessee)
+        request_data = self.get_direct_upload_request_data()
+        request_data['filename'] = 'report.odiq'
+
+        response = client.post(ASSIGNMENT_UPLOAD_URL, data=request_data, format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            json.loads(response.content).get('message'), 'Content type of file report.odiq is not recognized'
+        )
+
+    @freeze_time("2022-11-25 12:00:00")
+    def test_generate_assignment_upload_url_when_file_name_does_not_match_expected(self):
+        client = APIClient()
+        client.force_authenticate(user=self.assessee)
+        request_data = self.get_direct_upload_request_data()
+        request_data['filename'] = 'report.docx'
+
+        response = client.post(ASSIGNMENT_UPLOAD_URL, data=request_data, format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(json.loads(response.content).get('message'), FILENAME_DOES_NOT_MATCH_FORMAT.format('pdf'))
 
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    def test_local_storage_signed_url_is_rejected_when_tampered_or_expired(self):
+        self.use_local_storage_backend()
+        with freeze_time("2022-11-25 12:00:00"):
+            upload_url = google_storage.generate_upload_url_for_google_bucket(
+                '/submissions/tests/test-file.pdf', GOOGLE_STORAGE_BUCKET_NAME, APPLICATION_PDF
+            )
+            tampered_url = upload_url.replace('test-file.pdf', 'other-file.pdf')
+            response = Client().put(tampered_url, data=b'Hello World', content_type=APPLICATION_PDF)
+            self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+        with freeze_time("2022-11-25 13:00:00"):
+            response = Client().put(upload_url, data=b'Hello World', content_type=APPLICATION_PDF)
+            self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_download_assignment_attempt_when_attempt_does_not_exist(self, mocked_download):
         event_participation = self.assessment_event.get_assessment_event_participation_by_assessee(self.assessee)
         assignment_attempt = event_participation.get_assignment_attempt(self.assignment)
@@ -3553,7 +4323,7 @@ class AssignmentSubmissionTest(TestCase):
         self.assertIsNone(downloaded_file)
         mocked_download.assert_not_called()
 
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_download_assignment_attempt_when_attempt_exist(self, mocked_download):
         event_participation = self.assessment_event.get_assessment_event_participation_by_assessee(self.assessee)
         assignment_attempt = event_participation.get_assignment_attempt(self.assignment)
@@ -3574,7 +4344,7 @@ class AssignmentSubmissionTest(TestCase):
         )
 
     @freeze_time("2022-11-25 12:00:00")
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_serve_submitted_assignment_when_event_with_id_does_not_exist(self, mocked_download):
         client = APIClient()
         client.force_authenticate(user=self.assessee)
@@ -3588,7 +4358,7 @@ class AssignmentSubmissionTest(TestCase):
         self.assertEqual(response_content.get('message'), EVENT_DOES_NOT_EXIST.format(invalid_event_id))
 
     @freeze_time("2022-11-23 12:00:00")
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_serve_submitted_assignment_when_event_with_id_is_not_active(self, mocked_download):
         client = APIClient()
         client.force_authenticate(user=self.assessee)
@@ -3601,7 +4371,7 @@ class AssignmentSubmissionTest(TestCase):
         self.assertEqual(response_content.get('message'), EVENT_IS_NOT_ACTIVE.format(self.assessment_event.event_id))
 
     @freeze_time("2022-11-25 12:00:00")
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_serve_submitted_assignment_event_when_user_is_not_assessee(self, mocked_download):
         client = APIClient()
         client.force_authenticate(user=self.assessor)
@@ -3614,7 +4384,7 @@ class AssignmentSubmissionTest(TestCase):
         self.assertEqual(response_content.get('message'), USER_IS_NOT_ASSESSEE.format(self.assessor.email))
 
     @freeze_time("2022-11-25 12:00:00")
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_serve_submitted_assignment_event_when_user_is_not_a_participant(self, mocked_download):
         client = APIClient()
         client.force_authenticate(user=self.assessee_2)
@@ -3630,7 +4400,7 @@ class AssignmentSubmissionTest(TestCase):
         )
 
     @freeze_time("2022-11-25 12:00:00")
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_serve_submitted_assignment_event_when_tool_does_not_exist(self, mocked_download):
         invalid_tool_id = str(uuid.uuid4())
         client = APIClient()
@@ -3647,7 +4417,7 @@ class AssignmentSubmissionTest(TestCase):
         )
 
     @freeze_time("2022-11-25 12:00:00")
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_serve_submitted_assignment_when_tool_is_not_an_assignment(self, mocked_download):
         client = APIClient()
         client.force_authenticate(user=self.assessee)
@@ -3663,15 +4433,36 @@ class AssignmentSubmissionTest(TestCase):
         )
 
     @freeze_time("2022-11-25 12:00:00")
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
+    def test_serve_submitted_assignment_when_file_does_not_exist_in_bucket(self, mocked_download):
+        event_participation = self.assessment_event.get_assessment_event_participation_by_assessee(self.assessee)
+        assignment_attempt = event_participation.get_assignment_attempt(self.assignment)
+        if not assignment_attempt:
+            assignment_attempt = event_participation.create_assignment_attempt(self.assignment)
+            assignment_attempt.update_file_name('report2385.pdf')
+        file_does_not_exist = google_storage.FILE_DOES_NOT_EXIST.format(assignment_attempt.get_file_name())
+        mocked_download.side_effect = FileDoesNotExist(file_does_not_exist)
+
+        client = APIClient()
+        client.force_authenticate(user=self.assessee)
+        parameterized_url = f'{GET_AND_DOWNLOAD_ATTEMPT_URL}' \
+                            f'?assessment-event-id={self.assessment_event.event_id}' \
+                            f'&assessment-tool-id={self.assignment.assessment_id}'
+        response = client.get(parameterized_url)
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(json.loads(response.content).get('message'), file_does_not_exist)
+
+    @freeze_time("2022-11-25 12:00:00")
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_serve_submitted_assignment_when_request_is_valid_and_attempt_exist(self, mocked_download):
         event_participation = self.assessment_event.get_assessment_event_participation_by_assessee(self.assessee)
         assignment_attempt = event_participation.get_assignment_attempt(self.assignment)
         if not assignment_attempt:
             assignment_attempt = event_participation.create_assignment_attempt(self.assignment)
             assignment_attempt.update_file_name('report2385.pdf')
-        mocked_download.return_value = SimpleUploadedFile(assignment_attempt.get_file_name(), b'Hello World',
-                                                          content_type=APPLICATION_PDF)
+        mocked_download.return_value = google_storage.StreamedFile(
+            assignment_attempt.get_file_name(), APPLICATION_PDF, 11, open_file=lambda: io.BytesIO(b'Hello World')
+        )
 
         client = APIClient()
         client.force_authenticate(user=self.assessee)
@@ -3686,7 +4477,7 @@ class AssignmentSubmissionTest(TestCase):
                          f'attachment; filename="{assignment_attempt.get_file_name()}"')
 
     @freeze_time("2022-11-25 12:00:00")
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_serve_submitted_assignment_when_request_is_valid_but_attempt_not_exist(self, mocked_download):
         event_participation = self.assessment_event.get_assessment_event_participation_by_assessee(self.assessee)
         assignment_attempt = event_participation.get_assignment_attempt(self.assignment)
@@ -4039,15 +4830,59 @@ class AssessmentToolDeadlineTest(TestCase):
             )
         )
 
-    @patch.object(AssessmentEvent, 'check_if_tool_is_submittable')
-    def test_validate_if_attempt_is_submittable_when_tool_is_submittable(self, mocked_check):
-        mocked_check.return_value = True
-        try:
-            assessment_event_attempt.validate_attempt_is_submittable(self.assignment, self.assessment_event)
-        except Exception as exception:
-            self.fail(f'{exception} is raised')
-        finally:
-            mocked_check.assert_called_with(self.assignment)
+    def test_submission_windows_are_stored_with_event(self):
+        assessment_event = AssessmentEvent.objects.get(pk=self.assessment_event.pk)
+        self.assertEqual(
+            assessment_event.submission_windows,
+            {
+                str(self.assignment.assessment_id): [
+                    datetime.datetime(2022, 11, 25, 12, 0, tzinfo=pytz.utc).timestamp(),
+                    datetime.datetime(2022, 11, 25, 14, 0, 10, tzinfo=pytz.utc).timestamp()
+                ],
+                str(self.response_test.assessment_id): None
+            }
+        )
+
+    def test_check_if_tool_is_submittable_uses_submission_windows_of_event(self):
+        assessment_event = AssessmentEvent.objects.get(pk=self.assessment_event.pk)
+
+        with self.assertNumQueries(0):
+            with freeze_time('2022-11-25 14:00:10'):
+                self.assertTrue(assessment_event.check_if_tool_is_submittable(self.assignment))
+            with freeze_time('2022-11-25 14:00:11'):
+                self.assertFalse(assessment_event.check_if_tool_is_submittable(self.assignment))
+            with freeze_time('2022-11-25 11:59:59'):
+                self.assertFalse(assessment_event.check_if_tool_is_submittable(self.assignment))
+            self.assertTrue(assessment_event.check_if_tool_is_submittable(self.response_test))
+
+    def test_check_if_tool_is_submittable_when_tool_is_not_part_of_event(self):
+        assignment = Assignment.objects.create(
+            name='Assignment 4718',
+            description='Description 4719',
+            owning_company=self.company,
+            expected_file_format='pdf',
+            duration_in_minutes=120
+        )
+        with freeze_time('2022-11-25 14:00:00'):
+            self.assertFalse(self.assessment_event.check_if_tool_is_submittable(assignment))
+
+    def test_submission_windows_follow_event_start_date(self):
+        self.assessment_event.set_start_date(datetime.datetime(2022, 11, 28, tzinfo=pytz.utc))
+
+        with freeze_time('2022-11-25 14:00:00'):
+            self.assertFalse(self.assessment_event.check_if_tool_is_submittable(self.assignment))
+        with freeze_time('2022-11-28 14:00:00'):
+            self.assertTrue(self.assessment_event.check_if_tool_is_submittable(self.assignment))
+
+    @patch.object(AssessmentEvent, 'check_if_tool_is_submittable')
+    def test_validate_if_attempt_is_submittable_when_tool_is_submittable(self, mocked_check):
+        mocked_check.return_value = True
+        try:
+            assessment_event_attempt.validate_attempt_is_submittable(self.assignment, self.assessment_event)
+        except Exception as exception:
+            self.fail(f'{exception} is raised')
+        finally:
+            mocked_check.assert_called_with(self.assignment)
 
     @patch.object(AssessmentEvent, 'check_if_tool_is_submittable')
     def test_validate_if_attempt_is_submittable_when_tool_is_not_submittable(self, mocked_check):
@@ -4515,6 +5350,92 @@ class ActiveInteractiveQuizTest(TestCase):
         self.assertEqual(text_question.get('question-type'), self.tq_attempt.get_question_type())
         self.assertEqual(text_question.get('answer'), self.tq_attempt.answer)
 
+    def test_combine_tool_attempt_data_number_of_queries_does_not_depend_on_number_of_questions(self):
+        for question_number in range(10):
+            mc_question = MultipleChoiceQuestion.objects.create(
+                interactive_quiz=self.interactive_quiz,
+                prompt=f'Multiple Choice Question {question_number}',
+                points=5,
+                question_type='multiple_choice'
+            )
+            answer_option = mc_question.save_answer_option_to_database({'content': 'Option', 'correct': True})
+            MultipleChoiceAnswerOptionAttempt.objects.create(
+                question=mc_question,
+                interactive_quiz_attempt=self.interactive_quiz_attempt,
+                is_answered=True,
+                selected_option=answer_option
+            )
+            text_question = TextQuestion.objects.create(
+                interactive_quiz=self.interactive_quiz,
+                prompt=f'Text Question {question_number}',
+                points=5,
+                question_type='text'
+            )
+            TextQuestionAttempt.objects.create(
+                question=text_question,
+                interactive_quiz_attempt=self.interactive_quiz_attempt,
+                is_answered=True,
+                answer=f'Answer {question_number}'
+            )
+
+        with self.assertNumQueries(2):
+            combined_data = assessment_event_attempt.combine_tool_attempt_data(
+                self.interactive_quiz_attempt, str(self.assessment_event.event_id)
+            )
+
+        answer_attempts = combined_data.get('answer-attempts')
+        self.assertEqual(len(answer_attempts), 22)
+        mc_question_attempt = answer_attempts[0]
+        self.assertEqual(len(mc_question_attempt.get('answer-options')), 2)
+        self.assertEqual(mc_question_attempt.get('selected-answer-option-id'), str(self.mcq_attempt.selected_option_id))
+        self.assertIn(
+            {'question-attempt-id': answer_attempts[-1].get('question-attempt-id'), 'is-answered': True,
+             'prompt': 'Text Question 9', 'question-type': 'text', 'answer': 'Answer 9'},
+            answer_attempts
+        )
+
+    def create_interactive_quiz_with_questions(self, number_of_questions):
+        interactive_quiz = InteractiveQuiz.objects.create(
+            name=f'Interactive Quiz With {number_of_questions} Questions',
+            description='Interactive Quiz Description',
+            owning_company=self.company,
+            total_points=2 * number_of_questions,
+            duration_in_minutes=30
+        )
+        for question_number in range(number_of_questions):
+            MultipleChoiceQuestion.objects.create(
+                interactive_quiz=interactive_quiz,
+                prompt=f'Multiple Choice Question {question_number}',
+                points=1,
+                question_type='multiple_choice'
+            )
+            TextQuestion.objects.create(
+                interactive_quiz=interactive_quiz,
+                prompt=f'Text Question {question_number}',
+                points=1,
+                question_type='text'
+            )
+        return interactive_quiz
+
+    def test_create_interactive_quiz_attempt_number_of_queries_does_not_depend_on_number_of_questions(self):
+        small_interactive_quiz = self.create_interactive_quiz_with_questions(1)
+        large_interactive_quiz = self.create_interactive_quiz_with_questions(40)
+
+        with CaptureQueriesContext(connection) as small_quiz_queries:
+            self.event_participation.create_interactive_quiz_attempt(small_interactive_quiz)
+        with CaptureQueriesContext(connection) as large_quiz_queries:
+            large_quiz_attempt = self.event_participation.create_interactive_quiz_attempt(large_interactive_quiz)
+
+        self.assertEqual(len(large_quiz_queries), len(small_quiz_queries))
+        self.assertEqual(large_quiz_attempt.get_all_question_attempts().count(), 80)
+        self.assertEqual(
+            MultipleChoiceAnswerOptionAttempt.objects.filter(interactive_quiz_attempt=large_quiz_attempt).count(), 40
+        )
+        text_question_attempts = TextQuestionAttempt.objects.filter(interactive_quiz_attempt=large_quiz_attempt)
+        self.assertEqual(text_question_attempts.count(), 40)
+        self.assertFalse(text_question_attempts.filter(is_answered=True).exists())
+        self.assertFalse(text_question_attempts.exclude(question__question_type='text').exists())
+
     @freeze_time('2022-12-05 10:00:00')
     def test_get_question_attempt_data_when_user_is_not_an_assessee(self):
         response = get_response_for_individual_question_attempt_data(
@@ -4862,6 +5783,120 @@ class InteractiveQuizSubmissionTest(TestCase):
         response_content = json.loads(response.content)
         self.assertEqual(response_content.get('message'), 'Answers saved successfully')
 
+    def add_unanswered_questions_to_quiz_attempt(self, number_of_questions):
+        answers = []
+        for question_number in range(number_of_questions):
+            mc_question = MultipleChoiceQuestion.objects.create(
+                interactive_quiz=self.interactive_quiz,
+                prompt=f'Multiple Choice Question {question_number}',
+                points=1,
+                question_type='multiple_choice'
+            )
+            mc_question.save_answer_option_to_database({'content': 'Incorrect Option', 'correct': False})
+            correct_answer_option = mc_question.save_answer_option_to_database({'content': 'Option', 'correct': True})
+            mcq_attempt = MultipleChoiceAnswerOptionAttempt.objects.create(
+                question=mc_question,
+                interactive_quiz_attempt=self.quiz_attempt
+            )
+            text_question = TextQuestion.objects.create(
+                interactive_quiz=self.interactive_quiz,
+                prompt=f'Text Question {question_number}',
+                points=1,
+                question_type='text'
+            )
+            tq_attempt = TextQuestionAttempt.objects.create(
+                question=text_question,
+                interactive_quiz_attempt=self.quiz_attempt
+            )
+            answers.append({
+                'question-attempt-id': str(mcq_attempt.question_attempt_id),
+                'answer-option-id': str(correct_answer_option.answer_option_id)
+            })
+            answers.append({'question-attempt-id': str(tq_attempt.question_attempt_id), 'text-answer': 'Autosaved'})
+        return answers
+
+    @freeze_time("2022-11-25 12:00:00")
+    def test_serve_submit_interactive_quiz_answers_number_of_queries_does_not_depend_on_number_of_answers(self):
+        answers = self.add_unanswered_questions_to_quiz_attempt(20)
+        request_data = self.request_data.copy()
+        submit_answers_and_get_request(self.request_data, authenticated_user=self.assessee)
+        self.quiz_attempt.refresh_from_db()
+        initial_auto_points = self.quiz_attempt.auto_points
+
+        request_data['answers'] = answers[:2]
+        with CaptureQueriesContext(connection) as single_page_queries:
+            response = submit_answers_and_get_request(request_data, authenticated_user=self.assessee)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        request_data['answers'] = answers
+        with CaptureQueriesContext(connection) as whole_quiz_queries:
+            response = submit_answers_and_get_request(request_data, authenticated_user=self.assessee)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        self.assertEqual(len(whole_quiz_queries), len(single_page_queries))
+        answered_mcq_attempts = MultipleChoiceAnswerOptionAttempt.objects.filter(
+            interactive_quiz_attempt=self.quiz_attempt, question__prompt__startswith='Multiple Choice Question'
+        )
+        self.assertEqual(answered_mcq_attempts.filter(is_answered=True, is_correct=True).count(), 20)
+        answered_tq_attempts = TextQuestionAttempt.objects.filter(
+            interactive_quiz_attempt=self.quiz_attempt, answer='Autosaved', is_answered=True
+        )
+        self.assertEqual(answered_tq_attempts.count(), 20)
+        self.quiz_attempt.refresh_from_db()
+        self.assertEqual(self.quiz_attempt.auto_points, initial_auto_points + 20)
+
+    def test_save_answer_attempts_from_stale_question_attempts_does_not_drift_aggregates(self):
+        answers = self.add_unanswered_questions_to_quiz_attempt(1)[:1]
+        self.quiz_attempt.refresh_from_db()
+        initial_auto_points = self.quiz_attempt.auto_points
+        stale_question_attempts = list(
+            self.quiz_attempt.get_question_attempts_from_ids([answers[0]['question-attempt-id']])
+        )
+
+        assessment_event_attempt.save_answer_attempts(self.quiz_attempt, {'answers': answers})
+        with patch.object(
+                InteractiveQuizAttempt, 'get_question_attempts_from_ids', return_value=stale_question_attempts
+        ):
+            assessment_event_attempt.save_answer_attempts(self.quiz_attempt, {'answers': answers})
+
+        self.quiz_attempt.refresh_from_db()
+        self.assertEqual(self.quiz_attempt.auto_points, initial_auto_points + 1)
+
+    @freeze_time("2022-11-25 12:00:00")
+    def test_serve_submit_interactive_quiz_answers_when_answer_option_is_not_of_the_question(self):
+        request_data = self.request_data.copy()
+        answers = self.add_unanswered_questions_to_quiz_attempt(1)
+        request_data['answers'] = [{
+            'question-attempt-id': answers[0]['question-attempt-id'],
+            'answer-option-id': str(self.correct_answer_option.answer_option_id)
+        }]
+
+        response = submit_answers_and_get_request(request_data, authenticated_user=self.assessee)
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            json.loads(response.content).get('message'),
+            f'Answer option with id {self.correct_answer_option.answer_option_id} is not an option of question '
+            f'attempt {answers[0]["question-attempt-id"]}'
+        )
+        self.assertFalse(MultipleChoiceAnswerOptionAttempt.objects.get(
+            question_attempt_id=answers[0]['question-attempt-id']
+        ).is_answered)
+
+    @freeze_time("2022-11-25 12:00:00")
+    def test_serve_submit_interactive_quiz_answers_when_question_attempt_does_not_exist(self):
+        request_data = self.request_data.copy()
+        invalid_question_attempt_id = str(uuid.uuid4())
+        request_data['answers'] = [{'question-attempt-id': invalid_question_attempt_id, 'text-answer': 'Answer'}]
+
+        response = submit_answers_and_get_request(request_data, authenticated_user=self.assessee)
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            json.loads(response.content).get('message'),
+            f'Question attempt with id {invalid_question_attempt_id} does not exist'
+        )
+
     @freeze_time("2022-11-25 12:00:00")
     def test_serve_submit_interactive_quiz_when_request_is_valid(self):
         response = fetch_and_get_response(SUBMIT_INTERACTIVE_QUIZ_URL, self.request_data,
@@ -5064,11 +6099,8 @@ class ViewEventProgressTest(TestCase):
         self.assertEqual(attempt.tool_attempt_id, assignment_attempt.tool_attempt_id)
         assignment_attempt.delete()
 
-    @patch.object(AssessmentEventParticipation, 'get_assessment_tool_attempt')
-    def test_generate_assessee_report_when_no_attempt_has_been_submitted(self, mock_get_attempt):
-        mock_get_attempt.return_value = None
+    def test_generate_assessee_report_when_no_attempt_has_been_submitted(self):
         assessee_report = self.assessment_event_participation.generate_assessee_report()
-        mock_get_attempt.assert_called_with(self.assignment_1)
         self.assertEqual(len(assessee_report), 1)
         tool_report = assessee_report[0]
         self.assertEqual(tool_report['tool_name'], self.assignment_1.name)
@@ -5078,17 +6110,14 @@ class ViewEventProgressTest(TestCase):
         self.assertEqual(tool_report['grade'], 0)
         self.assertIsNone(tool_report['note'])
 
-    @patch.object(AssessmentEventParticipation, 'get_assessment_tool_attempt')
-    def test_generate_assessee_report_when_an_attempt_has_been_submitted(self, mock_get_attempt):
+    def test_generate_assessee_report_when_an_attempt_has_been_submitted(self):
         temporary_attempt = AssignmentAttempt.objects.create(
             test_flow_attempt=self.assessment_event_participation.attempt,
             assessment_tool_attempted=self.assignment_1,
             grade=98,
             note='Need a little bit more explanation'
         )
-        mock_get_attempt.return_value = temporary_attempt
         assessee_report = self.assessment_event_participation.generate_assessee_report()
-        mock_get_attempt.assert_called_with(self.assignment_1)
         self.assertEqual(len(assessee_report), 1)
         tool_report = assessee_report[0]
         self.assertEqual(tool_report['tool_name'], self.assignment_1.name)
@@ -5099,24 +6128,78 @@ class ViewEventProgressTest(TestCase):
         self.assertEqual(tool_report['note'], temporary_attempt.note)
         temporary_attempt.delete()
 
-    @patch.object(AssessmentEventParticipation, 'get_assessment_tool_attempt')
-    def test_get_event_progress_when_no_attempt_has_been_submitted(self, mock_get_attempt):
-        mock_get_attempt.return_value = None
+    def add_attempted_interactive_quiz_to_test_flow(self, number_of_questions):
+        interactive_quiz = InteractiveQuiz.objects.create(
+            name='Interactive Quiz 5650',
+            description='Interactive Quiz Description 5651',
+            owning_company=self.company,
+            duration_in_minutes=60,
+            total_points=20 * number_of_questions
+        )
+        for question_number in range(number_of_questions):
+            multiple_choice_question = MultipleChoiceQuestion.objects.create(
+                interactive_quiz=interactive_quiz,
+                prompt=f'Multiple Choice Question {question_number}',
+                points=10,
+                question_type='multiple_choice'
+            )
+            multiple_choice_question.save_answer_option_to_database({'content': 'Correct Option', 'correct': True})
+            TextQuestion.objects.create(
+                interactive_quiz=interactive_quiz,
+                prompt=f'Text Question {question_number}',
+                points=10,
+                question_type='text',
+                answer_key='Answer Key'
+            )
+        self.test_flow.add_tool(
+            interactive_quiz,
+            release_time=datetime.time(14, 30),
+            start_working_time=datetime.time(14, 30)
+        )
+
+        interactive_quiz_attempt = self.assessment_event_participation.create_interactive_quiz_attempt(interactive_quiz)
+        for mcq_attempt in MultipleChoiceAnswerOptionAttempt.objects.filter(
+                interactive_quiz_attempt=interactive_quiz_attempt):
+            mcq_attempt.set_selected_option(mcq_attempt.question.multiplechoicequestion.get_answer_options()[0].answer_option_id)
+        for text_question_attempt in TextQuestionAttempt.objects.filter(interactive_quiz_attempt=interactive_quiz_attempt):
+            text_question_attempt.set_answer('Answer')
+            text_question_attempt.set_awarded_points(5)
+        return interactive_quiz_attempt
+
+    def assert_generate_assessee_report_number_of_queries(self, expected_number_of_queries):
+        self.assessment_event_participation.generate_assessee_report()
+        participation = AssessmentEventParticipation.objects.get(pk=self.assessment_event_participation.pk)
+        with self.assertNumQueries(expected_number_of_queries):
+            return participation.generate_assessee_report()
+
+    def test_generate_assessee_report_number_of_queries_does_not_depend_on_tools_and_questions(self):
+        self.add_attempted_interactive_quiz_to_test_flow(number_of_questions=1)
+        self.assert_generate_assessee_report_number_of_queries(8)
+
+        for _ in range(3):
+            interactive_quiz_attempt = self.add_attempted_interactive_quiz_to_test_flow(number_of_questions=4)
+        assessee_report = self.assert_generate_assessee_report_number_of_queries(8)
+
+        self.assertEqual(len(assessee_report), 5)
+        quiz_report = assessee_report[-1]
+        self.assertEqual(quiz_report['type'], 'interactivequiz')
+        self.assertTrue(quiz_report['is_attempted'])
+        self.assertEqual(quiz_report['grade'], 75)
+        interactive_quiz_attempt.refresh_from_db()
+        self.assertEqual(interactive_quiz_attempt.grade, 0)
+
+    def test_get_event_progress_when_no_attempt_has_been_submitted(self):
         progress_data = self.assessment_event_participation.get_event_progress()
-        mock_get_attempt.assert_called_with(self.assignment_1)
         self.assertEqual(len(progress_data), 1)
         attempt_data = progress_data[0]
         self.assertDictEqual(attempt_data, self.expected_attempt_data)
 
-    @patch.object(AssessmentEventParticipation, 'get_assessment_tool_attempt')
-    def test_get_event_progress_when_an_attempt_has_been_submitted(self, mock_get_attempt):
+    def test_get_event_progress_when_an_attempt_has_been_submitted(self):
         temporary_attempt = AssignmentAttempt.objects.create(
             test_flow_attempt=self.assessment_event_participation.attempt,
             assessment_tool_attempted=self.assignment_1,
         )
-        mock_get_attempt.return_value = temporary_attempt
         progress_data = self.assessment_event_participation.get_event_progress()
-        mock_get_attempt.assert_called_with(self.assignment_1)
         self.assertEqual(len(progress_data), 1)
         attempt_data = progress_data[0]
         expected_attempt_data = self.expected_attempt_data.copy()
@@ -5124,6 +6207,41 @@ class ViewEventProgressTest(TestCase):
         self.assertDictEqual(attempt_data, expected_attempt_data)
         temporary_attempt.delete()
 
+    def assert_get_event_progress_number_of_queries(self, expected_number_of_queries):
+        self.assessment_event_participation.get_event_progress()
+        participation = AssessmentEventParticipation.objects.get(pk=self.assessment_event_participation.pk)
+        with self.assertNumQueries(expected_number_of_queries):
+            return participation.get_event_progress()
+
+    def test_get_event_progress_number_of_queries_does_not_depend_on_tools_and_questions(self):
+        self.add_attempted_interactive_quiz_to_test_flow(number_of_questions=1)
+        self.assert_get_event_progress_number_of_queries(7)
+
+        for tool_number in range(3):
+            assignment = Assignment.objects.create(
+                name=f'Assignment {tool_number}',
+                description='Assignment Description 5735',
+                owning_company=self.company,
+                expected_file_format='pdf',
+                duration_in_minutes=60
+            )
+            self.test_flow.add_tool(
+                assignment,
+                release_time=datetime.time(12, 30),
+                start_working_time=datetime.time(12, 30)
+            )
+            interactive_quiz_attempt = self.add_attempted_interactive_quiz_to_test_flow(number_of_questions=4)
+        progress_data = self.assert_get_event_progress_number_of_queries(7)
+
+        self.assertEqual(len(progress_data), 8)
+        quiz_progress_data = progress_data[-1]
+        self.assertEqual(quiz_progress_data['type'], 'interactivequiz')
+        self.assertEqual(quiz_progress_data['attempt-id'], interactive_quiz_attempt.tool_attempt_id)
+        self.assertEqual(
+            quiz_progress_data['tool-data'],
+            InteractiveQuizSerializer(interactive_quiz_attempt.assessment_tool_attempted.get_real_instance()).data
+        )
+
     def assert_get_assessee_progress_invalid_request(self, event_id, assessee_email, assessor, expected_status_code,
                                                      expected_message):
         response = fetch_progress_data_of_assessee(
@@ -5700,7 +6818,7 @@ class GradingTest(TestCase):
         self.assertEqual(response_content.get('grade'), self.assignment_attempt.grade)
         self.assertEqual(response_content.get('note'), self.assignment_attempt.note)
 
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_get_assignment_attempt_file_when_attempt_with_id_does_not_exist(self, mocked_download):
         invalid_attempt_id = str(uuid.uuid4())
         response = get_fetch_and_get_response(
@@ -5713,7 +6831,7 @@ class GradingTest(TestCase):
         response_content = json.loads(response.content)
         self.assertEqual(response_content.get('message'), TOOL_ATTEMPT_DOES_NOT_EXIST.format(invalid_attempt_id))
 
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_get_assignment_attempt_file_when_user_is_not_assessor(self, mocked_download):
         attempt_id = str(self.assignment_attempt.tool_attempt_id)
         response = get_fetch_and_get_response(
@@ -5726,7 +6844,7 @@ class GradingTest(TestCase):
         response_content = json.loads(response.content)
         self.assertEqual(response_content.get('message'), ASSESSOR_NOT_FOUND.format(self.assessee_1))
 
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_get_assignment_attempt_file_when_assessor_is_not_responsible_for_assessee(self, mocked_download):
         attempt_id = str(self.assignment_attempt.tool_attempt_id)
         response = get_fetch_and_get_response(
@@ -5746,7 +6864,7 @@ class GradingTest(TestCase):
             )
         )
 
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_get_assignment_attempt_file_when_no_file_has_been_submitted(self, mocked_download):
         self.assignment_attempt.update_attempt_cloud_directory(None)
         self.assignment_attempt.update_file_name(None)
@@ -5765,12 +6883,13 @@ class GradingTest(TestCase):
         self.assignment_attempt.update_attempt_cloud_directory('/filename.pdf')
         self.assignment_attempt.update_file_name('filename.pdf')
 
-    @patch.object(google_storage, 'download_file_from_google_bucket')
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
     def test_get_assignment_attempt_file_when_a_file_has_been_submitted(self, mocked_download):
-        dummy_file = SimpleUploadedFile(
+        dummy_file = google_storage.StreamedFile(
             self.assignment_attempt.get_file_name(),
-            b'Hello World',
-            content_type=APPLICATION_PDF
+            APPLICATION_PDF,
+            11,
+            open_file=lambda: io.BytesIO(b'Hello World')
         )
         mocked_download.return_value = dummy_file
 
@@ -5789,6 +6908,60 @@ class GradingTest(TestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertEqual(response.headers.get('Content-Length'), str(dummy_file.size))
         self.assertEqual(response.headers.get('Content-Disposition'), f'attachment; filename="{dummy_file.name}"')
+        self.assertTrue(response.streaming)
+        self.assertEqual(b''.join(response.streaming_content), b'Hello World')
+
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
+    def test_get_assignment_attempt_file_when_a_byte_range_is_requested(self, mocked_download):
+        mocked_download.return_value = google_storage.StreamedFile(
+            self.assignment_attempt.get_file_name(),
+            APPLICATION_PDF,
+            11,
+            open_file=lambda: io.BytesIO(b'Hello World'),
+            chunk_size=2
+        )
+        client = APIClient()
+        client.force_authenticate(user=self.assessor_responsible_for_1)
+
+        response = client.get(
+            GET_ASSIGNMENT_ATTEMPT_DATA_FILE + str(self.assignment_attempt.tool_attempt_id),
+            HTTP_RANGE='bytes=6-'
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.PARTIAL_CONTENT)
+        self.assertEqual(response.headers.get('Content-Range'), 'bytes 6-10/11')
+        self.assertEqual(response.headers.get('Content-Length'), '5')
+        self.assertEqual(list(response.streaming_content), [b'Wo', b'rl', b'd'])
+
+    @patch.object(google_storage, 'stream_file_from_google_bucket')
+    def test_get_assignment_attempt_file_when_byte_range_is_not_satisfiable(self, mocked_download):
+        mocked_download.return_value = google_storage.StreamedFile(
+            self.assignment_attempt.get_file_name(),
+            APPLICATION_PDF,
+            11,
+            open_file=lambda: io.BytesIO(b'Hello World')
+        )
+        client = APIClient()
+        client.force_authenticate(user=self.assessor_responsible_for_1)
+
+        response = client.get(
+            GET_ASSIGNMENT_ATTEMPT_DATA_FILE + str(self.assignment_attempt.tool_attempt_id),
+            HTTP_RANGE='bytes=20-30'
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(response.headers.get('Content-Range'), 'bytes */11')
+
+    def test_get_requested_byte_range(self):
+        self.assertIsNone(utils.get_requested_byte_range(None, 100))
+        self.assertIsNone(utils.get_requested_byte_range('bytes=0-10,20-30', 100))
+        self.assertIsNone(utils.get_requested_byte_range('bytes=a-b', 100))
+        self.assertEqual(utils.get_requested_byte_range('bytes=10-19', 100), (10, 19))
+        self.assertEqual(utils.get_requested_byte_range('bytes=90-200', 100), (90, 99))
+        self.assertEqual(utils.get_requested_byte_range('bytes=-10', 100), (90, 99))
+        self.assertEqual(utils.get_requested_byte_range('bytes=50-', 100), (50, 99))
+        with self.assertRaises(RangeNotSatisfiable):
+            utils.get_requested_byte_range('bytes=100-', 100)
 
 
 def get_response_for_active_quiz_data(attempt_id, authenticated_user):
@@ -5999,7 +7172,7 @@ class InteractiveQuizGradingTest(TestCase):
 
         request_data = self.tq_request_data.copy()
         del request_data['grade']
-        grading.set_text_question_attempt_grade(self.quiz_attempt, self.tq_attempt, request_data)
+        grading.set_text_question_attempt_grade(self.tq_attempt, request_data)
 
         self.assertEqual(self.quiz_attempt.grade, 0)
         self.assertEqual(self.tq_attempt.point, 5.0)
@@ -6015,9 +7188,9 @@ class InteractiveQuizGradingTest(TestCase):
 
         request_data = self.tq_request_data.copy()
         del request_data['note']
-        grading.set_text_question_attempt_grade(self.quiz_attempt, self.tq_attempt, request_data)
+        grading.set_text_question_attempt_grade(self.tq_attempt, request_data)
 
-        self.assertEqual(self.quiz_attempt.grade, request_data.get('grade'))
+        self.assertEqual(self.tq_attempt.awarded_points, request_data.get('grade'))
         self.assertEqual(self.tq_attempt.point, request_data.get('grade'))
         self.assertIsNone(self.tq_attempt.question_note)
 
@@ -6027,27 +7200,49 @@ class InteractiveQuizGradingTest(TestCase):
         self.assertEqual(self.quiz_attempt.grade, self.mcq_request_data.get('grade'))
         self.assertEqual(self.mcq_attempt.question_note, self.mcq_request_data.get('note'))
 
-        grading.set_text_question_attempt_grade(self.quiz_attempt, self.tq_attempt, self.tq_request_data)
+        grading.set_text_question_attempt_grade(self.tq_attempt, self.tq_request_data)
 
-        self.assertEqual(self.quiz_attempt.grade, self.tq_request_data.get('grade'))
+        self.assertEqual(self.tq_attempt.awarded_points, self.tq_request_data.get('grade'))
         self.assertEqual(self.tq_attempt.point, self.tq_request_data.get('grade'))
         self.assertEqual(self.tq_attempt.question_note, self.tq_request_data.get('note'))
 
     def test_update_grade(self):
-        grading.set_text_question_attempt_grade(self.quiz_attempt, self.tq_attempt, self.tq_request_data)
+        grading.set_text_question_attempt_grade(self.tq_attempt, self.tq_request_data)
 
-        self.assertEqual(self.quiz_attempt.grade, self.tq_request_data.get('grade'))
+        self.assertEqual(self.tq_attempt.awarded_points, self.tq_request_data.get('grade'))
         self.assertEqual(self.tq_attempt.point, self.tq_request_data.get('grade'))
         self.assertEqual(self.tq_attempt.question_note, self.tq_request_data.get('note'))
 
         request_data = self.tq_request_data.copy()
         request_data['grade'] = 2
-        grading.set_text_question_attempt_grade(self.quiz_attempt, self.tq_attempt, request_data)
+        grading.set_text_question_attempt_grade(self.tq_attempt, request_data)
 
-        self.assertEqual(self.quiz_attempt.grade, request_data.get('grade'))
+        self.assertEqual(self.tq_attempt.awarded_points, request_data.get('grade'))
         self.assertEqual(self.tq_attempt.point, request_data.get('grade'))
         self.assertEqual(self.tq_attempt.question_note, self.tq_request_data.get('note'))
 
+    def test_question_changes_update_quiz_attempt_point_aggregates(self):
+        self.mcq_attempt.set_selected_option(self.correct_answer_option.answer_option_id)
+        self.tq_attempt.set_answer('An answer')
+        grading.set_text_question_attempt_grade(self.tq_attempt, self.tq_request_data)
+        self.quiz_attempt.refresh_from_db()
+        self.assertEqual(self.quiz_attempt.auto_points, self.mc_question.points)
+        self.assertEqual(self.quiz_attempt.manual_points, self.tq_request_data.get('grade'))
+
+        request_data = self.tq_request_data.copy()
+        request_data['grade'] = 2
+        grading.set_text_question_attempt_grade(self.tq_attempt, request_data)
+        self.mcq_attempt.set_is_correct(False)
+        self.quiz_attempt.refresh_from_db()
+        self.assertEqual(self.quiz_attempt.auto_points, 0)
+        self.assertEqual(self.quiz_attempt.manual_points, 2)
+
+        # the locking read and the update of the grade, wrapped in a savepoint inside the test transaction
+        with self.assertNumQueries(4):
+            grade = self.quiz_attempt.calculate_total_points()
+        self.assertEqual(grade, (2 / self.interactive_quiz.total_points) * 100)
+        self.assertEqual(ToolAttempt.objects.get(tool_attempt_id=self.quiz_attempt.tool_attempt_id).grade, grade)
+
     def test_grade_question_attempt_when_id_is_none(self):
         request_data = self.mcq_request_data.copy()
         del request_data['tool-attempt-id']
@@ -6225,6 +7420,57 @@ class InteractiveQuizGradingTest(TestCase):
         self.assertEqual(changed_attempt.grade, 0.0)
         self.assertEqual(changed_attempt.note, request_data.get('note'))
 
+    def test_combine_tool_grading_data_stays_within_query_budget_regardless_of_quiz_size(self):
+        for question_number in range(25):
+            mc_question = MultipleChoiceQuestion.objects.create(
+                interactive_quiz=self.interactive_quiz,
+                prompt=f'Multiple Choice Question {question_number}',
+                points=2,
+                question_type='multiple_choice'
+            )
+            answer_option = mc_question.save_answer_option_to_database({'content': 'Option', 'correct': False})
+            MultipleChoiceAnswerOptionAttempt.objects.create(
+                question=mc_question,
+                interactive_quiz_attempt=self.quiz_attempt,
+                is_answered=True,
+                selected_option=answer_option
+            )
+            text_question = TextQuestion.objects.create(
+                interactive_quiz=self.interactive_quiz,
+                prompt=f'Text Question {question_number}',
+                points=2,
+                question_type='text',
+                answer_key=f'Answer Key {question_number}'
+            )
+            TextQuestionAttempt.objects.create(
+                question=text_question,
+                interactive_quiz_attempt=self.quiz_attempt,
+                is_answered=True,
+                answer=f'Answer {question_number}'
+            )
+
+        with self.assertNumQueries(2):
+            combined_data = grading.combine_tool_grading_data(self.quiz_attempt)
+
+        answer_attempts = combined_data.get('answer-attempts')
+        self.assertEqual(len(answer_attempts), 52)
+        mc_question_attempt = next(
+            answer_attempt for answer_attempt in answer_attempts
+            if answer_attempt.get('question-attempt-id') == str(self.mcq_attempt.question_attempt_id)
+        )
+        self.assertEqual(mc_question_attempt.get('answer-options'), [
+            {'answer-option-id': str(self.correct_answer_option.answer_option_id),
+             'content': self.correct_answer_option.content, 'correct': True},
+            {'answer-option-id': str(self.incorrect_answer_option.answer_option_id),
+             'content': self.incorrect_answer_option.content, 'correct': False},
+        ])
+        answer_keys = {
+            answer_attempt.get('prompt'): answer_attempt.get('answer-key') for answer_attempt in answer_attempts
+            if answer_attempt.get('question-type') == 'text'
+        }
+        self.assertEqual(answer_keys['Text Question 24'], 'Answer Key 24')
+        self.assertEqual(answer_keys[self.text_question.prompt], self.text_question.answer_key)
+
     def test_get_interactive_quiz_attempt_data_when_attempt_with_id_does_not_exist(self):
         invalid_tool_attempt_id = str(uuid.uuid4())
         response = get_response_for_active_quiz_data(
@@ -6422,6 +7668,296 @@ class InteractiveQuizGradingTest(TestCase):
         self.assertEqual(tq_data.get('answer-key'), self.text_question.answer_key)
         self.assertEqual(tq_data.get('is-graded'), self.tq_attempt.is_graded)
 
+    def test_set_grade_of_tool_attempt_only_updates_grade(self):
+        with CaptureQueriesContext(connection) as captured_queries:
+            self.assignment_attempt.set_grade(80)
+
+        self.assertEqual(len(captured_queries), 1)
+        self.assertNotIn('note', captured_queries[0]['sql'])
+        self.assertEqual(ToolAttempt.objects.get(tool_attempt_id=self.assignment_attempt.tool_attempt_id).grade, 80)
+
+    def test_set_grade_does_not_overwrite_concurrent_note(self):
+        stale_assignment_attempt = AssignmentAttempt.objects.get(tool_attempt_id=self.assignment_attempt.tool_attempt_id)
+        self.assignment_attempt.set_note('Well structured')
+        stale_assignment_attempt.set_grade(75)
+
+        assignment_attempt = AssignmentAttempt.objects.get(tool_attempt_id=self.assignment_attempt.tool_attempt_id)
+        self.assertEqual(assignment_attempt.note, 'Well structured')
+        self.assertEqual(assignment_attempt.grade, 75)
+
+    def test_set_awarded_points_from_stale_instances_does_not_lose_updates(self):
+        self.tq_attempt.set_answer('An answer')
+        first_grader_attempt = TextQuestionAttempt.objects.get(question_attempt_id=self.tq_attempt.question_attempt_id)
+        second_grader_attempt = TextQuestionAttempt.objects.get(question_attempt_id=self.tq_attempt.question_attempt_id)
+
+        first_grader_attempt.set_awarded_points(2)
+        second_grader_attempt.set_awarded_points(4)
+
+        quiz_attempt = InteractiveQuizAttempt.objects.get(tool_attempt_id=self.quiz_attempt.tool_attempt_id)
+        self.assertEqual(quiz_attempt.manual_points, 4)
+        self.assertEqual(quiz_attempt.calculate_total_points(), 40)
+
+    def get_bulk_grade_request_data(self):
+        return {'grades': [
+            {'tool-attempt-id': str(self.assignment_attempt.tool_attempt_id), 'grade': 90, 'note': 'Good work'},
+            {'question-attempt-id': str(self.tq_attempt.question_attempt_id), 'grade': 4, 'note': 'Almost'},
+            {'question-attempt-id': str(self.mcq_attempt.question_attempt_id), 'is_correct': False, 'note': 'Wrong'}
+        ]}
+
+    def test_bulk_grade_attempts_when_request_is_valid(self):
+        self.mcq_attempt.set_selected_option(self.correct_answer_option.answer_option_id)
+        self.tq_attempt.set_answer('An answer')
+
+        response = fetch_and_get_response(
+            BULK_GRADE_URL, self.get_bulk_grade_request_data(), authenticated_user=self.assessor_responsible_for_1
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_content = json.loads(response.content)
+        self.assertEqual(response_content.get('graded_tool_attempts'), [str(self.assignment_attempt.tool_attempt_id)])
+        self.assertEqual(
+            response_content.get('interactive_quiz_grades'), {str(self.quiz_attempt.tool_attempt_id): 40}
+        )
+
+        assignment_attempt = ToolAttempt.objects.get(tool_attempt_id=self.assignment_attempt.tool_attempt_id)
+        self.assertEqual(assignment_attempt.grade, 90)
+        self.assertEqual(assignment_attempt.note, 'Good work')
+
+        tq_attempt = TextQuestionAttempt.objects.get(question_attempt_id=self.tq_attempt.question_attempt_id)
+        self.assertEqual(tq_attempt.point, 4)
+        self.assertEqual(tq_attempt.awarded_points, 4)
+        self.assertTrue(tq_attempt.is_graded)
+        self.assertEqual(tq_attempt.question_note, 'Almost')
+
+        mcq_attempt = MultipleChoiceAnswerOptionAttempt.objects.get(
+            question_attempt_id=self.mcq_attempt.question_attempt_id
+        )
+        self.assertFalse(mcq_attempt.is_correct)
+        self.assertEqual(mcq_attempt.question_note, 'Wrong')
+
+        quiz_attempt = InteractiveQuizAttempt.objects.get(tool_attempt_id=self.quiz_attempt.tool_attempt_id)
+        self.assertEqual(quiz_attempt.auto_points, 0)
+        self.assertEqual(quiz_attempt.manual_points, 4)
+        self.assertEqual(quiz_attempt.grade, 40)
+
+    def test_bulk_grade_attempts_authorises_with_one_query_per_attempt_kind(self):
+        self.mcq_attempt.set_selected_option(self.correct_answer_option.answer_option_id)
+        self.tq_attempt.set_answer('An answer')
+
+        with CaptureQueriesContext(connection) as captured_queries:
+            grading.bulk_grade_attempts(self.get_bulk_grade_request_data(), self.assessor_responsible_for_1)
+
+        authorising_queries = [
+            query['sql'] for query in captured_queries
+            if 'assessment_assessmenteventparticipation' in query['sql']
+        ]
+        self.assertEqual(len(authorising_queries), 2)
+        self.assertFalse(any(
+            'FROM "assessment_question"' in query['sql'] for query in captured_queries
+        ))
+
+    def create_answered_question_attempts(self, count):
+        question_attempts = []
+        for _ in range(count):
+            mc_question = MultipleChoiceQuestion.objects.create(
+                interactive_quiz=self.interactive_quiz,
+                prompt='Extra multiple choice prompt',
+                points=2,
+                question_type='multiple_choice'
+            )
+            question_attempts.append(MultipleChoiceAnswerOptionAttempt.objects.create(
+                interactive_quiz_attempt=self.quiz_attempt,
+                question=mc_question,
+                is_answered=True,
+                is_correct=True
+            ))
+            text_question = TextQuestion.objects.create(
+                interactive_quiz=self.interactive_quiz,
+                prompt='Extra text prompt',
+                points=2,
+                question_type='text',
+                answer_key='Answer key'
+            )
+            question_attempts.append(TextQuestionAttempt.objects.create(
+                interactive_quiz_attempt=self.quiz_attempt,
+                question=text_question,
+                is_answered=True,
+                answer='An answer'
+            ))
+        return question_attempts
+
+    def get_bulk_grade_queries_count(self, question_attempts):
+        request_data = {'grades': [
+            {'question-attempt-id': str(question_attempt.question_attempt_id), 'is_correct': False, 'grade': 1}
+            for question_attempt in question_attempts
+        ]}
+        with CaptureQueriesContext(connection) as captured_queries:
+            grading.bulk_grade_attempts(request_data, self.assessor_responsible_for_1)
+        return len(captured_queries)
+
+    def test_bulk_grade_attempts_queries_do_not_grow_with_question_attempts(self):
+        few_attempts_queries_count = self.get_bulk_grade_queries_count(self.create_answered_question_attempts(1))
+        many_attempts_queries_count = self.get_bulk_grade_queries_count(self.create_answered_question_attempts(5))
+        self.assertEqual(many_attempts_queries_count, few_attempts_queries_count)
+
+    def test_bulk_grade_attempts_reads_is_correct_key_of_single_grade_request(self):
+        self.mcq_attempt.set_selected_option(self.correct_answer_option.answer_option_id)
+        request_data = {'grades': [{
+            'question-attempt-id': self.mcq_request_data.get('question-attempt-id'),
+            'is_correct': False
+        }]}
+        response = fetch_and_get_response(BULK_GRADE_URL, request_data, authenticated_user=self.assessor_responsible_for_1)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        mcq_attempt = MultipleChoiceAnswerOptionAttempt.objects.get(
+            question_attempt_id=self.mcq_attempt.question_attempt_id
+        )
+        self.assertFalse(mcq_attempt.is_correct)
+        quiz_attempt = InteractiveQuizAttempt.objects.get(tool_attempt_id=self.quiz_attempt.tool_attempt_id)
+        self.assertEqual(quiz_attempt.auto_points, 0)
+
+    def test_bulk_grade_attempts_when_assessor_is_not_responsible_for_an_attempt(self):
+        response = fetch_and_get_response(
+            BULK_GRADE_URL, self.get_bulk_grade_request_data(), authenticated_user=self.assessor_responsible_for_2
+        )
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+        self.assertEqual(ToolAttempt.objects.get(tool_attempt_id=self.assignment_attempt.tool_attempt_id).grade, 0)
+
+    def test_bulk_grade_attempts_when_a_grade_is_outside_of_constraint(self):
+        request_data = self.get_bulk_grade_request_data()
+        request_data['grades'][1]['grade'] = self.text_question.points + 1
+
+        response = fetch_and_get_response(BULK_GRADE_URL, request_data, authenticated_user=self.assessor_responsible_for_1)
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(json.loads(response.content).get('message'), 'Cannot give points outside of constraint')
+        self.assertEqual(ToolAttempt.objects.get(tool_attempt_id=self.assignment_attempt.tool_attempt_id).grade, 0)
+
+    def test_bulk_grade_attempts_when_an_attempt_is_graded_twice(self):
+        request_data = self.get_bulk_grade_request_data()
+        request_data['grades'].append(request_data['grades'][0])
+
+        response = fetch_and_get_response(BULK_GRADE_URL, request_data, authenticated_user=self.assessor_responsible_for_1)
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            json.loads(response.content).get('message'),
+            f'Attempt with id {self.assignment_attempt.tool_attempt_id} is graded more than once'
+        )
+
+    def test_bulk_grade_attempts_when_entry_has_no_attempt_id(self):
+        response = fetch_and_get_response(
+            BULK_GRADE_URL, {'grades': [{'grade': 10}]}, authenticated_user=self.assessor_responsible_for_1
+        )
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            json.loads(response.content).get('message'),
+            'Each grade entry must have either a tool attempt id or a question attempt id'
+        )
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Row locks are only exercised against PostgreSQL')
+class ConcurrentGradingTest(TransactionTestCase):
+    NUMBER_OF_QUESTIONS = 8
+    GRADERS_PER_QUESTION = 3
+    QUESTION_POINTS = 10
+
+    def setUp(self) -> None:
+        self.company = Company.objects.create_user(
+            email='company7516@email.com',
+            password='Password7517',
+            company_name='Company 7518',
+            description='Description 7519',
+            address='Address 7520'
+        )
+
+        self.assessor = Assessor.objects.create_user(
+            email='assessor7524@email.com',
+            password='Password7525',
+            first_name='Assessor',
+            last_name='7527',
+            phone_number='+628231237528',
+            associated_company=self.company,
+            authentication_service=AuthenticationService.DEFAULT.value
+        )
+
+        self.assessee = Assessee.objects.create_user(
+            email='assessee7533@email.com',
+            password='Password7534',
+            first_name='Assessee',
+            last_name='7536',
+            phone_number='+628231237537',
+            date_of_birth=datetime.datetime(2000, 1, 1),
+            authentication_service=AuthenticationService.DEFAULT.value
+        )
+
+        self.interactive_quiz = InteractiveQuiz.objects.create(
+            name='Interactive Quiz 7543',
+            description='Description 7544',
+            owning_company=self.company,
+            total_points=self.NUMBER_OF_QUESTIONS * self.QUESTION_POINTS,
+            duration_in_minutes=60
+        )
+        for question_number in range(self.NUMBER_OF_QUESTIONS):
+            TextQuestion.objects.create(
+                interactive_quiz=self.interactive_quiz,
+                prompt=f'Question {question_number}',
+                points=self.QUESTION_POINTS,
+                question_type='text',
+                answer_key='Answer key'
+            )
+
+        self.test_flow = TestFlow.objects.create(name='TestFlow 7557', owning_company=self.company)
+        self.test_flow.add_tool(
+            assessment_tool=self.interactive_quiz,
+            release_time=datetime.time(9, 0),
+            start_working_time=datetime.time(9, 0)
+        )
+        self.event = AssessmentEvent.objects.create(
+            name='Assessment Event 7564',
+            start_date_time=datetime.datetime(2022, 12, 1, tzinfo=pytz.utc),
+            owning_company=self.company,
+            test_flow_used=self.test_flow
+        )
+        self.event.add_participant(assessee=self.assessee, assessor=self.assessor)
+        event_participation = self.event.get_assessment_event_participation_by_assessee(self.assessee)
+        self.quiz_attempt = event_participation.create_interactive_quiz_attempt(self.interactive_quiz)
+        self.text_question_attempts = list(TextQuestionAttempt.objects.filter(interactive_quiz_attempt=self.quiz_attempt))
+        for text_question_attempt in self.text_question_attempts:
+            text_question_attempt.set_answer('An answer')
+
+    @staticmethod
+    def grade_question_attempt(question_attempt_id, awarded_points, barrier):
+        try:
+            text_question_attempt = TextQuestionAttempt.objects.get(question_attempt_id=question_attempt_id)
+            barrier.wait()
+            text_question_attempt.set_awarded_points(awarded_points)
+            text_question_attempt.interactive_quiz_attempt.calculate_total_points()
+        finally:
+            connection.close()
+
+    def test_parallel_graders_do_not_lose_updates(self):
+        grades = [
+            (text_question_attempt.question_attempt_id, grader + 1)
+            for text_question_attempt in self.text_question_attempts
+            for grader in range(self.GRADERS_PER_QUESTION)
+        ]
+        barrier = threading.Barrier(len(grades))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(grades)) as executor:
+            futures = [
+                executor.submit(self.grade_question_attempt, question_attempt_id, awarded_points, barrier)
+                for question_attempt_id, awarded_points in grades
+            ]
+            for future in futures:
+                future.result()
+
+        awarded_points = TextQuestionAttempt.objects.filter(interactive_quiz_attempt=self.quiz_attempt) \
+            .values_list('awarded_points', flat=True)
+        quiz_attempt = InteractiveQuizAttempt.objects.get(tool_attempt_id=self.quiz_attempt.tool_attempt_id)
+        self.assertEqual(quiz_attempt.manual_points, sum(awarded_points))
+        self.assertAlmostEqual(
+            quiz_attempt.grade,
+            InteractiveQuizAttempt.get_percentage_grade(sum(awarded_points), self.interactive_quiz.total_points)
+        )
+
 
 class ActiveResponseTest(TestCase):
     def setUp(self) -> None:
@@ -6600,6 +8136,244 @@ class ActiveResponseTest(TestCase):
         self.assertEqual(response_content, [self.expected_tool_data])
 
 
+class ReleasedToolsTest(TestCase):
+    def setUp(self) -> None:
+        self.assessee = Assessee.objects.create_user(
+            email='assessee7560@gmail.com',
+            password='Password7561',
+            first_name='Assessee 7562',
+            last_name='Assessee 7563',
+            phone_number='+628231237564',
+            date_of_birth=datetime.datetime(2002, 12, 2),
+            authentication_service=AuthenticationService.DEFAULT.value
+        )
+
+        self.company = Company.objects.create_user(
+            email='company7570@gmail.com',
+            password='Password7571',
+            company_name='Company 7572',
+            description='Description 7573',
+            address='Address 7574'
+        )
+
+        self.assessor = Assessor.objects.create_user(
+            email='assessor7578@gmail.com',
+            password='Password7579',
+            first_name='Assessor 7580',
+            last_name='Assessor 7581',
+            phone_number='+628231237582',
+            associated_company=self.company,
+            authentication_service=AuthenticationService.DEFAULT.value
+        )
+
+        self.assignment = Assignment.objects.create(
+            name='Assignment 7587',
+            description='Description 7588',
+            owning_company=self.company,
+            expected_file_format='pdf',
+            duration_in_minutes=60
+        )
+
+        self.interactive_quiz = InteractiveQuiz.objects.create(
+            name='Interactive Quiz 7595',
+            description='Description 7596',
+            owning_company=self.company,
+            duration_in_minutes=30,
+            total_points=10
+        )
+
+        self.response_test = ResponseTest.objects.create(
+            name='Response Test 7603',
+            description='Description 7604',
+            owning_company=self.company,
+            sender='sender7606@gmail.com',
+            subject='Subject 7607',
+            prompt='Prompt 7608'
+        )
+
+        self.video_conference_notification = VideoConferenceNotification.objects.create(
+            name='Video Conference Notification 7612',
+            description='Description 7613',
+            owning_company=self.company,
+            subject='Subject 7615',
+            message='Message 7616'
+        )
+
+        self.test_flow = TestFlow.objects.create(name='TestFlow 7619', owning_company=self.company)
+        self.test_flow.add_tool(self.assignment, release_time=datetime.time(9, 0), start_working_time=datetime.time(9, 0))
+        self.test_flow.add_tool(
+            self.video_conference_notification,
+            release_time=datetime.time(9, 30),
+            start_working_time=datetime.time(9, 30)
+        )
+        self.test_flow.add_tool(
+            self.interactive_quiz,
+            release_time=datetime.time(10, 0),
+            start_working_time=datetime.time(10, 0)
+        )
+        self.test_flow.add_tool(
+            self.response_test,
+            release_time=datetime.time(11, 0),
+            start_working_time=datetime.time(11, 0)
+        )
+
+        self.assessment_event = AssessmentEvent.objects.create(
+            name='Assessment Event 7637',
+            start_date_time=datetime.datetime(2022, 12, 5),
+            owning_company=self.company,
+            test_flow_used=self.test_flow
+        )
+        self.assessment_event.add_participant(assessee=self.assessee, assessor=self.assessor)
+
+    @freeze_time('2022-12-05 10:30:00')
+    def test_get_all_released_tools_when_some_tools_have_been_released(self):
+        released_tools = self.assessment_event.get_all_released_tools()
+
+        self.assertEqual([tool.get('id') for tool in released_tools['assignments']], [str(self.assignment.assessment_id)])
+        self.assertEqual(
+            [tool.get('id') for tool in released_tools['interactive_quizzes']],
+            [str(self.interactive_quiz.assessment_id)]
+        )
+        self.assertEqual(released_tools['response_tests'], [])
+        self.assertEqual(released_tools['assignments'][0], self.assessment_event.get_released_assignments()[0])
+        self.assertEqual(
+            released_tools['interactive_quizzes'][0]['additional_info'],
+            {'duration_in_minutes': self.interactive_quiz.duration_in_minutes}
+        )
+
+    @freeze_time('2022-12-05 11:00:00')
+    def test_get_all_released_tools_is_served_from_release_schedule(self):
+        self.assessment_event.get_all_released_tools()
+
+        with self.assertNumQueries(0):
+            released_tools = self.assessment_event.get_all_released_tools()
+
+        self.assertEqual(len(released_tools['assignments']), 1)
+        self.assertEqual(len(released_tools['interactive_quizzes']), 1)
+        self.assertEqual(len(released_tools['response_tests']), 1)
+        self.assertEqual(released_tools['response_tests'][0]['additional_info']['sender'], self.response_test.sender)
+
+    @freeze_time('2022-12-06 11:00:00')
+    def test_get_all_released_tools_when_its_not_event_day(self):
+        with self.assertNumQueries(0):
+            released_tools = self.assessment_event.get_all_released_tools()
+
+        self.assertEqual(released_tools, {'assignments': [], 'interactive_quizzes': [], 'response_tests': []})
+
+    def test_release_schedule_is_compiled_once_per_schedule_version(self):
+        release_schedule.clear_compiled_release_schedules()
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            compiled_schedule = self.test_flow.get_release_schedule()
+
+        with self.assertNumQueries(0):
+            self.assertIs(self.test_flow.get_release_schedule(), compiled_schedule)
+            tools_data = self.test_flow.get_tools_data()
+
+        self.assertEqual(
+            [tool_data['assessment_data']['name'] for tool_data in tools_data],
+            [self.assignment.name, self.video_conference_notification.name,
+             self.interactive_quiz.name, self.response_test.name]
+        )
+
+    def test_release_schedule_is_loaded_from_cache_in_a_new_process(self):
+        compiled_schedule = self.test_flow.get_release_schedule()
+        release_schedule.clear_compiled_release_schedules()
+
+        with self.assertNumQueries(0):
+            cached_schedule = self.test_flow.get_release_schedule()
+
+        self.assertEqual(cached_schedule.get_tools_data(), compiled_schedule.get_tools_data())
+
+    def test_release_schedule_does_not_expose_its_tool_data(self):
+        tools_data = self.test_flow.get_tools_data()
+        tools_data[0]['assessment_data']['additional_info']['duration'] = 0
+        self.assertEqual(
+            self.test_flow.get_tools_data()[0]['assessment_data']['additional_info']['duration'],
+            self.assignment.duration_in_minutes
+        )
+
+    def test_add_tool_invalidates_release_schedule(self):
+        self.test_flow.get_release_schedule()
+        schedule_version = self.test_flow.schedule_version
+        assignment = Assignment.objects.create(
+            name='Assignment 7780',
+            description='Description 7781',
+            owning_company=self.company,
+            expected_file_format='pdf',
+            duration_in_minutes=15
+        )
+
+        self.test_flow.add_tool(assignment, release_time=datetime.time(12, 0), start_working_time=datetime.time(12, 0))
+
+        self.assertEqual(self.test_flow.schedule_version, schedule_version + 1)
+        self.assertEqual(len(self.test_flow.get_tools_data()), 5)
+        self.assertIsNotNone(self.test_flow.get_release_schedule().get_scheduled_tool(assignment.assessment_id))
+
+    def test_add_tool_from_stale_instances_gives_each_tool_its_own_schedule_version(self):
+        schedule_version = self.test_flow.schedule_version
+        last_end_time_offset = self.test_flow.last_end_time_offset
+        stale_test_flow = TestFlow.objects.get(pk=self.test_flow.pk)
+        assignments = [
+            Assignment.objects.create(
+                name=f'Assignment {duration_in_minutes}',
+                description='Description 8250',
+                owning_company=self.company,
+                expected_file_format='pdf',
+                duration_in_minutes=duration_in_minutes
+            )
+            for duration_in_minutes in (15, 30)
+        ]
+
+        self.test_flow.add_tool(
+            assignments[0], release_time=datetime.time(23, 0), start_working_time=datetime.time(23, 0)
+        )
+        stale_test_flow.add_tool(
+            assignments[1], release_time=datetime.time(0, 0), start_working_time=datetime.time(0, 0)
+        )
+
+        self.assertEqual(stale_test_flow.schedule_version, schedule_version + 2)
+        test_flow = TestFlow.objects.get(pk=self.test_flow.pk)
+        self.assertEqual(test_flow.schedule_version, schedule_version + 2)
+        self.assertEqual(
+            test_flow.last_end_time_offset, max(last_end_time_offset, datetime.timedelta(hours=23, minutes=15))
+        )
+        self.assertEqual(len(stale_test_flow.get_tools_data()), 6)
+
+    @freeze_time('2022-12-05 10:30:00')
+    def test_check_if_tool_is_submittable_does_not_query(self):
+        self.test_flow.get_release_schedule()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.assessment_event.check_if_tool_is_submittable(self.interactive_quiz))
+            self.assertFalse(self.assessment_event.check_if_tool_is_submittable(self.video_conference_notification))
+
+    @freeze_time('2022-12-05 10:00:00')
+    def test_serve_get_all_released_tools_when_tools_have_been_released(self):
+        response = get_fetch_and_get_response(
+            GET_RELEASED_TOOLS,
+            request_param=str(self.assessment_event.event_id),
+            authenticated_user=self.assessee
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_content = json.loads(response.content)
+        self.assertEqual(len(response_content.get('assignments')), 1)
+        self.assertEqual(response_content.get('interactive_quizzes')[0].get('released_time'), '2022-12-05T10:00:00')
+        self.assertEqual(response_content.get('response_tests'), [])
+
+    @freeze_time('2022-12-05 10:00:00')
+    def test_serve_get_all_released_tools_when_user_is_not_an_assessee(self):
+        response = get_fetch_and_get_response(
+            GET_RELEASED_TOOLS,
+            request_param=str(self.assessment_event.event_id),
+            authenticated_user=self.assessor
+        )
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+        response_content = json.loads(response.content)
+        self.assertEqual(response_content.get('message'), USER_IS_NOT_ASSESSEE.format(self.assessor))
+
+
 class ResponseTestSubmissionTest(TestCase):
     def setUp(self) -> None:
         self.company_1 = Company.objects.create_user(
@@ -7189,3 +8963,38 @@ class ResponseTestSubmissionTest(TestCase):
         self.assertEqual(response_content.get('grade'), response_test_attempt.grade)
         self.assertEqual(response_content.get('note'), response_test_attempt.note)
         response_test_attempt.delete()
+
+
+class QueryIndexAuditTest(TestCase):
+    def setUp(self) -> None:
+        self.company = Company.objects.create_user(
+            email='company7700@email.com',
+            password='Password7701',
+            company_name='Company 7702',
+            description='Description 7703',
+            address='Company 7704 address'
+        )
+        self.test_flow = TestFlow.objects.create(name='Test Flow 7705', owning_company=self.company, is_usable=True)
+
+    def test_audit_query_indexes_when_every_query_pattern_uses_an_index(self):
+        output = io.StringIO()
+        call_command('audit_query_indexes', stdout=output)
+        self.assertNotIn('SEQUENTIAL SCAN', output.getvalue())
+        self.assertIn('OK assessment event by event id', output.getvalue())
+        self.assertIn('OK tool attempt of test flow attempt by tool', output.getvalue())
+
+    @patch('assessment.management.commands.audit_query_indexes.get_query_patterns')
+    def test_audit_query_indexes_when_query_pattern_scans_table_sequentially(self, mocked_get_query_patterns):
+        mocked_get_query_patterns.return_value = [
+            ('test flow by name', TestFlow.objects.filter(name=self.test_flow.name))
+        ]
+        with self.assertRaisesMessage(CommandError, 'test flow by name (assessment_testflow)'):
+            call_command('audit_query_indexes', stdout=io.StringIO())
+
+    def test_get_sequentially_scanned_tables_of_postgresql_query_plan(self):
+        query_plan = (
+            'Nested Loop  (cost=0.29..16.34 rows=1 width=16)\n'
+            '  ->  Seq Scan on assessment_testflow  (cost=0.00..8.01 rows=1 width=8)\n'
+            '  ->  Index Scan using users_company_pkey on users_company  (cost=0.29..8.31 rows=1 width=8)'
+        )
+        self.assertEqual(audit_query_indexes.get_sequentially_scanned_tables(query_plan), ['assessment_testflow'])
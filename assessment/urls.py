@@ -11,11 +11,14 @@ from .views import (
     serve_get_all_active_response_test,
     serve_create_interactive_quiz,
     serve_add_assessment_event_participant,
+    serve_bulk_add_assessment_event_participant,
     serve_get_test_flow,
     serve_subscribe_to_assessment_flow,
     serve_get_assessment_event_data,
     serve_submit_response_test,
     serve_submit_assignment,
+    serve_generate_assignment_upload_url,
+    serve_finalize_assignment_upload,
     serve_get_submitted_assignment,
     serve_submit_interactive_quiz,
     serve_submit_answer,
@@ -24,13 +27,17 @@ from .views import (
     serve_grade_assessment_tool_attempts,
     serve_get_assignment_attempt_data,
     serve_get_assignment_attempt_file,
+    serve_get_assignment_attempt_file_url,
+    serve_local_storage_file,
     serve_grade_individual_question_attempts,
+    serve_bulk_grade_attempts,
     serve_save_graded_attempt,
     serve_get_interactive_quiz_grading_data,
     serve_create_video_conference_notification,
     serve_get_submitted_response_test,
     serve_review_response_test_attempt_data,
     serve_get_all_active_interactive_quizzes,
+    serve_get_all_released_tools,
     serve_get_submitted_quiz,
     serve_get_submitted_question,
     serve_get_question_grading_data,
@@ -50,6 +57,7 @@ urlpatterns = [
     path('assessment-event/update/', serve_update_assessment_event, name='assessment-event-update'),
     path('assessment-event/delete/', serve_delete_assessment_event, name='assessment-event-delete'),
     path('assessment-event/add-participant/', serve_add_assessment_event_participant, name='event-add-participation'),
+    path('assessment-event/bulk-add-participant/', serve_bulk_add_assessment_event_participant, name='event-bulk-add-participation'),
     path('assessment-event/subscribe/', serve_subscribe_to_assessment_flow, name='event-subscription'),
     path('assessment-event/released-response-tests/', serve_get_all_active_response_test, name='event-active-response-tests'),
     path('assessment-event/submit-response-test/', serve_submit_response_test, name='submit-response-test'),
@@ -57,8 +65,11 @@ urlpatterns = [
     path('assessment-event/released-assignments/', serve_get_all_active_assignment, name='event-active-assignments'),
     path('assessment-event/get-data/', serve_get_assessment_event_data, name='get-event-data'),
     path('assessment-event/submit-assignments/', serve_submit_assignment, name='submit-assignments'),
+    path('assessment-event/assignment-upload-url/', serve_generate_assignment_upload_url, name='assignment-upload-url'),
+    path('assessment-event/finalize-assignment-upload/', serve_finalize_assignment_upload, name='finalize-assignment-upload'),
     path('assessment-event/get-submitted-assignment/', serve_get_submitted_assignment, name='get-submitted-assignment'),
     path('assessment-event/released-interactive-quizzes/', serve_get_all_active_interactive_quizzes, name='event-active-interactive-quizzes'),
+    path('assessment-event/released-tools/', serve_get_all_released_tools, name='event-released-tools'),
     path('assessment-event/get-submitted-quiz/', serve_get_submitted_quiz, name='get-submitted-quiz'),
     path('assessment-event/get-submitted-question/', serve_get_submitted_question, name='get-submitted-question'),
     path('assessment-event/submit-answers/', serve_submit_answer, name='submit-interactive-quiz-answers'),
@@ -67,11 +78,14 @@ urlpatterns = [
     path('assessment-event/get-data/assessor/', serve_assessor_get_assessment_event_data, name='assessor-get-event-data'),
     path('grade/submit-grade-and-note/', serve_grade_assessment_tool_attempts, name='submit-grade-and-note'),
     path('grade/individual-question/', serve_grade_individual_question_attempts, name='grade-individual-question'),
+    path('grade/bulk/', serve_bulk_grade_attempts, name='bulk-grade'),
     path('grade/interactive-quiz/', serve_save_graded_attempt, name='grade-interactive-quiz'),
     path('review/interactive-quiz/', serve_get_interactive_quiz_grading_data, name='review-interactive-quiz'),
     path('review/individual-question/', serve_get_question_grading_data, name='review-individual-question'),
     path('review/assignment/data/', serve_get_assignment_attempt_data, name='get-assignment-attempt-data'),
     path('review/assignment/file/', serve_get_assignment_attempt_file, name='get-assignment-attempt-file'),
+    path('review/assignment/file-url/', serve_get_assignment_attempt_file_url, name='get-assignment-attempt-file-url'),
+    path('storage/local/', serve_local_storage_file, name='local-storage-file'),
     path('assessment-event/report/', serve_get_assessee_report_on_assessment_event, name='get-asseessee-report'),
     path('assessment/review/response-test/', serve_review_response_test_attempt_data, name='review-response-test')
 ]
\ No newline at end of file
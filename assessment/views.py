@@ -1,5 +1,6 @@
 from django.core.exceptions import ObjectDoesNotExist
-from django.views.decorators.http import require_POST, require_GET
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST, require_GET, require_http_methods
 from django.http.response import HttpResponse, StreamingHttpResponse
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
@@ -14,11 +15,12 @@ from .services.assessment import create_assignment, create_interactive_quiz, cre
     create_video_conference_notification
 from one_day_intern.exceptions import RestrictedAccessException
 from users.services import utils as user_utils
-from .services import utils
+from .services import utils, google_storage
 from .services.test_flow import create_test_flow
 from .services.assessment_event import (
     create_assessment_event,
     add_assessment_event_participation,
+    bulk_add_assessment_event_participation,
     update_assessment_event,
     delete_assessment_event
 )
@@ -30,10 +32,13 @@ from .services.assessment_event_attempt import (
     get_assessment_event_data,
     submit_response_test,
     submit_assignment,
+    generate_assignment_upload_url,
+    finalize_assignment_upload,
     get_submitted_assignment,
     submit_interactive_quiz,
     submit_interactive_quiz_answers,
     get_all_active_interactive_quiz,
+    get_all_released_tools,
     get_submitted_individual_question,
     get_submitted_interactive_quiz
 
@@ -47,11 +52,13 @@ from .services.grading import (
     grade_assessment_tool,
     get_assignment_attempt_data,
     get_assignment_attempt_file,
+    get_assignment_attempt_file_url,
     get_response_test_attempt_data,
     grade_interactive_quiz_individual_question,
     grade_interactive_quiz,
     get_interactive_quiz_grading_data,
-    get_question_grading_data
+    get_question_grading_data,
+    bulk_grade_attempts
 )
 from .models import (
     AssignmentSerializer,
@@ -65,6 +72,7 @@ from .models import (
     ResponseTestAttemptSerializer,
     GradedResponseTestAttemptSerializer
 )
+import io
 import json
 
 NO_ATTEMPT_FOUND = 'No attempt found'
@@ -194,6 +202,32 @@ def serve_add_assessment_event_participant(request):
     return Response(data={'message': 'Participants are successfully added'})
 
 
+@require_POST
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def serve_bulk_add_assessment_event_participant(request):
+    """
+    Endpoint can only be accessed by company/assessor
+    request_data has the same format as the add participant request.
+    Every row that can be enrolled is added in one transaction,
+    rows that cannot be enrolled are reported without aborting the batch.
+    A valid response looks like this.
+    {
+        added_participants: [<AssesseeEmail>],
+        errors: [
+            {
+                assessee_email: <AssesseeEmail>,
+                assessor_email: <AssessorEmail>,
+                message: <ErrorMessage>
+            }
+        ]
+    }
+    """
+    request_data = json.loads(request.body.decode('utf-8'))
+    response_data = bulk_add_assessment_event_participation(request_data, user=request.user)
+    return Response(data=response_data)
+
+
 @require_POST
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -355,6 +389,43 @@ def serve_submit_assignment(request):
     return Response(data={'message': 'File uploaded successfully'}, status=200)
 
 
+@require_POST
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def serve_generate_assignment_upload_url(request):
+    """
+    This view will serve as the end-point for assessees to get a short-lived signed URL
+    to upload their assignment attempt directly to the storage bucket.
+    ----------------------------------------------------------
+    request-data must contain:
+    assessment-event-id: string
+    assessment-tool-id: string
+    filename: string
+    """
+    request_data = json.loads(request.body.decode('utf-8'))
+    upload_url_data = generate_assignment_upload_url(request_data, user=request.user)
+    return Response(data=upload_url_data, status=200)
+
+
+@require_POST
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def serve_finalize_assignment_upload(request):
+    """
+    This view will serve as the end-point for assessees to record an assignment attempt
+    that has been uploaded through a signed upload URL.
+    ----------------------------------------------------------
+    request-data must contain:
+    assessment-event-id: string
+    assessment-tool-id: string
+    filename: string
+    upload-id: string (returned together with the signed upload URL)
+    """
+    request_data = json.loads(request.body.decode('utf-8'))
+    finalize_assignment_upload(request_data, user=request.user)
+    return Response(data={'message': 'File uploaded successfully'}, status=200)
+
+
 @require_GET
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -371,7 +442,7 @@ def serve_get_submitted_assignment(request):
     request_data = request.GET
     downloaded_file = get_submitted_assignment(request_data, user=request.user)
     if downloaded_file:
-        return utils.generate_file_response(downloaded_file)
+        return utils.generate_streaming_file_response(downloaded_file, request.headers.get('Range'))
     else:
         return Response(data={'message': NO_ATTEMPT_FOUND}, status=200)
 
@@ -390,6 +461,20 @@ def serve_get_all_active_interactive_quizzes(request):
     return Response(data=active_quizzes)
 
 
+@require_GET
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def serve_get_all_released_tools(request):
+    """
+    Endpoint that can only be accessed by assessee.
+    Returns the released assignments, interactive quizzes and response tests of the event in one response.
+    URL structure /released-tools/?assessment-event-id=<assessment-event-id>
+    """
+    request_data = request.GET
+    released_tools = get_all_released_tools(request_data, user=request.user)
+    return Response(data=released_tools)
+
+
 @require_GET
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -555,11 +640,66 @@ def serve_get_assignment_attempt_file(request):
     downloaded_file = get_assignment_attempt_file(request_data, user=request.user)
 
     if downloaded_file:
-        return utils.generate_file_response(downloaded_file)
+        return utils.generate_streaming_file_response(downloaded_file, request.headers.get('Range'))
+    else:
+        return Response(data={'message': NO_ATTEMPT_FOUND}, status=200)
+
+
+@require_GET
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def serve_get_assignment_attempt_file_url(request):
+    """
+    This view will serve as the end-point for assessor to get a short-lived signed URL
+    to download the assessee submitted assignment directly from the storage bucket.
+    ----------------------------------------------------------
+    request-data must contain:
+    tool-attempt-id: string
+    Format:
+    assessment/review/assignment/file-url/?tool-attempt-id=<ToolAttemptId>
+    """
+    request_data = request.GET
+    download_url = get_assignment_attempt_file_url(request_data, user=request.user)
+
+    if download_url:
+        return Response(data={'download_url': download_url}, status=200)
     else:
         return Response(data={'message': NO_ATTEMPT_FOUND}, status=200)
 
 
+@csrf_exempt
+@require_http_methods(['GET', 'PUT'])
+def serve_local_storage_file(request):
+    """
+    This view serves the signed upload and download URLs issued by the local file system storage backend.
+    The request is authorized by the URL signature instead of the user session.
+    """
+    storage_backend = google_storage.get_storage_backend()
+    if not isinstance(storage_backend, google_storage.LocalFileSystemStorageBackend):
+        return HttpResponse(status=404)
+
+    url_parameters = request.GET.dict()
+    if not google_storage.verify_local_url_signature(url_parameters, request.method):
+        return HttpResponse(status=403)
+
+    file_cloud_directory = url_parameters.get('path')
+    bucket_name = url_parameters.get('bucket')
+
+    if request.method == 'PUT':
+        if url_parameters.get('content_type') and request.content_type != url_parameters.get('content_type'):
+            return HttpResponse(status=403)
+        storage_backend.upload_file(file_cloud_directory, bucket_name, io.BytesIO(request.body))
+        return HttpResponse(status=200)
+
+    if not storage_backend.file_exists(file_cloud_directory, bucket_name):
+        return HttpResponse(status=404)
+
+    streamed_file = storage_backend.stream_file(
+        file_cloud_directory, bucket_name, url_parameters.get('filename'), url_parameters.get('content_type') or None
+    )
+    return utils.generate_streaming_file_response(streamed_file, request.headers.get('Range'))
+
+
 @require_POST
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -618,6 +758,33 @@ def serve_grade_individual_question_attempts(request):
     )
 
 
+@require_POST
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def serve_bulk_grade_attempts(request):
+    """
+    This view will serve as the end-point for assessors to grade many tool attempts and
+    interactive quiz question attempts of their assessees at once.
+    Either every grade is saved or none of them is.
+    ----------------------------------------------------------
+    request-data must contain:
+    grades: list of objects containing
+        tool-attempt-id: string or question-attempt-id: string
+        grade: float (tool attempt or text question)
+        is_correct: boolean (multiple choice question)
+        note: string
+    A valid response looks like this.
+    {
+        graded_tool_attempts: [<ToolAttemptId>],
+        graded_question_attempts: [<QuestionAttemptId>],
+        interactive_quiz_grades: {<ToolAttemptId>: <Grade>}
+    }
+    """
+    request_data = json.loads(request.body.decode('utf-8'))
+    response_data = bulk_grade_attempts(request_data, user=request.user)
+    return Response(data=response_data, status=200)
+
+
 @require_POST
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
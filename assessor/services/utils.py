@@ -1,16 +1,13 @@
 from django.contrib.auth.models import User
 from one_day_intern.exceptions import RestrictedAccessException
 from users.models import Assessor, Company
+from users.services import utils as user_utils
 
 
 def get_assessor_or_company_from_user(user: User):
-    found_assessors = Assessor.objects.filter(email=user.email)
+    concrete_user = user_utils.get_concrete_user(user)
 
-    if found_assessors:
-        return found_assessors[0]
+    if isinstance(concrete_user, (Assessor, Company)):
+        return concrete_user
     else:
-        found_company = Company.objects.filter(email=user.email)
-        if found_company:
-            return found_company[0]
-        else:
-            raise RestrictedAccessException(f'User with email {user.email} is not an assessor')
\ No newline at end of file
+        raise RestrictedAccessException(f'User with email {user.email} is not an assessor')
\ No newline at end of file
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from one_day_intern import settings
+from ...services import outbox
+import time
+
+
+class Command(BaseCommand):
+    help = 'Delivers the queued outbound emails in batches over a reused SMTP connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.EMAIL_OUTBOX_BATCH_SIZE)
+        parser.add_argument('--poll-interval', type=float, default=settings.EMAIL_OUTBOX_POLL_INTERVAL_IN_SECONDS)
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Deliver the due emails and exit instead of polling the outbox'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        while True:
+            sent_count = outbox.deliver_queued_emails(batch_size)
+            if sent_count < batch_size:
+                if options['once']:
+                    return
+                time.sleep(options['poll_interval'])
@@ -0,0 +1,48 @@
+from django.db import models
+from django.utils import timezone
+import datetime
+
+
+class OutboundEmail(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed')
+    ]
+
+    subject = models.TextField()
+    text = models.TextField(blank=True, default='')
+    html = models.TextField(blank=True, default='')
+    from_email = models.TextField(null=True)
+    recipients = models.JSONField(default=list)
+    status = models.CharField(choices=STATUS_CHOICES, default=STATUS_PENDING, max_length=7)
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [models.Index(fields=['status', 'next_attempt_at'])]
+
+    def mark_as_sent(self):
+        self.status = self.STATUS_SENT
+        self.sent_at = timezone.now()
+        self.last_error = None
+
+    def mark_as_failed_attempt(self, error, max_attempts, retry_base_delay_in_seconds):
+        """
+        Failed deliveries are retried with an exponential backoff until max_attempts is reached
+        """
+        self.attempts += 1
+        self.last_error = str(error)
+
+        if self.attempts >= max_attempts:
+            self.status = self.STATUS_FAILED
+        else:
+            retry_delay_in_seconds = retry_base_delay_in_seconds * 2 ** (self.attempts - 1)
+            self.next_attempt_at = timezone.now() + datetime.timedelta(seconds=retry_delay_in_seconds)
@@ -2,13 +2,14 @@ from assessment.services import utils as assessment_utils
 from django.contrib.auth.models import User
 from one_day_intern.exceptions import RestrictedAccessException
 from users.models import Company
+from users.services import utils as user_utils
 
 
 def get_company_or_raise_exception(user: User):
     user_email = user.email
-    found_companies = Company.objects.filter(email=user_email)
-    if len(found_companies) > 0:
-        return found_companies[0]
+    concrete_user = user_utils.get_concrete_user(user)
+    if isinstance(concrete_user, Company):
+        return concrete_user
     else:
         raise RestrictedAccessException(f'User {user_email} is not a company')
 
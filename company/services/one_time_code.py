@@ -55,7 +55,7 @@ def email_one_time_code(request_data: dict, company: Company):
     for email in assessor_emails:
         message = generate_message(email, company)
         messages_to_sent.append(message)
-    utils.send_mass_html_mail(messages_to_sent)
+    utils.queue_mass_html_mail(messages_to_sent)
 
 
 def send_one_time_code_to_assessors(request_data: dict, user: User):
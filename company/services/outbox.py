@@ -0,0 +1,71 @@
+from django.core import mail
+from django.db import transaction
+from django.utils import timezone
+from one_day_intern import settings
+from ..models import OutboundEmail
+from . import utils
+
+
+def get_due_outbound_emails(batch_size):
+    return list(
+        OutboundEmail.objects.select_for_update(skip_locked=True)
+        .filter(status=OutboundEmail.STATUS_PENDING, next_attempt_at__lte=timezone.now())
+        .order_by('next_attempt_at')[:batch_size]
+    )
+
+
+def deliver_outbound_email(outbound_email: OutboundEmail, connection):
+    message = utils.build_html_mail(
+        outbound_email.subject,
+        outbound_email.text,
+        outbound_email.html,
+        outbound_email.from_email,
+        outbound_email.recipients,
+        connection=connection
+    )
+    message.send(fail_silently=False)
+
+
+def record_failed_attempt(outbound_email: OutboundEmail, exception):
+    outbound_email.mark_as_failed_attempt(
+        exception,
+        max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+        retry_base_delay_in_seconds=settings.EMAIL_OUTBOX_RETRY_BASE_DELAY_IN_SECONDS
+    )
+
+
+def deliver_queued_emails(batch_size=None) -> int:
+    """
+    Delivers one batch of due outbox messages over a single reused SMTP connection.
+    Returns the number of messages that were sent.
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    sent_count = 0
+
+    with transaction.atomic():
+        outbound_emails = get_due_outbound_emails(batch_size)
+        if not outbound_emails:
+            return sent_count
+
+        connection = mail.get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as exception:
+            for outbound_email in outbound_emails:
+                record_failed_attempt(outbound_email, exception)
+        else:
+            for outbound_email in outbound_emails:
+                try:
+                    deliver_outbound_email(outbound_email, connection)
+                    outbound_email.mark_as_sent()
+                    sent_count += 1
+                except Exception as exception:
+                    record_failed_attempt(outbound_email, exception)
+        finally:
+            connection.close()
+
+        OutboundEmail.objects.bulk_update(
+            outbound_emails, ['status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at']
+        )
+
+    return sent_count
@@ -1,12 +1,29 @@
 from django.core import mail
+from ..models import OutboundEmail
+
+
+def build_html_mail(subject, text, html, from_email, recipient, connection=None):
+    message = mail.EmailMultiAlternatives(subject, text, from_email, recipient, connection=connection)
+    message.attach_alternative(html, 'text/html')
+    return message
 
 
 def send_mass_html_mail(datatuple):
     connection = mail.get_connection(fail_silently=False)
     messages = []
     for subject, text, html, from_email, recipient in datatuple:
-        message = mail.EmailMultiAlternatives(subject, text, from_email, recipient)
-        message.attach_alternative(html, 'text/html')
+        message = build_html_mail(subject, text, html, from_email, recipient)
         messages.append(message)
 
     return connection.send_messages(messages)
+
+
+def queue_mass_html_mail(datatuple):
+    """
+    Stores the messages in the outbox so the request does not wait for the SMTP session.
+    The messages are delivered by the send_queued_emails management command.
+    """
+    return OutboundEmail.objects.bulk_create([
+        OutboundEmail(subject=subject, text=text, html=html, from_email=from_email, recipients=list(recipient))
+        for subject, text, html, from_email, recipient in datatuple
+    ])
@@ -4,7 +4,10 @@ from django.core import mail
 from django.shortcuts import reverse
 from django.core.mail.backends.smtp import EmailBackend
 from rest_framework.test import APIClient
-from .services import utils, one_time_code, company as company_service
+from django.core.management import call_command
+from django.utils import timezone
+from .models import OutboundEmail
+from .services import utils, one_time_code, outbox, company as company_service
 from users.models import (
     Company,
     CompanySerializer,
@@ -17,6 +20,7 @@ from users.models import (
 from one_day_intern.exceptions import RestrictedAccessException, InvalidRequestException
 from users.services import utils as users_utils
 from one_day_intern import settings
+import datetime
 import uuid
 import json
 import http
@@ -204,7 +208,7 @@ class OneTimeCodeTest(TestCase):
         self.assertEqual(returned_message[3], expected_sender)
         self.assertEqual(returned_message[4], expected_receivers)
 
-    @patch.object(utils, 'send_mass_html_mail')
+    @patch.object(utils, 'queue_mass_html_mail')
     def test_email_one_time_code_when_assessor_emails_is_not_empty(self, mocked_send_html_mail):
         expected_message_1_receivers = [self.base_request_data.get('assessor_emails')[0]]
         expected_message_2_receivers = [self.base_request_data.get('assessor_emails')[1]]
@@ -219,7 +223,7 @@ class OneTimeCodeTest(TestCase):
         self.assertEqual(message_1_receivers, expected_message_1_receivers)
         self.assertEqual(message_2_receivers, expected_message_2_receivers)
 
-    @patch.object(utils, 'send_mass_html_mail')
+    @patch.object(utils, 'queue_mass_html_mail')
     def test_email_one_time_code_when_assessor_emails_is_empty(self, mocked_send_html_mail):
         request_data = self.base_request_data.copy()
         request_data['assessor_emails'] = []
@@ -229,7 +233,7 @@ class OneTimeCodeTest(TestCase):
         call_arguments = mocked_send_html_mail.call_args.args[0]
         self.assertEqual(len(call_arguments), 0)
 
-    @patch.object(utils, 'send_mass_html_mail')
+    @patch.object(utils, 'queue_mass_html_mail')
     def test_send_one_time_code_to_assessors(self, mocked_send_mass_html_mail):
         mocked_send_mass_html_mail.return_value = None
         try:
@@ -237,7 +241,7 @@ class OneTimeCodeTest(TestCase):
         except Exception as exception:
             self.fail(f'{exception} is raised')
 
-    @patch.object(utils, 'send_mass_html_mail')
+    @patch.object(utils, 'queue_mass_html_mail')
     def test_serve_send_one_time_code_to_assessors_when_valid_status_200(self, mocked_send_mass_html_mail):
         receiving_emails = self.base_request_data.get('assessor_emails')
         expected_message = 'Invitations has been sent'
@@ -254,7 +258,7 @@ class OneTimeCodeTest(TestCase):
         response_content = json.loads(response.content)
         self.assertEqual(response_content.get('message'), expected_message)
 
-    @patch.object(utils, 'send_mass_html_mail')
+    @patch.object(utils, 'queue_mass_html_mail')
     def test_serve_send_one_time_code_to_assessors_when_user_is_not_company(self, mocked_send_mass_html_mail):
         expected_message = 'User assessor@assessor.com is not a company'
         assessor_email_data = json.dumps(self.base_request_data)
@@ -266,7 +270,7 @@ class OneTimeCodeTest(TestCase):
             mocked_send_mass_html_mail=mocked_send_mass_html_mail
         )
 
-    @patch.object(utils, 'send_mass_html_mail')
+    @patch.object(utils, 'queue_mass_html_mail')
     def test_serve_send_one_time_code_to_assessors_when_assessor_emails_empty(self, mocked_send_mass_html_mail):
         expected_message = 'Request must contain at least 1 assessor emails'
         request_data = self.base_request_data.copy()
@@ -280,7 +284,7 @@ class OneTimeCodeTest(TestCase):
             mocked_send_mass_html_mail=mocked_send_mass_html_mail
         )
 
-    @patch.object(utils, 'send_mass_html_mail')
+    @patch.object(utils, 'queue_mass_html_mail')
     def test_serve_one_time_code_to_assessors_when_assessor_emails_not_a_list(self, mocked_send_mass_html_mail):
         expected_message = 'Request assessor_emails field must be a list'
         request_data = self.base_request_data.copy()
@@ -294,7 +298,7 @@ class OneTimeCodeTest(TestCase):
             mocked_send_mass_html_mail=mocked_send_mass_html_mail
         )
 
-    @patch.object(utils, 'send_mass_html_mail')
+    @patch.object(utils, 'queue_mass_html_mail')
     def test_serve_one_time_code_to_assessors_when_assessor_emails_are_invalid(self, mocked_send_mass_html_mail):
         expected_message = 'email@email is not a valid email'
         request_data = self.base_request_data.copy()
@@ -393,3 +397,82 @@ class CompanyAssessorsTest(TestCase):
         self.assertEqual(assessor_data.get('last_name'), self.assessor.last_name)
         self.assertEqual(assessor_data.get('phone_number'), self.assessor.phone_number)
 
+
+class OutboundEmailQueueTest(TestCase):
+    def setUp(self) -> None:
+        self.datatuple = [
+            (
+                'Subject 1',
+                'Hello, World! 1',
+                '<h1>Hello, World! 1</h1>',
+                'from_email1@gmail.com',
+                ['recipient1@gmail.com']
+            ),
+            (
+                'Subject 2',
+                'Hello, World! 2',
+                '<h1>Hello, World! 2</h1>',
+                'from_email2@gmail.com',
+                ['recipient2@gmail.com']
+            ),
+        ]
+
+    def test_queue_mass_html_mail_stores_messages_without_sending(self):
+        utils.queue_mass_html_mail(self.datatuple)
+        self.assertEqual(len(mail.outbox), 0)
+        queued_emails = OutboundEmail.objects.all()
+        self.assertEqual(len(queued_emails), 2)
+        self.assertEqual(queued_emails[0].recipients, ['recipient1@gmail.com'])
+        self.assertEqual(queued_emails[0].status, OutboundEmail.STATUS_PENDING)
+
+    def test_deliver_queued_emails_sends_due_messages_over_one_connection(self):
+        utils.queue_mass_html_mail(self.datatuple)
+
+        with patch.object(mail, 'get_connection', wraps=mail.get_connection) as mocked_get_connection:
+            sent_count = outbox.deliver_queued_emails()
+
+        mocked_get_connection.assert_called_once()
+        self.assertEqual(sent_count, 2)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].subject, 'Subject 1')
+        self.assertEqual(mail.outbox[0].to, ['recipient1@gmail.com'])
+        self.assertEqual(mail.outbox[0].alternatives, [('<h1>Hello, World! 1</h1>', 'text/html')])
+        self.assertFalse(OutboundEmail.objects.exclude(status=OutboundEmail.STATUS_SENT).exists())
+
+    def test_deliver_queued_emails_does_not_send_messages_that_are_not_due(self):
+        utils.queue_mass_html_mail(self.datatuple)
+        OutboundEmail.objects.update(next_attempt_at=timezone.now() + datetime.timedelta(minutes=1))
+        self.assertEqual(outbox.deliver_queued_emails(), 0)
+        self.assertEqual(len(mail.outbox), 0)
+
+    @patch.object(mail.EmailMultiAlternatives, 'send')
+    def test_deliver_queued_emails_retries_failed_messages_with_backoff(self, mocked_send):
+        mocked_send.side_effect = ConnectionError('SMTP server unavailable')
+        utils.queue_mass_html_mail(self.datatuple[:1])
+
+        sent_count = outbox.deliver_queued_emails()
+
+        self.assertEqual(sent_count, 0)
+        queued_email = OutboundEmail.objects.get()
+        self.assertEqual(queued_email.status, OutboundEmail.STATUS_PENDING)
+        self.assertEqual(queued_email.attempts, 1)
+        self.assertEqual(queued_email.last_error, 'SMTP server unavailable')
+        self.assertGreater(queued_email.next_attempt_at, timezone.now())
+
+    @patch.object(mail.EmailMultiAlternatives, 'send')
+    def test_deliver_queued_emails_marks_message_as_failed_after_max_attempts(self, mocked_send):
+        mocked_send.side_effect = ConnectionError('SMTP server unavailable')
+        utils.queue_mass_html_mail(self.datatuple[:1])
+        OutboundEmail.objects.update(attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS - 1)
+
+        outbox.deliver_queued_emails()
+
+        queued_email = OutboundEmail.objects.get()
+        self.assertEqual(queued_email.status, OutboundEmail.STATUS_FAILED)
+        self.assertEqual(queued_email.attempts, settings.EMAIL_OUTBOX_MAX_ATTEMPTS)
+
+    def test_send_queued_emails_command_delivers_the_outbox(self):
+        utils.queue_mass_html_mail(self.datatuple)
+        call_command('send_queued_emails', '--once', '--batch-size', '1')
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertFalse(OutboundEmail.objects.filter(status=OutboundEmail.STATUS_PENDING).exists())
@@ -2,15 +2,22 @@
 ASGI config for one_day_intern project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Assessment flow subscriptions are served as asynchronous event streams,
+every other request is handled by the Django application. Streaming responses
+are read in worker threads so that file downloads do not block the event loop.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 """
 
+import django
 import os
 
-from django.core.asgi import get_asgi_application
-
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'one_day_intern.settings')
 
-application = get_asgi_application()
+django.setup(set_prefix=False)
+
+from assessment.asgi import AssessmentFlowStreamApplication, ThreadedStreamingASGIHandler  # noqa: E402
+
+django_application = ThreadedStreamingASGIHandler()
+application = AssessmentFlowStreamApplication(django_application)
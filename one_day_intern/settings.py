@@ -59,9 +59,17 @@ INSTALLED_APPS = [
     'video_conference'
 ]
 
+# users.authentication.StatelessRoleJWTAuthentication serves requests from the role claims of the access token
+JWT_AUTHENTICATION_CLASS = os.getenv(
+    'JWT_AUTHENTICATION_CLASS',
+    default='users.authentication.RoleResolvingJWTAuthentication'
+)
+STATELESS_JWT_ACTIVE_USER_CACHE_TTL_IN_SECONDS = 30
+STATELESS_JWT_ACTIVE_USER_CACHE_MAX_SIZE = 10000
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        JWT_AUTHENTICATION_CLASS,
     ),
     'EXCEPTION_HANDLER': 'one_day_intern.exception_config.custom_exception_handler'
 }
@@ -184,6 +192,9 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 QUIZ_BASE_DURATION = 30
 SUBMISSION_BUFFER_TIME_IN_SECONDS = 10
+RELEASE_SCHEDULE_CACHE_TIMEOUT_IN_SECONDS = 24 * 60 * 60
+RELEASE_SCHEDULE_LOCAL_CACHE_MAX_SIZE = 1000
+BULK_GRADING_MAX_ENTRIES = 500
 
 # Settings for Google Auth Login and Registration
 AUTH_USER_MODEL = 'users.OdiUser'
@@ -209,7 +220,20 @@ EMAIL_PORT = 587
 EMAIL_USE_TLS = True
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL')
 SERVER_EMAIL = os.getenv('SERVER_EMAIL')
+EMAIL_OUTBOX_BATCH_SIZE = 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_BASE_DELAY_IN_SECONDS = 60
+EMAIL_OUTBOX_POLL_INTERVAL_IN_SECONDS = 5
 
 # Google Storage
 GOOGLE_BUCKET_BASE_DIRECTORY = '/submissions'
-GOOGLE_STORAGE_BUCKET_NAME = os.getenv('GOOGLE_STORAGE_BUCKET_NAME')
\ No newline at end of file
+GOOGLE_STORAGE_BUCKET_NAME = os.getenv('GOOGLE_STORAGE_BUCKET_NAME')
+FILE_STORAGE_BACKEND = os.getenv(
+    'FILE_STORAGE_BACKEND',
+    default='assessment.services.google_storage.GoogleCloudStorageBackend'
+)
+LOCAL_FILE_STORAGE_ROOT = os.getenv('LOCAL_FILE_STORAGE_ROOT', default=os.path.join(BASE_DIR, 'local-storage'))
+SIGNED_URL_EXPIRATION_IN_SECONDS = 15 * 60
+
+# Assessment flow subscriptions
+ASSESSMENT_RELEASE_BROKER_BACKEND = 'assessment.services.release_broker.LocalReleaseBrokerBackend'
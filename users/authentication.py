@@ -0,0 +1,158 @@
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from one_day_intern import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from .models import OdiUser, Company, Assessor, Assessee
+import time
+
+ROLE_CLAIM = 'role'
+EMAIL_CLAIM = 'email'
+COMPANY_ID_CLAIM = 'company_id'
+ASSOCIATED_COMPANY_CLAIM = 'associated_company'
+ASSOCIATED_COMPANY_NAME_CLAIM = 'associated_company_name'
+COMPANY_NAME_CLAIM = 'company_name'
+FIRST_NAME_CLAIM = 'first_name'
+LAST_NAME_CLAIM = 'last_name'
+ROLE_MODELS = {model._meta.model_name: model for model in (Company, Assessor, Assessee)}
+PROFILE_FIELD_CLAIMS = {
+    Company: (COMPANY_NAME_CLAIM,),
+    Assessor: (FIRST_NAME_CLAIM, LAST_NAME_CLAIM),
+    Assessee: (FIRST_NAME_CLAIM, LAST_NAME_CLAIM),
+}
+
+_active_user_cache = {}
+
+
+def add_role_claims_to_token(token, concrete_user):
+    """
+    Claims set on a refresh token are copied to the access tokens generated from it.
+    The profile fields read by the views are included, so a user built from the claims does not load them.
+    """
+    if concrete_user is None:
+        return
+
+    token[ROLE_CLAIM] = concrete_user._meta.model_name
+    token[EMAIL_CLAIM] = concrete_user.email
+    for profile_field_claim in PROFILE_FIELD_CLAIMS[type(concrete_user)]:
+        token[profile_field_claim] = getattr(concrete_user, profile_field_claim)
+
+    if isinstance(concrete_user, Company):
+        token[COMPANY_ID_CLAIM] = str(concrete_user.company_id)
+    elif isinstance(concrete_user, Assessor):
+        token[ASSOCIATED_COMPANY_CLAIM] = concrete_user.associated_company_id
+        token[ASSOCIATED_COMPANY_NAME_CLAIM] = concrete_user.associated_company.company_name
+
+
+def get_user_from_loaded_fields(model, loaded_fields: dict):
+    """
+    Builds a user whose other fields are deferred, so they are only queried when they are accessed
+    """
+    loaded_concrete_fields = [field for field in model._meta.concrete_fields if field.attname in loaded_fields]
+    return model.from_db(
+        router.db_for_read(model),
+        [field.attname for field in loaded_concrete_fields],
+        [field.to_python(loaded_fields[field.attname]) for field in loaded_concrete_fields]
+    )
+
+
+def get_user_from_role_claims(validated_token, user_id):
+    """
+    The ids, the email, the names of the user and the name of its company are read from the claims.
+    Tokens issued before the name claims were added leave the names deferred.
+    """
+    model = ROLE_MODELS[validated_token[ROLE_CLAIM]]
+    loaded_fields = {
+        'id': user_id,
+        'odiuser_ptr_id': user_id,
+        'email': validated_token[EMAIL_CLAIM],
+        'is_active': True
+    }
+    for profile_field_claim in PROFILE_FIELD_CLAIMS[model]:
+        if profile_field_claim in validated_token:
+            loaded_fields[profile_field_claim] = validated_token[profile_field_claim]
+
+    if model is Company:
+        loaded_fields['company_id'] = validated_token[COMPANY_ID_CLAIM]
+    elif model is Assessor:
+        loaded_fields['associated_company_id'] = validated_token[ASSOCIATED_COMPANY_CLAIM]
+
+    user = get_user_from_loaded_fields(model, loaded_fields)
+    if model is Assessor:
+        associated_company_fields = {
+            'id': user.associated_company_id,
+            'odiuser_ptr_id': user.associated_company_id
+        }
+        if ASSOCIATED_COMPANY_NAME_CLAIM in validated_token:
+            associated_company_fields['company_name'] = validated_token[ASSOCIATED_COMPANY_NAME_CLAIM]
+        user.associated_company = get_user_from_loaded_fields(Company, associated_company_fields)
+
+    return user
+
+
+def user_is_active(user_id) -> bool:
+    """
+    Deactivated or deleted users are rejected at most STATELESS_JWT_ACTIVE_USER_CACHE_TTL_IN_SECONDS after the change
+    """
+    now = time.monotonic()
+    cached_entry = _active_user_cache.get(user_id)
+    if cached_entry and cached_entry[0] > now:
+        return cached_entry[1]
+
+    if len(_active_user_cache) >= settings.STATELESS_JWT_ACTIVE_USER_CACHE_MAX_SIZE:
+        _active_user_cache.clear()
+
+    is_active = OdiUser.objects.filter(pk=user_id, is_active=True).exists()
+    _active_user_cache[user_id] = (now + settings.STATELESS_JWT_ACTIVE_USER_CACHE_TTL_IN_SECONDS, is_active)
+    return is_active
+
+
+def clear_active_user_cache():
+    _active_user_cache.clear()
+
+
+class RoleResolvingJWTAuthentication(JWTAuthentication):
+    """
+    Loads the user of the token together with its Company, Assessor or Assessee row in one query by primary key,
+    so request.user is the concrete user and the services do not resolve the role of the caller again.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        found_users = OdiUser.objects.with_concrete_user().filter(**{api_settings.USER_ID_FIELD: user_id})
+        if not found_users:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+
+        user = found_users[0]
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        return user.get_concrete_user() or user
+
+
+class StatelessRoleJWTAuthentication(RoleResolvingJWTAuthentication):
+    """
+    Builds the concrete user from the role claims of the access token instead of loading it.
+    Only the ids, the email, the first and last name or company name of the user and the name of the
+    associated company of an assessor are set. Every other field, such as the phone number, is loaded
+    with one query when it is accessed. Tokens issued without role claims are authenticated by loading the user.
+    """
+
+    def get_user(self, validated_token):
+        if ROLE_CLAIM not in validated_token or validated_token[ROLE_CLAIM] not in ROLE_MODELS:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        if not user_is_active(user_id):
+            raise AuthenticationFailed(_('User not found or inactive'), code='user_inactive')
+
+        return get_user_from_role_claims(validated_token, user_id)
@@ -20,3 +20,6 @@ class OdiUserManager(BaseUserManager):
         user.save()
 
         return user
+
+    def with_concrete_user(self):
+        return self.select_related('company', 'assessor__associated_company', 'assessee')
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.1 on 2026-10-17 00:11
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='company',
+            name='company_id',
+            field=models.UUIDField(auto_created=True, default=uuid.uuid4, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='companyonetimelinkcode',
+            name='code',
+            field=models.UUIDField(auto_created=True, default=uuid.uuid4, unique=True),
+        ),
+    ]
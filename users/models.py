@@ -6,6 +6,8 @@ from rest_framework import serializers
 from .managers import OdiUserManager
 import uuid
 
+CONCRETE_USER_RELATED_FIELDS = ('company', 'assessor', 'assessee')
+
 
 class OdiUser(AbstractUser):
     username = None
@@ -24,9 +26,24 @@ class OdiUser(AbstractUser):
     def __str__(self):
         return self.email
 
+    def get_concrete_user(self):
+        """
+        Returns the Company, Assessor or Assessee of the user, or None when the user has none of these roles.
+        Users loaded through OdiUser.objects.with_concrete_user() resolve it without querying again.
+        """
+        if isinstance(self, (Company, Assessor, Assessee)):
+            return self
+
+        for related_field in CONCRETE_USER_RELATED_FIELDS:
+            concrete_user = getattr(self, related_field, None)
+            if concrete_user:
+                return concrete_user
+
+        return None
+
 
 class Company(OdiUser):
-    company_id = models.UUIDField(default=uuid.uuid4, auto_created=True, null=False)
+    company_id = models.UUIDField(default=uuid.uuid4, auto_created=True, null=False, unique=True)
     company_name = models.CharField(max_length=50, null=False)
     description = models.TextField()
     address = models.TextField(null=False)
@@ -88,7 +105,7 @@ class AssesseeSerializer(serializers.ModelSerializer):
 
 class CompanyOneTimeLinkCode(models.Model):
     associated_company = models.ForeignKey('Company', on_delete=models.CASCADE)
-    code = models.UUIDField(default=uuid.uuid4, auto_created=True)
+    code = models.UUIDField(default=uuid.uuid4, auto_created=True, unique=True)
     is_active = models.BooleanField(default=True)
 
 
@@ -15,7 +15,6 @@ from one_day_intern.exceptions import (
     InvalidGoogleLoginException,
     InvalidRegistrationException
 )
-from rest_framework_simplejwt.tokens import RefreshToken
 from ..models import OdiUser, Assessor, Assessee, AuthenticationService, CompanyOneTimeLinkCode
 from . import utils
 import requests
@@ -171,8 +170,4 @@ def register_assessor_with_google_data(user_data, otc_data):
 
 
 def get_tokens_for_user(user):
-    refresh = RefreshToken.for_user(user)
-    return {
-        'refresh': str(refresh),
-        'access': str(refresh.access_token),
-    }
+    return utils.generate_token_for_user(user)
@@ -1,7 +1,7 @@
 from django.contrib.auth.models import User
+from . import utils
 from ..models import (
     Assessor,
-    Assessee,
     Company,
     AssessorSerializer,
     AssesseeSerializer,
@@ -10,11 +10,11 @@ from ..models import (
 
 
 def get_user_info(user: User):
-    if found_company := Company.objects.filter(email=user.email):
-        return CompanySerializer(found_company[0]).data
-    elif found_assessor := Assessor.objects.filter(email=user.email):
-        return AssessorSerializer(found_assessor[0]).data
+    concrete_user = utils.get_fully_loaded_user(utils.get_concrete_user(user))
+    if isinstance(concrete_user, Company):
+        return CompanySerializer(concrete_user).data
+    elif isinstance(concrete_user, Assessor):
+        return AssessorSerializer(concrete_user).data
     else:
-        found_assessee = Assessee.objects.filter(email=user.email)
-        return AssesseeSerializer(found_assessee[0]).data
+        return AssesseeSerializer(concrete_user).data
 
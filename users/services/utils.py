@@ -1,13 +1,13 @@
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import ObjectDoesNotExist
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken
 from rest_framework_simplejwt.tokens import RefreshToken
 from datetime import datetime
 from typing import Optional, Match
 
 
-from ..models import Assessor, Company, Assessee
+from ..authentication import RoleResolvingJWTAuthentication, add_role_claims_to_token
+from ..models import OdiUser, Assessor, Company, Assessee
 import phonenumbers
 import re
 
@@ -76,8 +76,35 @@ def parameterize_url(base_url, parameter_arguments):
     return parameterized_url
 
 
+def get_concrete_user(user):
+    """
+    Authenticated requests already carry the concrete user, so it is only resolved, by primary key, for plain users.
+    """
+    if isinstance(user, (Company, Assessor, Assessee)):
+        return user
+
+    if not user or user.pk is None:
+        return None
+
+    found_users = OdiUser.objects.with_concrete_user().filter(pk=user.pk)
+    if found_users:
+        return found_users[0].get_concrete_user()
+    else:
+        return None
+
+
+def get_fully_loaded_user(concrete_user):
+    """
+    Users authenticated from token claims only carry their ids, the rest of their fields is loaded in one query
+    """
+    deferred_fields = concrete_user.get_deferred_fields() if concrete_user else None
+    if deferred_fields:
+        concrete_user.refresh_from_db(fields=deferred_fields)
+    return concrete_user
+
+
 def get_user_from_request(request):
-    jwt_authenticator = JWTAuthentication()
+    jwt_authenticator = RoleResolvingJWTAuthentication()
     try:
         response = jwt_authenticator.authenticate(request)
         user, token = response
@@ -128,6 +155,7 @@ def get_assessor_or_company_from_email(email):
 
 def generate_token_for_user(user):
     token: RefreshToken = RefreshToken.for_user(user)
+    add_role_claims_to_token(token, get_concrete_user(user))
     return {
         'refresh': str(token),
         'access': str(token.access_token)
@@ -135,7 +163,8 @@ def generate_token_for_user(user):
 
 
 def get_assessor_from_user(user):
-    try:
-        return Assessor.objects.get(email=user.email)
-    except ObjectDoesNotExist:
+    concrete_user = get_concrete_user(user)
+    if isinstance(concrete_user, Assessor):
+        return concrete_user
+    else:
         raise ObjectDoesNotExist(f'Assessor with email {user.email} not found')
@@ -6,7 +6,7 @@ from django.urls import reverse
 from google.oauth2 import id_token
 from unittest.mock import patch
 from urllib.parse import urlsplit, parse_qs
-from .services import registration, utils, google_login
+from .services import registration, utils, google_login, user_info
 from one_day_intern.exceptions import (
     InvalidRegistrationException,
     InvalidRequestException,
@@ -16,7 +16,11 @@ from one_day_intern.exceptions import (
     InvalidGoogleAuthCodeException,
     InvalidLoginCredentialsException
 )
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from assessment.services import utils as assessment_utils
+from .authentication import StatelessRoleJWTAuthentication, clear_active_user_cache
 from .models import OdiUser, Assessee, Assessor, Company, AuthenticationService, CompanyOneTimeLinkCode
 from .services.registration import validate_user_assessor_registration_data, generate_one_time_code
 from .services.login import verify_password, get_assessor_or_company_from_request_data
@@ -1801,6 +1805,166 @@ class UserInfoViewTestCase(TestCase):
         self.assertEqual(response_content.get('phone_number'), self.assessee.phone_number)
         self.assertEqual(response_content.get('date_of_birth'), self.assessee.date_of_birth)
 
+    def test_serve_get_user_info_when_authenticated_through_token_resolves_role_once(self):
+        client = APIClient()
+        tokens = utils.generate_token_for_user(self.assessor)
+        client.credentials(HTTP_AUTHORIZATION='Bearer ' + tokens['access'])
+
+        with self.assertNumQueries(1):
+            response = client.get(GET_USER_INFO_URL)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_content = json.loads(response.content)
+        self.assertEqual(response_content.get('email'), self.assessor.email)
+        self.assertEqual(response_content.get('company_id'), str(self.company.company_id))
+
+    def test_get_concrete_user_when_user_is_odi_user(self):
+        odi_user = OdiUser.objects.get(pk=self.assessee.pk)
+        concrete_user = utils.get_concrete_user(odi_user)
+        self.assertIsInstance(concrete_user, Assessee)
+        self.assertEqual(concrete_user.email, self.assessee.email)
+
+    def test_get_concrete_user_when_user_is_already_concrete(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(utils.get_concrete_user(self.company), self.company)
+
+    def test_get_concrete_user_when_user_has_no_role(self):
+        odi_user = OdiUser.objects.create_user(email='odiuser1830@email.com', password='Password1830')
+        self.assertIsNone(utils.get_concrete_user(odi_user))
+
+
+class StatelessJWTAuthenticationTest(TestCase):
+    def setUp(self) -> None:
+        clear_active_user_cache()
+        self.company = Company.objects.create_user(
+            email='company1900@email.com',
+            password='Password1901',
+            company_name='Company 1902',
+            description='Description 1903',
+            address='Company 1904 address'
+        )
+
+        self.assessor = Assessor.objects.create_user(
+            email='assessor1907@email.com',
+            password='Password1908',
+            first_name='Assessor 1909',
+            last_name='Assessor 1910',
+            phone_number='+6281219111912',
+            employee_id='EMP1913',
+            associated_company=self.company,
+            authentication_service=AuthenticationService.DEFAULT.value
+        )
+
+        self.assessee = Assessee.objects.create_user(
+            email='assessee1917@email.com',
+            password='Password1918',
+            first_name='Assessee 1919',
+            last_name='Assessee 1920',
+            phone_number='+6281219211922',
+            date_of_birth='1994-09-30'
+        )
+        self.authentication = StatelessRoleJWTAuthentication()
+
+    def tearDown(self) -> None:
+        clear_active_user_cache()
+
+    def authenticate_with_token(self, access_token):
+        request = APIRequestFactory().get(GET_USER_INFO_URL, HTTP_AUTHORIZATION='Bearer ' + str(access_token))
+        user, _ = self.authentication.authenticate(request)
+        return user
+
+    def test_generate_token_for_user_adds_role_claims(self):
+        company_token = AccessToken(utils.generate_token_for_user(self.company)['access'])
+        self.assertEqual(company_token['role'], 'company')
+        self.assertEqual(company_token['email'], self.company.email)
+        self.assertEqual(company_token['company_id'], str(self.company.company_id))
+
+        assessor_token = AccessToken(google_login.get_tokens_for_user(self.assessor)['access'])
+        self.assertEqual(assessor_token['role'], 'assessor')
+        self.assertEqual(assessor_token['associated_company'], self.company.pk)
+
+        assessee_token = AccessToken(utils.generate_token_for_user(self.assessee)['access'])
+        self.assertEqual(assessee_token['role'], 'assessee')
+        self.assertEqual(assessee_token['email'], self.assessee.email)
+
+    def test_authenticate_builds_concrete_user_from_claims_without_user_query(self):
+        access_token = utils.generate_token_for_user(self.assessor)['access']
+        self.authenticate_with_token(access_token)
+
+        with self.assertNumQueries(0):
+            user = self.authenticate_with_token(access_token)
+            company = assessment_utils.get_company_or_assessor_associated_company_from_user(user)
+
+        self.assertIsInstance(user, Assessor)
+        self.assertEqual(user.pk, self.assessor.pk)
+        self.assertEqual(user.email, self.assessor.email)
+        self.assertEqual(company.pk, self.company.pk)
+        self.assertEqual(user.first_name, self.assessor.first_name)
+
+    def test_profile_fields_read_by_views_are_built_from_claims_without_query(self):
+        assessor_token = utils.generate_token_for_user(self.assessor)['access']
+        company_token = utils.generate_token_for_user(self.company)['access']
+        assessee_token = utils.generate_token_for_user(self.assessee)['access']
+        self.authenticate_with_token(assessor_token)
+        self.authenticate_with_token(company_token)
+        self.authenticate_with_token(assessee_token)
+
+        with self.assertNumQueries(0):
+            assessor = self.authenticate_with_token(assessor_token)
+            company = self.authenticate_with_token(company_token)
+            assessee = self.authenticate_with_token(assessee_token)
+            self.assertEqual(assessor.get_full_name(), 'Assessor 1909 Assessor 1910')
+            self.assertEqual(assessor.associated_company.company_name, self.company.company_name)
+            self.assertEqual(company.company_name, self.company.company_name)
+            self.assertEqual(assessee.get_full_name(), 'Assessee 1919 Assessee 1920')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(assessor.phone_number, self.assessor.phone_number)
+
+    def test_authenticate_when_token_has_no_name_claims(self):
+        refresh_token = RefreshToken.for_user(self.assessor)
+        refresh_token['role'] = 'assessor'
+        refresh_token['email'] = self.assessor.email
+        refresh_token['associated_company'] = self.company.pk
+        assessor = self.authenticate_with_token(refresh_token.access_token)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(assessor.first_name, self.assessor.first_name)
+        with self.assertNumQueries(1):
+            self.assertEqual(assessor.associated_company.company_name, self.company.company_name)
+
+    def test_authenticate_company_from_claims(self):
+        access_token = utils.generate_token_for_user(self.company)['access']
+        user = self.authenticate_with_token(access_token)
+        self.assertIsInstance(user, Company)
+        self.assertEqual(user.company_id, self.company.company_id)
+        self.assertEqual(user.company_name, self.company.company_name)
+
+    def test_authenticate_when_user_is_deactivated(self):
+        access_token = utils.generate_token_for_user(self.assessee)['access']
+        self.authenticate_with_token(access_token)
+        self.assessee.is_active = False
+        self.assessee.save()
+
+        self.assertIsInstance(self.authenticate_with_token(access_token), Assessee)
+        clear_active_user_cache()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate_with_token(access_token)
+
+    def test_authenticate_when_token_has_no_role_claims(self):
+        access_token = RefreshToken.for_user(self.assessee).access_token
+        user = self.authenticate_with_token(access_token)
+        self.assertIsInstance(user, Assessee)
+        self.assertEqual(user.pk, self.assessee.pk)
+
+    def test_get_user_info_when_user_is_built_from_claims(self):
+        access_token = utils.generate_token_for_user(self.assessor)['access']
+        user = self.authenticate_with_token(access_token)
+        assessor_info = user_info.get_user_info(user)
+        self.assertEqual(assessor_info.get('first_name'), self.assessor.first_name)
+        self.assertEqual(assessor_info.get('employee_id'), self.assessor.employee_id)
+        self.assertEqual(assessor_info.get('company_id'), self.company.company_id)
+
 
 class SeparateLoginTest(TestCase):
     def setUp(self) -> None: